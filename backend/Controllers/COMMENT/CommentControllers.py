@@ -1,14 +1,36 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, inspect
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
+import base64
 
 from Models.COMMENT.CommentModel import Comment
 from Models.PRODUCT.BaseProduct.BaseProductModel import Product
 from Models.USER.UserModel import User
 from Schemas.COMMENT.CommentSchemas import CommentCreate, CommentUpdate
+from Controllers.PRODUCT.ProductLeaderboard.ProductLeaderboardControllers import ProductLeaderboardControllers
+from Controllers.COMMENT.CommentModerationControllers import notify_new_comment
+from Utils.Enums.Enums import CommentModerationStatus
+
+
+#### The feed pages on id : ids grow in insert order like created_at , and unlike created_at ####
+#### (written by the database , e.g. 'YYYY-MM-DD HH:MM:SS' on SQLite) a bound id compares exactly ####
+def encode_comment_cursor(comment_id: int) -> str:
+    """ Opaque cursor of the last comment of a page """
+    return base64.urlsafe_b64encode(str(comment_id).encode()).decode()
+
+
+def decode_comment_cursor(cursor: str) -> int:
+    """ Comment id of a cursor , 400 when it was not produced by encode_comment_cursor """
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
 
 
 class CommentControllers:
@@ -56,6 +78,9 @@ class CommentControllers:
             await db.commit()
             await db.refresh(new_comment)
             
+            #### Scored later by the moderation worker , posting doesn't wait for it ####
+            notify_new_comment()
+            
             return {
                 "message": "Comment created successfully",
                 "comment": {
@@ -111,9 +136,17 @@ class CommentControllers:
             for key, value in update_dict.items():
                 setattr(comment, key, value)
             
+            #### Edited text goes through moderation again ####
+            content_changed = "content" in update_dict and inspect(comment).attrs.content.history.has_changes()
+            if content_changed:
+                comment.moderation_status = CommentModerationStatus.PENDING
+            
             await db.commit()
             await db.refresh(comment)
             
+            if content_changed:
+                notify_new_comment()
+            
             return {
                 "message": "Comment updated successfully",
                 "comment": comment.to_dict()
@@ -290,7 +323,7 @@ class CommentControllers:
     ) -> Dict[str, Any]:
         """Public : Get all active comments for a product with pagination """
         try:
-            #### Check if product exists or not ####
+            #### Check if product exists or not (its rating summary is loaded with it) ####
             product_stmt = select(Product).where(Product.id == product_id)
             product_result = await db.execute(product_stmt)
             product = product_result.scalar_one_or_none()
@@ -325,18 +358,15 @@ class CommentControllers:
             result = await db.execute(stmt)
             comments = result.scalars().all()
             
-            #### Calculate average rating of Comments ####
-            avg_rating = None
-            if comments:
-                ratings = [c.rating for c in comments if c.rating is not None]
-                if ratings:
-                    avg_rating = sum(ratings) / len(ratings)
+            #### Average over all active ratings , read from the maintained summary ####
+            rating = product.rating_to_dict()
             
             return {
                 "product_id": product_id,
                 "product_name": product.name,
                 "total_comments": total,
-                "average_rating": round(avg_rating, 2) if avg_rating else None,
+                "average_rating": rating["average"],
+                "rating": rating,
                 "skip": skip,
                 "limit": limit,
                 "comments": [
@@ -355,6 +385,92 @@ class CommentControllers:
                 detail=f"Failed to fetch product comments: {str(e)}"
             )
 
+    @staticmethod
+    async def get_product_comment_feed(
+        product_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        include_total: bool = False,
+        db: AsyncSession = None
+    ) -> Dict[str, Any]:
+        """
+        Public : Newest first comment feed of a product , keyset paginated on id.
+        One query per page over ix_comments_product_active_id , the count only runs when asked for.
+        """
+        try:
+            conditions = [
+                Comment.product_id == product_id,
+                Comment.is_active == True
+            ]
+            if cursor:
+                conditions.append(Comment.id < decode_comment_cursor(cursor))
+
+            #### one extra row tells whether there is a next page ####
+            stmt = select(
+                Comment.id,
+                Comment.user_id,
+                Comment.content,
+                Comment.rating,
+                Comment.created_at,
+                Comment.updated_at,
+                User.username
+            ).join(
+                User, User.id == Comment.user_id
+            ).where(
+                and_(*conditions)
+            ).order_by(Comment.id.desc()).limit(limit + 1)
+
+            rows = (await db.execute(stmt)).all()
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+
+            #### Only an empty first page needs to know whether the product exists ####
+            if not rows and not cursor:
+                product_exists = (await db.execute(select(Product.id).where(Product.id == product_id))).first()
+                if not product_exists:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="Product not found"
+                    )
+
+            response = {
+                "product_id": product_id,
+                "limit": limit,
+                "comments": [
+                    {
+                        "id": row.id,
+                        "user_id": row.user_id,
+                        "product_id": product_id,
+                        "content": row.content,
+                        "rating": row.rating,
+                        "created_at": row.created_at.isoformat() if row.created_at else None,
+                        "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+                        "username": row.username
+                    }
+                    for row in rows
+                ],
+                "has_more": has_more,
+                "next_cursor": encode_comment_cursor(rows[-1].id) if has_more else None
+            }
+
+            if include_total:
+                count_stmt = select(func.count(Comment.id)).where(
+                    and_(
+                        Comment.product_id == product_id,
+                        Comment.is_active == True
+                    )
+                )
+                response["total"] = (await db.execute(count_stmt)).scalar()
+
+            return response
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to fetch product comments: {str(e)}"
+            )
+
     #### ============================================ ####
     #### ADMIN FUNCTIONS ####
     #### ============================================ ####
@@ -512,28 +628,10 @@ class CommentControllers:
             avg_rating_result = await db.execute(avg_rating_stmt)
             avg_rating = avg_rating_result.scalar()
             
-            #### Most commented products (10) ####
-            most_commented_stmt = select(
-                Comment.product_id,
-                func.count(Comment.id).label('count')
-            ).where(Comment.is_active == True).group_by(Comment.product_id).order_by(func.count(Comment.id).desc()).limit(10)
-            
-            most_commented_result = await db.execute(most_commented_stmt)
-            most_commented_raw = most_commented_result.all()
-            
-            #### Get product details ####
-            most_commented = []
-            for product_id, count in most_commented_raw:
-                product_stmt = select(Product).where(Product.id == product_id)
-                product_result = await db.execute(product_stmt)
-                product = product_result.scalar_one_or_none()
-                
-                if product:
-                    most_commented.append({
-                        "product_id": product_id,
-                        "product_name": product.name,
-                        "comment_count": count
-                    })
+            #### Most commented products (10) , one grouped query joined to products ####
+            most_commented = await ProductLeaderboardControllers.get_leaderboard_entries(
+                "most_commented", "all", 10, False, db
+            )
             
             return {
                 "total_comments": total_comments,
@@ -0,0 +1,259 @@
+import os
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+from fastapi import HTTPException, status
+from typing import Dict, Any, List, Optional
+from datetime import datetime, timezone
+from dotenv import load_dotenv
+
+from Database.Database import AsyncSessionLocal
+from Models.COMMENT.CommentModel import Comment
+from Models.USER.UserModel import User
+from Models.PRODUCT.BaseProduct.BaseProductModel import Product
+from Utils.Moderation.CommentScorer import score_batch
+from Utils.Enums.Enums import CommentModerationStatus
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+#### Moderation worker configuration (COMMENT_MODERATION_PROCESSES=0 scores in a thread instead) ####
+COMMENT_MODERATION_ENABLED = os.getenv("COMMENT_MODERATION_ENABLED", "true").lower() == "true"
+COMMENT_MODERATION_PROCESSES = int(os.getenv("COMMENT_MODERATION_PROCESSES", 1))
+COMMENT_MODERATION_BATCH_SIZE = int(os.getenv("COMMENT_MODERATION_BATCH_SIZE", 200))
+COMMENT_MODERATION_POLL_SECONDS = float(os.getenv("COMMENT_MODERATION_POLL_SECONDS", 5))
+#### score >= hide threshold : hidden right away , score >= flag threshold : stays visible but queued for staff ####
+COMMENT_MODERATION_HIDE_THRESHOLD = float(os.getenv("COMMENT_MODERATION_HIDE_THRESHOLD", 0.8))
+COMMENT_MODERATION_FLAG_THRESHOLD = float(os.getenv("COMMENT_MODERATION_FLAG_THRESHOLD", 0.5))
+
+#### Queue statuses staff can filter by ####
+MODERATION_QUEUE_STATUSES = {
+    "flagged": CommentModerationStatus.FLAGGED,
+    "hidden": CommentModerationStatus.HIDDEN,
+    "pending": CommentModerationStatus.PENDING,
+}
+
+#### wakes the worker right after a comment is posted instead of waiting for the next poll ####
+_new_comments = asyncio.Event()
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def notify_new_comment() -> None:
+    """ Called after a comment is written , scoring happens later in the worker """
+    _new_comments.set()
+
+
+class CommentModerationControllers:
+
+    #### ============================================ ####
+    #### PROCESSING (background worker) ####
+    #### ============================================ ####
+
+    @staticmethod
+    async def _score(batch: List[tuple]) -> List[tuple]:
+        """ Score off the event loop , in the process pool when one is configured """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_process_pool, score_batch, batch)
+
+    @staticmethod
+    async def process_batch(db: AsyncSession) -> int:
+        """
+        Score up to COMMENT_MODERATION_BATCH_SIZE pending comments and apply the decisions
+        in one transaction. Returns the number of scored comments.
+        """
+        stmt = select(Comment.id, Comment.content).where(
+            Comment.moderation_status == CommentModerationStatus.PENDING
+        ).order_by(Comment.id).limit(COMMENT_MODERATION_BATCH_SIZE)
+        pending = (await db.execute(stmt)).all()
+        if not pending:
+            return 0
+
+        #### the transaction is not held while scoring ####
+        await db.commit()
+        scores = await CommentModerationControllers._score([(row.id, row.content) for row in pending])
+        scored_content = {row.id: row.content for row in pending}
+
+        #### ORM updates , so hiding a comment also updates the product rating summary ####
+        comments = (await db.execute(
+            select(Comment).where(Comment.id.in_(scored_content))
+        )).scalars().all()
+        by_id = {comment.id: comment for comment in comments}
+
+        now = _utcnow()
+        for comment_id, score, reasons in scores:
+            comment = by_id.get(comment_id)
+            #### deleted , already decided or edited while it was being scored ####
+            if (
+                comment is None
+                or comment.moderation_status != CommentModerationStatus.PENDING
+                or comment.content != scored_content[comment_id]
+            ):
+                continue
+
+            comment.moderation_score = score
+            comment.moderation_reasons = reasons
+            comment.moderated_at = now
+            if score >= COMMENT_MODERATION_HIDE_THRESHOLD:
+                comment.moderation_status = CommentModerationStatus.HIDDEN
+                if comment.is_active:
+                    comment.is_active = False
+                    comment.deleted_at = now
+            elif score >= COMMENT_MODERATION_FLAG_THRESHOLD:
+                comment.moderation_status = CommentModerationStatus.FLAGGED
+            else:
+                comment.moderation_status = CommentModerationStatus.APPROVED
+
+        await db.commit()
+        return len(pending)
+
+    @staticmethod
+    async def run_worker() -> None:
+        """ Worker loop , drains pending comments then waits for new ones or the poll interval """
+        while True:
+            try:
+                async with AsyncSessionLocal() as session:
+                    scored = await CommentModerationControllers.process_batch(session)
+                if scored:
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Comment moderation worker failed: {str(e)}")
+
+            try:
+                await asyncio.wait_for(_new_comments.wait(), timeout=COMMENT_MODERATION_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            _new_comments.clear()
+
+    @staticmethod
+    def start_worker() -> Optional[asyncio.Task]:
+        """ Start the process pool and the worker task , called from the app lifespan """
+        global _process_pool
+        if not COMMENT_MODERATION_ENABLED:
+            return None
+        if COMMENT_MODERATION_PROCESSES > 0:
+            _process_pool = ProcessPoolExecutor(max_workers=COMMENT_MODERATION_PROCESSES)
+        return asyncio.create_task(CommentModerationControllers.run_worker())
+
+    @staticmethod
+    def stop_worker(task: Optional[asyncio.Task]) -> None:
+        """ Cancel the worker and shut the process pool down , called on shutdown """
+        global _process_pool
+        if task:
+            task.cancel()
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+
+    #### ============================================ ####
+    #### STAFF / ADMIN FUNCTIONS ####
+    #### ============================================ ####
+
+    @staticmethod
+    async def get_moderation_queue(
+        queue_status: str = "flagged",
+        skip: int = 0,
+        limit: int = 50,
+        db: AsyncSession = None
+    ) -> Dict[str, Any]:
+        """ Staff : Comments waiting for a decision , highest score first """
+        try:
+            moderation_status = MODERATION_QUEUE_STATUSES.get(queue_status)
+            if moderation_status is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"status must be one of: {', '.join(MODERATION_QUEUE_STATUSES)}"
+                )
+
+            count_stmt = select(func.count(Comment.id)).where(Comment.moderation_status == moderation_status)
+            total = (await db.execute(count_stmt)).scalar()
+
+            stmt = select(
+                Comment,
+                User.username,
+                Product.name
+            ).join(
+                User, User.id == Comment.user_id
+            ).join(
+                Product, Product.id == Comment.product_id
+            ).where(
+                Comment.moderation_status == moderation_status
+            ).order_by(
+                Comment.moderation_score.desc(), Comment.id.desc()
+            ).offset(skip).limit(limit)
+            rows = (await db.execute(stmt)).all()
+
+            return {
+                "status": queue_status,
+                "total": total,
+                "skip": skip,
+                "limit": limit,
+                "comments": [
+                    {
+                        **comment.to_dict(),
+                        "moderation_score": comment.moderation_score,
+                        "moderation_reasons": comment.moderation_reasons or [],
+                        "moderated_at": comment.moderated_at.isoformat() if comment.moderated_at else None,
+                        "username": username,
+                        "product_name": product_name
+                    }
+                    for comment, username, product_name in rows
+                ]
+            }
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to fetch moderation queue: {str(e)}"
+            )
+
+    @staticmethod
+    async def review_comment(comment_id: int, approve: bool, db: AsyncSession) -> Dict[str, Any]:
+        """ Staff : Approve (show again) or hide a comment from the queue """
+        try:
+            comment = (await db.execute(select(Comment).where(Comment.id == comment_id))).scalar_one_or_none()
+
+            if not comment:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Comment not found"
+                )
+
+            now = _utcnow()
+            if approve:
+                #### only comments hidden by moderation come back , user deletions stay deleted ####
+                if comment.moderation_status == CommentModerationStatus.HIDDEN:
+                    comment.is_active = True
+                    comment.deleted_at = None
+                comment.moderation_status = CommentModerationStatus.APPROVED
+            else:
+                comment.moderation_status = CommentModerationStatus.HIDDEN
+                if comment.is_active:
+                    comment.is_active = False
+                    comment.deleted_at = now
+            comment.moderated_at = now
+
+            await db.commit()
+            await db.refresh(comment)
+
+            return {
+                "message": "Comment approved" if approve else "Comment hidden",
+                "comment": comment.to_dict()
+            }
+        except HTTPException:
+            raise
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to review comment: {str(e)}"
+            )
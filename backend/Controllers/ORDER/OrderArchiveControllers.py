@@ -0,0 +1,327 @@
+import os
+import asyncio
+import logging
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, and_, delete, insert, union_all, literal, literal_column, text
+from sqlalchemy.orm import selectinload
+from fastapi import HTTPException, status
+from typing import Dict, Any, Optional, List, Tuple, Callable
+from datetime import datetime, timezone, timedelta
+from dotenv import load_dotenv
+
+from Database.Database import AsyncSessionLocal
+from Models.ORDER.OrderModel import Order
+from Models.ORDER.OrderItemModel import OrderItem
+from Models.ORDER.ArchivedOrderModel import ArchivedOrder, payment_orders_archive
+from Models.ORDER.ArchivedOrderItemModel import ArchivedOrderItem
+from Models.PAYMENT.PaymentModel import payment_orders
+from Utils.Enums.Enums import OrderStatus
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+#### Archive job configuration ####
+ORDER_ARCHIVE_AFTER_DAYS = int(os.getenv("ORDER_ARCHIVE_AFTER_DAYS", 180))
+ORDER_ARCHIVE_BATCH_SIZE = int(os.getenv("ORDER_ARCHIVE_BATCH_SIZE", 500))
+ORDER_ARCHIVE_INTERVAL_MINUTES = int(os.getenv("ORDER_ARCHIVE_INTERVAL_MINUTES", 60))
+
+#### Only finished orders ever leave the hot table ####
+ARCHIVABLE_STATUSES = (OrderStatus.COMPLETED, OrderStatus.CANCELLED)
+
+ORDER_COLUMNS = [
+    "id", "user_id", "status", "total_amount", "delivery_address",
+    "special_instructions", "created_at", "updated_at", "completed_at",
+]
+ORDER_ITEM_COLUMNS = ["id", "order_id", "product_id", "quantity", "unit_price", "subtotal", "created_at"]
+
+#### (order model, order item model) pairs that a read path has to look at ####
+OrderSource = Tuple[type, type]
+HOT_SOURCE: OrderSource = (Order, OrderItem)
+COLD_SOURCE: OrderSource = (ArchivedOrder, ArchivedOrderItem)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """ Stored timestamps are naive UTC, convert aware datetimes before comparing """
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class OrderArchiveControllers:
+
+    #### ============================================ ####
+    #### ARCHIVE JOB ####
+    #### ============================================ ####
+
+    @staticmethod
+    async def _order_ids_to_keep(db: AsyncSession) -> List[int]:
+        """
+        Orders that must stay in the hot tables so archived ids are never handed out again.
+        SQLite tables created before sqlite_autoincrement was set (create_all does not alter existing
+        tables) give new rows max(id) + 1 , archiving the newest order / item would let a new row reuse
+        an archived id. Keeping those rows keeps max(id) above every archived id.
+        """
+        if db.bind.dialect.name != "sqlite":
+            return []
+
+        rows = (await db.execute(text(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'table' AND name IN ('orders', 'order_items')"
+        ))).all()
+        reusing = {name for name, sql in rows if "AUTOINCREMENT" not in (sql or "").upper()}
+
+        keep = []
+        if "orders" in reusing:
+            keep.append((await db.execute(select(func.max(Order.id)))).scalar())
+        if "order_items" in reusing:
+            keep.append((await db.execute(select(OrderItem.order_id).order_by(OrderItem.id.desc()).limit(1))).scalar())
+        return [order_id for order_id in keep if order_id is not None]
+
+    @staticmethod
+    async def archive_orders(
+        db: AsyncSession,
+        older_than_days: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Move completed / cancelled orders older than the configured age into the archive tables.
+        Works in batches, each batch is its own transaction so the hot tables are never locked for long.
+        """
+        older_than_days = ORDER_ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+        batch_size = batch_size or ORDER_ARCHIVE_BATCH_SIZE
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=older_than_days)
+
+        archived_orders = 0
+        batches = 0
+        try:
+            keep_ids = await OrderArchiveControllers._order_ids_to_keep(db)
+            while True:
+                ids_stmt = select(Order.id).where(
+                    and_(
+                        Order.status.in_(ARCHIVABLE_STATUSES),
+                        Order.created_at < cutoff,
+                        Order.id.not_in(keep_ids)
+                    )
+                ).order_by(Order.id).limit(batch_size)
+                order_ids = (await db.execute(ids_stmt)).scalars().all()
+
+                if not order_ids:
+                    break
+
+                #### Copy the batch into the archive tables ####
+                await db.execute(
+                    insert(ArchivedOrder).from_select(
+                        ORDER_COLUMNS,
+                        select(*[getattr(Order, column) for column in ORDER_COLUMNS]).where(Order.id.in_(order_ids))
+                    )
+                )
+                await db.execute(
+                    insert(ArchivedOrderItem).from_select(
+                        ORDER_ITEM_COLUMNS,
+                        select(*[getattr(OrderItem, column) for column in ORDER_ITEM_COLUMNS]).where(OrderItem.order_id.in_(order_ids))
+                    )
+                )
+                await db.execute(
+                    insert(payment_orders_archive).from_select(
+                        ["payment_id", "order_id"],
+                        select(payment_orders.c.payment_id, payment_orders.c.order_id).where(payment_orders.c.order_id.in_(order_ids))
+                    )
+                )
+
+                #### Remove the batch from the hot tables ####
+                await db.execute(delete(payment_orders).where(payment_orders.c.order_id.in_(order_ids)))
+                await db.execute(delete(OrderItem).where(OrderItem.order_id.in_(order_ids)))
+                await db.execute(delete(Order).where(Order.id.in_(order_ids)))
+
+                await db.commit()
+
+                archived_orders += len(order_ids)
+                batches += 1
+
+                if len(order_ids) < batch_size:
+                    break
+
+            logger.info(f"Order archive job moved {archived_orders} orders in {batches} batches")
+
+            return {
+                "message": "Order archive completed",
+                "archived_orders": archived_orders,
+                "batches": batches,
+                "cutoff": cutoff.isoformat(),
+            }
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to archive orders: {str(e)}"
+            )
+
+    @staticmethod
+    async def run_archive_job_forever() -> None:
+        """ Background loop started from the app lifespan when ARCHIVE_ORDERS=true """
+        while True:
+            try:
+                async with AsyncSessionLocal() as session:
+                    await OrderArchiveControllers.archive_orders(session)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Order archive job failed: {str(e)}")
+            await asyncio.sleep(ORDER_ARCHIVE_INTERVAL_MINUTES * 60)
+
+    #### ============================================ ####
+    #### READ PATH HELPERS ####
+    #### ============================================ ####
+
+    @staticmethod
+    async def get_order_sources(
+        db: AsyncSession,
+        status_filter: Optional[OrderStatus] = None,
+        start_date: Optional[datetime] = None
+    ) -> List[OrderSource]:
+        """
+        Decide which tables a read has to touch.
+        The archive is only added when it can hold matching rows :
+        it is not empty, the status can be archived and the date range reaches back far enough.
+        """
+        if status_filter is not None and status_filter not in ARCHIVABLE_STATUSES:
+            return [HOT_SOURCE]
+
+        #### newest archived order, a single index seek on ix_orders_archive_created ####
+        watermark = (await db.execute(select(func.max(ArchivedOrder.created_at)))).scalar()
+        if watermark is None:
+            return [HOT_SOURCE]
+
+        if start_date is not None and _naive_utc(start_date) > watermark:
+            return [HOT_SOURCE]
+
+        return [HOT_SOURCE, COLD_SOURCE]
+
+    @staticmethod
+    async def count_orders(
+        db: AsyncSession,
+        sources: List[OrderSource],
+        conditions_for: Callable[[type], list]
+    ) -> int:
+        """ Count orders matching the conditions over all sources """
+        total = 0
+        for order_model, _ in sources:
+            stmt = select(func.count(order_model.id))
+            conditions = conditions_for(order_model)
+            if conditions:
+                stmt = stmt.where(and_(*conditions))
+            total += (await db.execute(stmt)).scalar() or 0
+        return total
+
+    @staticmethod
+    async def _pick_page(
+        db: AsyncSession,
+        sources: List[OrderSource],
+        conditions_for: Callable[[type], list],
+        skip: int,
+        limit: int
+    ) -> list:
+        """ (id , created_at , source index) rows of one page over all sources , one UNION ALL """
+        parts = []
+        for index, (order_model, _) in enumerate(sources):
+            part = select(
+                order_model.id.label("id"),
+                order_model.created_at.label("created_at"),
+                literal(index).label("source"),
+            )
+            conditions = conditions_for(order_model)
+            if conditions:
+                part = part.where(and_(*conditions))
+            parts.append(part)
+
+        page_stmt = union_all(*parts).order_by(
+            literal_column("created_at").desc(), literal_column("id").desc()
+        ).offset(skip).limit(limit)
+        return (await db.execute(page_stmt)).all()
+
+    @staticmethod
+    async def get_order_ids_page(
+        db: AsyncSession,
+        sources: List[OrderSource],
+        conditions_for: Callable[[type], list],
+        skip: int,
+        limit: int
+    ) -> List[int]:
+        """ Ids of one page of orders (newest first) over all sources , no rows are loaded """
+        page = await OrderArchiveControllers._pick_page(db, sources, conditions_for, skip, limit)
+        return [row.id for row in page]
+
+    @staticmethod
+    async def get_orders_page(
+        db: AsyncSession,
+        sources: List[OrderSource],
+        conditions_for: Callable[[type], list],
+        skip: int,
+        limit: int,
+        load_user: bool = False
+    ) -> list:
+        """
+        Page through orders (newest first) over all sources.
+        With only the hot table this is a plain select, otherwise the page of ids is picked
+        with one UNION ALL and the rows are loaded from each table by primary key.
+        """
+        def load_options(order_model, item_model):
+            options = [selectinload(order_model.order_items).selectinload(item_model.product)]
+            if load_user:
+                options.append(selectinload(order_model.user))
+            return options
+
+        if len(sources) == 1:
+            order_model, item_model = sources[0]
+            stmt = select(order_model).options(*load_options(order_model, item_model))
+            conditions = conditions_for(order_model)
+            if conditions:
+                stmt = stmt.where(and_(*conditions))
+            stmt = stmt.order_by(order_model.created_at.desc()).offset(skip).limit(limit)
+            return list((await db.execute(stmt)).scalars().all())
+
+        page = await OrderArchiveControllers._pick_page(db, sources, conditions_for, skip, limit)
+
+        #### Load the rows from each table ####
+        loaded = {}
+        for index, (order_model, item_model) in enumerate(sources):
+            ids = [row.id for row in page if row.source == index]
+            if not ids:
+                continue
+            stmt = select(order_model).options(*load_options(order_model, item_model)).where(order_model.id.in_(ids))
+            for order in (await db.execute(stmt)).scalars().all():
+                loaded[(index, order.id)] = order
+
+        return [loaded[(row.source, row.id)] for row in page if (row.source, row.id) in loaded]
+
+    @staticmethod
+    async def get_payment_order_ids(db: AsyncSession, payment_ids: List[int]) -> Dict[int, List[int]]:
+        """ Order ids of each payment , links of hot orders UNION ALL links of archived ones """
+        order_ids: Dict[int, List[int]] = {payment_id: [] for payment_id in payment_ids}
+        if not payment_ids:
+            return order_ids
+
+        links_stmt = union_all(
+            select(payment_orders.c.payment_id, payment_orders.c.order_id).where(
+                payment_orders.c.payment_id.in_(payment_ids)
+            ),
+            select(payment_orders_archive.c.payment_id, payment_orders_archive.c.order_id).where(
+                payment_orders_archive.c.payment_id.in_(payment_ids)
+            )
+        ).order_by(literal_column("order_id"))
+        for payment_id, order_id in (await db.execute(links_stmt)).all():
+            order_ids[payment_id].append(order_id)
+        return order_ids
+
+    @staticmethod
+    async def get_order_by_id(db: AsyncSession, order_id: int, load_user: bool = False):
+        """ Look an order up in the hot table first, fall back to the archive """
+        for order_model, item_model in (HOT_SOURCE, COLD_SOURCE):
+            options = [selectinload(order_model.order_items).selectinload(item_model.product)]
+            if load_user:
+                options.append(selectinload(order_model.user))
+            stmt = select(order_model).options(*options).where(order_model.id == order_id)
+            order = (await db.execute(stmt)).scalar_one_or_none()
+            if order:
+                return order
+        return None
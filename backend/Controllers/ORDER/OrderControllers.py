@@ -10,10 +10,11 @@ from Models.ORDER.OrderModel import Order
 from Models.ORDER.OrderItemModel import OrderItem
 from Models.CART.CartModel import Cart
 from Models.CART.CartItemModel import CartItem
-from Models.PRODUCT.BaseProduct.BaseProductModel import Product
 from Models.USER.UserModel import User
 from Schemas.ORDER.OrderSchemas import OrderCreate, OrderUpdate
 from Utils.Enums.Enums import OrderStatus
+from Controllers.ORDER.OrderArchiveControllers import OrderArchiveControllers
+from Controllers.PRODUCT.ProductSales.ProductSalesControllers import ProductSalesControllers
 
 
 class OrderControllers:
@@ -32,23 +33,20 @@ class OrderControllers:
     ) -> Dict[str, Any]:
         """User : Get all his/her own orders """
         try:
-            conditions = [Order.user_id == current_user.id]
+            def conditions_for(model):
+                conditions = [model.user_id == current_user.id]
+                if status_filter:
+                    conditions.append(model.status == status_filter)
+                return conditions
             
-            if status_filter:
-                conditions.append(Order.status == status_filter)
+            #### Hot table only, unless archived orders can match ####
+            sources = await OrderArchiveControllers.get_order_sources(db, status_filter)
             
             #### Get total count ####
-            count_stmt = select(func.count(Order.id)).where(and_(*conditions))
-            count_result = await db.execute(count_stmt)
-            total = count_result.scalar()
+            total = await OrderArchiveControllers.count_orders(db, sources, conditions_for)
             
             #### Get orders ####
-            stmt = select(Order).options(
-                selectinload(Order.order_items).selectinload(OrderItem.product)
-            ).where(and_(*conditions)).offset(skip).limit(limit).order_by(Order.created_at.desc())
-            
-            result = await db.execute(stmt)
-            orders = result.scalars().all()
+            orders = await OrderArchiveControllers.get_orders_page(db, sources, conditions_for, skip, limit)
             
             return {
                 "total": total,
@@ -76,12 +74,7 @@ class OrderControllers:
     ) -> Dict[str, Any]:
         """User : Get single order by ID (must be his/her own) """
         try:
-            stmt = select(Order).options(
-                selectinload(Order.order_items).selectinload(OrderItem.product)
-            ).where(Order.id == order_id)
-            
-            result = await db.execute(stmt)
-            order = result.scalar_one_or_none()
+            order = await OrderArchiveControllers.get_order_by_id(db, order_id)
             
             if not order:
                 raise HTTPException(
@@ -321,28 +314,22 @@ class OrderControllers:
     ) -> Dict[str, Any]:
         """Admin : Get all orders with pagination """
         try:
-            conditions = []
-            if status_filter:
-                conditions.append(Order.status == status_filter)
+            def conditions_for(model):
+                conditions = []
+                if status_filter:
+                    conditions.append(model.status == status_filter)
+                return conditions
+            
+            #### Hot table only, unless archived orders can match ####
+            sources = await OrderArchiveControllers.get_order_sources(db, status_filter)
             
             #### Get total count ####
-            count_stmt = select(func.count(Order.id))
-            if conditions:
-                count_stmt = count_stmt.where(and_(*conditions))
-            count_result = await db.execute(count_stmt)
-            total = count_result.scalar()
+            total = await OrderArchiveControllers.count_orders(db, sources, conditions_for)
             
             #### Get orders ####
-            stmt = select(Order).options(
-                selectinload(Order.order_items).selectinload(OrderItem.product),
-                selectinload(Order.user)
-            ).offset(skip).limit(limit).order_by(Order.created_at.desc())
-            
-            if conditions:
-                stmt = stmt.where(and_(*conditions))
-            
-            result = await db.execute(stmt)
-            orders = result.scalars().all()
+            orders = await OrderArchiveControllers.get_orders_page(
+                db, sources, conditions_for, skip, limit, load_user=True
+            )
             
             return {
                 "total": total,
@@ -367,13 +354,7 @@ class OrderControllers:
     async def admin_get_order_by_id(order_id: int, db: AsyncSession) -> Dict[str, Any]:
         """Admin : Get any order by ID """
         try:
-            stmt = select(Order).options(
-                selectinload(Order.order_items).selectinload(OrderItem.product),
-                selectinload(Order.user)
-            ).where(Order.id == order_id)
-            
-            result = await db.execute(stmt)
-            order = result.scalar_one_or_none()
+            order = await OrderArchiveControllers.get_order_by_id(db, order_id, load_user=True)
             
             if not order:
                 raise HTTPException(
@@ -425,18 +406,16 @@ class OrderControllers:
                     detail="User not found"
                 )
             
+            def conditions_for(model):
+                return [model.user_id == user_id]
+            
+            sources = await OrderArchiveControllers.get_order_sources(db)
+            
             #### Get total count ####
-            count_stmt = select(func.count(Order.id)).where(Order.user_id == user_id)
-            count_result = await db.execute(count_stmt)
-            total = count_result.scalar()
+            total = await OrderArchiveControllers.count_orders(db, sources, conditions_for)
             
             #### Get orders ####
-            stmt = select(Order).options(
-                selectinload(Order.order_items).selectinload(OrderItem.product)
-            ).where(Order.user_id == user_id).offset(skip).limit(limit).order_by(Order.created_at.desc())
-            
-            result = await db.execute(stmt)
-            orders = result.scalars().all()
+            orders = await OrderArchiveControllers.get_orders_page(db, sources, conditions_for, skip, limit)
             
             return {
                 "user_id": user_id,
@@ -472,6 +451,8 @@ class OrderControllers:
                     detail="Order not found"
                 )
             
+            old_status = order.status
+            
             #### Update fields ####
             update_dict = update_data.model_dump(exclude_unset=True)
             for key, value in update_dict.items():
@@ -481,6 +462,9 @@ class OrderControllers:
             if update_data.status == OrderStatus.COMPLETED and not order.completed_at:
                 order.completed_at = datetime.now(timezone.utc)
             
+            #### Keep product sales counters in the same transaction ####
+            await ProductSalesControllers.apply_order_status_change(order.id, old_status, order.status, db)
+            
             await db.commit()
             await db.refresh(order)
             
@@ -534,45 +518,45 @@ class OrderControllers:
     async def admin_get_order_statistics(db: AsyncSession) -> Dict[str, Any]:
         """Admin : Get comprehensive order statistics """
         try:
-            #### Total orders ####
-            total_stmt = select(func.count(Order.id))
-            total_result = await db.execute(total_stmt)
-            total_orders = total_result.scalar()
-            
-            #### Orders by status ####
-            pending_stmt = select(func.count(Order.id)).where(Order.status == OrderStatus.PENDING)
-            pending_result = await db.execute(pending_stmt)
-            pending = pending_result.scalar()
-            
-            completed_stmt = select(func.count(Order.id)).where(Order.status == OrderStatus.COMPLETED)
-            completed_result = await db.execute(completed_stmt)
-            completed = completed_result.scalar()
-            
-            cancelled_stmt = select(func.count(Order.id)).where(Order.status == OrderStatus.CANCELLED)
-            cancelled_result = await db.execute(cancelled_stmt)
-            cancelled = cancelled_result.scalar()
-            
-            #### Total revenue (completed orders only) ####
-            revenue_stmt = select(func.sum(Order.total_amount)).where(Order.status == OrderStatus.COMPLETED)
-            revenue_result = await db.execute(revenue_stmt)
-            total_revenue = revenue_result.scalar() or Decimal('0.00')
+            sources = await OrderArchiveControllers.get_order_sources(db)
+            
+            #### Orders by status and revenue, one grouped query per table ####
+            by_status = {order_status: 0 for order_status in OrderStatus}
+            total_revenue = Decimal('0.00')
+            for order_model, _ in sources:
+                grouped_stmt = select(
+                    order_model.status,
+                    func.count(order_model.id),
+                    func.sum(order_model.total_amount)
+                ).group_by(order_model.status)
+                grouped_result = await db.execute(grouped_stmt)
+                for order_status, count, amount in grouped_result.all():
+                    by_status[order_status] += count
+                    #### Total revenue (completed orders only) ####
+                    if order_status == OrderStatus.COMPLETED:
+                        total_revenue += Decimal(amount or 0)
+            
+            total_orders = sum(by_status.values())
+            pending = by_status[OrderStatus.PENDING]
+            completed = by_status[OrderStatus.COMPLETED]
+            cancelled = by_status[OrderStatus.CANCELLED]
             
             #### Average order value ####
-            avg_stmt = select(func.avg(Order.total_amount)).where(Order.status == OrderStatus.COMPLETED)
-            avg_result = await db.execute(avg_stmt)
-            avg_order_value = avg_result.scalar() or Decimal('0.00')
+            avg_order_value = total_revenue / Decimal(completed) if completed else Decimal('0.00')
             
             #### Today's orders ####
             today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-            today_stmt = select(func.count(Order.id)).where(Order.created_at >= today_start)
-            today_result = await db.execute(today_stmt)
-            today_orders = today_result.scalar()
+            today_sources = await OrderArchiveControllers.get_order_sources(db, start_date=today_start)
+            today_orders = await OrderArchiveControllers.count_orders(
+                db, today_sources, lambda model: [model.created_at >= today_start]
+            )
             
             #### This month's orders ####
             month_start = datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            month_stmt = select(func.count(Order.id)).where(Order.created_at >= month_start)
-            month_result = await db.execute(month_stmt)
-            month_orders = month_result.scalar()
+            month_sources = await OrderArchiveControllers.get_order_sources(db, start_date=month_start)
+            month_orders = await OrderArchiveControllers.count_orders(
+                db, month_sources, lambda model: [model.created_at >= month_start]
+            )
             
             return {
                 "total_orders": total_orders,
@@ -601,41 +585,17 @@ class OrderControllers:
         product_id: int,
         db: AsyncSession
     ) -> Dict[str, Any]:
-        """Admin : Get order statistics for a specific product by ID """
+        """Admin : Get order statistics for a specific product by ID (read from product sales counters) """
         try:
-            #### Check if product exists or not ####
-            product_stmt = select(Product).where(Product.id == product_id)
-            product_result = await db.execute(product_stmt)
-            product = product_result.scalar_one_or_none()
+            product_stats = await ProductSalesControllers.get_product_sales(product_id, db)
             
-            if not product:
+            if not product_stats:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Product not found"
                 )
             
-            #### Total times ordered ####
-            count_stmt = select(func.count(OrderItem.id)).where(OrderItem.product_id == product_id)
-            count_result = await db.execute(count_stmt)
-            times_ordered = count_result.scalar()
-            
-            #### Total quantity sold ####
-            qty_stmt = select(func.sum(OrderItem.quantity)).where(OrderItem.product_id == product_id)
-            qty_result = await db.execute(qty_stmt)
-            total_quantity = qty_result.scalar() or 0
-            
-            #### Total revenue from this product ####
-            revenue_stmt = select(func.sum(OrderItem.subtotal)).where(OrderItem.product_id == product_id)
-            revenue_result = await db.execute(revenue_stmt)
-            total_revenue = revenue_result.scalar() or Decimal('0.00')
-            
-            return {
-                "product_id": product_id,
-                "product_name": product.name,
-                "times_ordered": times_ordered,
-                "total_quantity_sold": total_quantity,
-                "total_revenue": float(total_revenue)
-            }
+            return product_stats
         except HTTPException:
             raise
         except Exception as e:
@@ -662,24 +622,26 @@ class OrderControllers:
                     detail="User not found"
                 )
             
+            sources = await OrderArchiveControllers.get_order_sources(db)
+            
             #### Total orders ####
-            total_stmt = select(func.count(Order.id)).where(Order.user_id == user_id)
-            total_result = await db.execute(total_stmt)
-            total_orders = total_result.scalar()
+            total_orders = await OrderArchiveControllers.count_orders(
+                db, sources, lambda model: [model.user_id == user_id]
+            )
             
             #### Completed orders ####
-            completed_stmt = select(func.count(Order.id)).where(
-                and_(Order.user_id == user_id, Order.status == OrderStatus.COMPLETED)
+            completed_orders = await OrderArchiveControllers.count_orders(
+                db, sources, lambda model: [model.user_id == user_id, model.status == OrderStatus.COMPLETED]
             )
-            completed_result = await db.execute(completed_stmt)
-            completed_orders = completed_result.scalar()
             
             #### Total spent ####
-            spent_stmt = select(func.sum(Order.total_amount)).where(
-                and_(Order.user_id == user_id, Order.status == OrderStatus.COMPLETED)
-            )
-            spent_result = await db.execute(spent_stmt)
-            total_spent = spent_result.scalar() or Decimal('0.00')
+            total_spent = Decimal('0.00')
+            for order_model, _ in sources:
+                spent_stmt = select(func.sum(order_model.total_amount)).where(
+                    and_(order_model.user_id == user_id, order_model.status == OrderStatus.COMPLETED)
+                )
+                spent_result = await db.execute(spent_stmt)
+                total_spent += Decimal(spent_result.scalar() or 0)
             
             #### Average order value ####
             avg_value = Decimal('0.00')
@@ -717,34 +679,28 @@ class OrderControllers:
                     detail="Start date must be before end date"
                 )
             
+            #### Archive is only read when the range reaches back into it ####
+            sources = await OrderArchiveControllers.get_order_sources(db, start_date=start_date)
+            
+            def in_range(model):
+                return [model.created_at >= start_date, model.created_at <= end_date]
+            
             #### Total orders in range ####
-            total_stmt = select(func.count(Order.id)).where(
-                and_(Order.created_at >= start_date, Order.created_at <= end_date)
-            )
-            total_result = await db.execute(total_stmt)
-            total_orders = total_result.scalar()
+            total_orders = await OrderArchiveControllers.count_orders(db, sources, in_range)
             
             #### Completed orders in range ####
-            completed_stmt = select(func.count(Order.id)).where(
-                and_(
-                    Order.created_at >= start_date,
-                    Order.created_at <= end_date,
-                    Order.status == OrderStatus.COMPLETED
-                )
+            completed_orders = await OrderArchiveControllers.count_orders(
+                db, sources, lambda model: in_range(model) + [model.status == OrderStatus.COMPLETED]
             )
-            completed_result = await db.execute(completed_stmt)
-            completed_orders = completed_result.scalar()
             
             #### Revenue in range ####
-            revenue_stmt = select(func.sum(Order.total_amount)).where(
-                and_(
-                    Order.created_at >= start_date,
-                    Order.created_at <= end_date,
-                    Order.status == OrderStatus.COMPLETED
+            total_revenue = Decimal('0.00')
+            for order_model, _ in sources:
+                revenue_stmt = select(func.sum(order_model.total_amount)).where(
+                    and_(*in_range(order_model), order_model.status == OrderStatus.COMPLETED)
                 )
-            )
-            revenue_result = await db.execute(revenue_stmt)
-            total_revenue = revenue_result.scalar() or Decimal('0.00')
+                revenue_result = await db.execute(revenue_stmt)
+                total_revenue += Decimal(revenue_result.scalar() or 0)
             
             return {
                 "start_date": start_date.isoformat(),
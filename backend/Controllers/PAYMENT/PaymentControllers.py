@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, union_all, literal, cast, String, Numeric
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 from typing import Dict, Any, List, Optional
@@ -14,6 +14,13 @@ from Models.USER.UserModel import User
 from Schemas.PAYMENT.PaymentSchemas import PaymentCreate, PaymentUpdate
 from Utils.Enums.Enums import PaymentStatus, OrderStatus, ReservationStatus
 from Models.PAYMENT.PaymentModel import payment_orders
+from Controllers.PRODUCT.ProductSales.ProductSalesControllers import ProductSalesControllers
+from Controllers.ORDER.OrderArchiveControllers import OrderArchiveControllers
+from Utils.PaymentProvider.PaymentProviderClient import get_payment_provider_client, PaymentProviderError, PAYMENT_PROVIDER_ENABLED
+
+#### For testing , using a fixed fee value for reservation (changable any time) ####
+RESERVATION_FEE = Decimal('50.00')
+
 
 class PaymentControllers:
     
@@ -31,65 +38,141 @@ class PaymentControllers:
         }
     
     @staticmethod
-    async def _validate_orders(order_ids: List[int], user_id: int, db: AsyncSession) -> tuple[List[Order], Decimal]:
-        """ Validate orders belong to user and calculate total """
-        if not order_ids:
-            return [], Decimal('0.00')
+    async def _validate_payment_targets(
+        order_ids: List[int],
+        reservation_id: Optional[int],
+        user_id: int,
+        db: AsyncSession
+    ) -> tuple[List[int], Decimal]:
+        """
+        Validate orders and reservation belong to user and are pending, then calculate total.
+        All targets are fetched with one UNION ALL query regardless of how many orders are paid.
+        """
+        order_ids = list(dict.fromkeys(order_ids or []))
         
-        stmt = select(Order).where(
-            and_(
-                Order.id.in_(order_ids),
-                Order.user_id == user_id
+        parts = []
+        if order_ids:
+            parts.append(
+                select(
+                    literal("order").label("kind"),
+                    Order.id.label("id"),
+                    Order.user_id.label("user_id"),
+                    cast(Order.status, String).label("status"),
+                    Order.total_amount.label("amount"),
+                ).where(Order.id.in_(order_ids))
             )
-        )
-        result = await db.execute(stmt)
-        orders = result.scalars().all()
-        
-        if len(orders) != len(order_ids):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="One or more orders not found or don't belong to you"
+        if reservation_id:
+            parts.append(
+                select(
+                    literal("reservation").label("kind"),
+                    Reservation.id.label("id"),
+                    Reservation.user_id.label("user_id"),
+                    cast(Reservation.status, String).label("status"),
+                    literal(None, Numeric(10, 2)).label("amount"),
+                ).where(Reservation.id == reservation_id)
             )
         
-        #### Check all orders are pending ####
-        for order in orders:
-            if order.status != OrderStatus.PENDING:
+        stmt = union_all(*parts) if len(parts) > 1 else parts[0]
+        rows = (await db.execute(stmt)).all()
+        
+        order_rows = [row for row in rows if row.kind == "order"]
+        reservation_row = next((row for row in rows if row.kind == "reservation"), None)
+        
+        calculated_amount = Decimal('0.00')
+        
+        if order_ids:
+            owned_orders = [row for row in order_rows if row.user_id == user_id]
+            if len(owned_orders) != len(order_ids):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="One or more orders not found or don't belong to you"
+                )
+            
+            #### Check all orders are pending ####
+            for row in owned_orders:
+                if row.status != OrderStatus.PENDING.name:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Order {row.id} is not pending"
+                    )
+            
+            calculated_amount += sum((Decimal(row.amount) for row in owned_orders), Decimal('0.00'))
+        
+        if reservation_id:
+            if not reservation_row:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Reservation not found"
+                )
+            
+            if reservation_row.user_id != user_id:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Reservation doesn't belong to you"
+                )
+            
+            if reservation_row.status != ReservationStatus.PENDING.name:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Order {order.id} is not pending"
+                    detail="Reservation is not pending"
                 )
+            
+            calculated_amount += RESERVATION_FEE
         
-        total = sum(order.total_amount for order in orders)
-        return orders, total
+        return order_ids, calculated_amount
     
     @staticmethod
-    async def _validate_reservation(reservation_id: int, user_id: int, db: AsyncSession) -> tuple[Reservation, Decimal]:
-        """ Validate reservation belongs to user """
-        stmt = select(Reservation).where(Reservation.id == reservation_id)
-        result = await db.execute(stmt)
-        reservation = result.scalar_one_or_none()
+    async def _initialize_provider_checkout(payment: Payment, current_user: User, db: AsyncSession) -> Dict[str, Any]:
+        """ Start the Iyzico checkout form through the pooled provider client and store its token """
+        payload = {
+            "locale": "tr",
+            "conversationId": payment.conversation_id,
+            "price": str(payment.amount),
+            "paidPrice": str(payment.amount),
+            "currency": payment.currency,
+            "basketId": payment.basket_id,
+            "paymentGroup": "PRODUCT",
+            "callbackUrl": os.getenv("IYZICO_CALLBACK_URL", ""),
+            "buyer": {
+                "id": str(current_user.id),
+                "name": current_user.username,
+                "surname": current_user.username,
+                "email": current_user.email,
+                "ip": payment.ip_address,
+            },
+        }
         
-        if not reservation:
+        try:
+            checkout = await get_payment_provider_client().initialize_checkout(payload)
+        except PaymentProviderError as e:
+            #### Payment row stays PENDING , the user can retry the checkout ####
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Reservation not found"
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail={**e.to_dict(), "payment_id": payment.id}
             )
         
-        if reservation.user_id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Reservation doesn't belong to you"
-            )
+        payment.provider_payment_token = checkout.get("token")
+        await db.commit()
+        return checkout
+    
+    @staticmethod
+    async def _apply_payment_completion(payment: Payment, db: AsyncSession) -> None:
+        """
+        Complete the orders and confirm the reservation of a paid payment.
+        payment.orders and payment.reservation must be loaded , caller commits.
+        """
+        newly_completed_ids = []
+        for order in payment.orders:
+            if order.status != OrderStatus.COMPLETED:
+                newly_completed_ids.append(order.id)
+            order.status = OrderStatus.COMPLETED
+            order.completed_at = datetime.now(timezone.utc)
         
-        if reservation.status != ReservationStatus.PENDING:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Reservation is not pending"
-            )
+        #### Count the sold products in the same transaction ####
+        await ProductSalesControllers.record_completed_orders(newly_completed_ids, db)
         
-        #### For testing , using a fixed fee value for reservation (changable any time) ####
-        reservation_fee = Decimal('50.00')
-        return reservation, reservation_fee
+        if payment.reservation:
+            payment.reservation.status = ReservationStatus.CONFIRMED
     
     #### ============================================ ####
     #### USER FUNCTIONS ####
@@ -110,23 +193,10 @@ class PaymentControllers:
                     detail="Must provide either order_ids or reservation_id"
                 )
             
-            orders = []
-            reservation = None
-            calculated_amount = Decimal('0.00')
-            
-            #### Validate orders if provided or not ####
-            if payment_data.order_ids:
-                orders, order_total = await PaymentControllers._validate_orders(
-                    payment_data.order_ids, current_user.id, db
-                )
-                calculated_amount += order_total
-            
-            #### Validate reservation if provided ####
-            if payment_data.reservation_id:
-                reservation, reservation_fee = await PaymentControllers._validate_reservation(
-                    payment_data.reservation_id, current_user.id, db
-                )
-                calculated_amount += reservation_fee
+            #### Validate orders and reservation in one query ####
+            order_ids, calculated_amount = await PaymentControllers._validate_payment_targets(
+                payment_data.order_ids, payment_data.reservation_id, current_user.id, db
+            )
             
             #### Verify amount matches ####
             if abs(calculated_amount - payment_data.amount) > Decimal('0.01'):
@@ -153,24 +223,30 @@ class PaymentControllers:
             db.add(new_payment)
             await db.flush()
             
-            #### Store order IDs before linking ####
-            order_ids = [order.id for order in orders]
-            
-            #### Link orders to payment using the association table ####
-            if orders:
-                for order in orders:
-                    stmt = payment_orders.insert().values(
-                        payment_id=new_payment.id,
-                        order_id=order.id
-                    )
-                    await db.execute(stmt)
+            #### Link orders to payment with one multi-row insert into the association table ####
+            if order_ids:
+                stmt = payment_orders.insert().values([
+                    {"payment_id": new_payment.id, "order_id": order_id}
+                    for order_id in order_ids
+                ])
+                await db.execute(stmt)
             
+            #### No refresh needed , server defaults come back with the insert (eager_defaults) ####
             await db.commit()
-            await db.refresh(new_payment)
             
-            # This is testing purposed , Iyzico Payment API can be added here in future
-            # For now simulate a successful payment
-            #### TODO : An actual Iyzico payment API should come here : TODO ####
+            #### Start the provider checkout when enabled (PAYMENT_PROVIDER_ENABLED=true) ####
+            #### otherwise this stays a test payment , completed via complete-test ####
+            if PAYMENT_PROVIDER_ENABLED:
+                checkout = await PaymentControllers._initialize_provider_checkout(new_payment, current_user, db)
+                return {
+                    "message": "Payment created successfully",
+                    "payment": {
+                        **new_payment.to_dict(),
+                        "order_ids": order_ids,
+                        "checkout_form_content": checkout.get("checkoutFormContent"),
+                        "payment_page_url": checkout.get("paymentPageUrl"),
+                    }
+                }
             
             return {
                 "message": "Payment created successfully",
@@ -211,12 +287,12 @@ class PaymentControllers:
             
             #### Get payments ####
             stmt = select(Payment).options(
-                selectinload(Payment.orders),
                 selectinload(Payment.reservation)
             ).where(and_(*conditions)).offset(skip).limit(limit).order_by(Payment.created_at.desc())
             
             result = await db.execute(stmt)
             payments = result.scalars().all()
+            order_ids = await OrderArchiveControllers.get_payment_order_ids(db, [payment.id for payment in payments])
             
             return {
                 "total": total,
@@ -225,7 +301,7 @@ class PaymentControllers:
                 "payments": [
                     {
                         **payment.to_dict(),
-                        "order_ids": [order.id for order in payment.orders]
+                        "order_ids": order_ids[payment.id]
                     }
                     for payment in payments
                 ]
@@ -245,7 +321,6 @@ class PaymentControllers:
         """User : Get single payment by ID (must be their own) """
         try:
             stmt = select(Payment).options(
-                selectinload(Payment.orders),
                 selectinload(Payment.reservation)
             ).where(Payment.id == payment_id)
             
@@ -265,9 +340,10 @@ class PaymentControllers:
                     detail="You can only view your own payments"
                 )
             
+            order_ids = await OrderArchiveControllers.get_payment_order_ids(db, [payment.id])
             return {
                 **payment.to_dict(),
-                "order_ids": [order.id for order in payment.orders]
+                "order_ids": order_ids[payment.id]
             }
         except HTTPException:
             raise
@@ -321,23 +397,18 @@ class PaymentControllers:
             payment.card_association = "VISA"
             payment.card_type = "CREDIT_CARD"
             
-            #### Update related orders ####
-            for order in payment.orders:
-                order.status = OrderStatus.COMPLETED
-                order.completed_at = datetime.now(timezone.utc)
-            
-            #### Update related reservation ####
-            if payment.reservation:
-                payment.reservation.status = ReservationStatus.CONFIRMED
+            #### Update related orders and reservation ####
+            await PaymentControllers._apply_payment_completion(payment, db)
             
             await db.commit()
             await db.refresh(payment)
+            order_ids = await OrderArchiveControllers.get_payment_order_ids(db, [payment.id])
             
             return {
                 "message": "Payment completed successfully (TEST MODE)",
                 "payment": {
                     **payment.to_dict(),
-                    "order_ids": [order.id for order in payment.orders]
+                    "order_ids": order_ids[payment.id]
                 }
             }
         except HTTPException:
@@ -375,7 +446,6 @@ class PaymentControllers:
             
             #### Get payments ####
             stmt = select(Payment).options(
-                selectinload(Payment.orders),
                 selectinload(Payment.reservation),
                 selectinload(Payment.user)
             ).offset(skip).limit(limit).order_by(Payment.created_at.desc())
@@ -385,6 +455,7 @@ class PaymentControllers:
             
             result = await db.execute(stmt)
             payments = result.scalars().all()
+            order_ids = await OrderArchiveControllers.get_payment_order_ids(db, [payment.id for payment in payments])
             
             return {
                 "total": total,
@@ -394,7 +465,7 @@ class PaymentControllers:
                     {
                         **payment.to_dict(),
                         "username": payment.user.username if payment.user else None,
-                        "order_ids": [order.id for order in payment.orders]
+                        "order_ids": order_ids[payment.id]
                     }
                     for payment in payments
                 ]
@@ -410,7 +481,6 @@ class PaymentControllers:
         """Admin : Get any payment by ID """
         try:
             stmt = select(Payment).options(
-                selectinload(Payment.orders),
                 selectinload(Payment.reservation),
                 selectinload(Payment.user)
             ).where(Payment.id == payment_id)
@@ -424,11 +494,12 @@ class PaymentControllers:
                     detail="Payment not found"
                 )
             
+            order_ids = await OrderArchiveControllers.get_payment_order_ids(db, [payment.id])
             return {
                 **payment.to_dict(),
                 "username": payment.user.username if payment.user else None,
                 "user_email": payment.user.email if payment.user else None,
-                "order_ids": [order.id for order in payment.orders]
+                "order_ids": order_ids[payment.id]
             }
         except HTTPException:
             raise
@@ -554,12 +625,12 @@ class PaymentControllers:
             
             #### Get payments ####
             stmt = select(Payment).options(
-                selectinload(Payment.orders),
                 selectinload(Payment.reservation)
             ).where(Payment.user_id == user_id).offset(skip).limit(limit).order_by(Payment.created_at.desc())
             
             result = await db.execute(stmt)
             payments = result.scalars().all()
+            order_ids = await OrderArchiveControllers.get_payment_order_ids(db, [payment.id for payment in payments])
             
             return {
                 "user_id": user_id,
@@ -570,7 +641,7 @@ class PaymentControllers:
                 "payments": [
                     {
                         **payment.to_dict(),
-                        "order_ids": [order.id for order in payment.orders]
+                        "order_ids": order_ids[payment.id]
                     }
                     for payment in payments
                 ]
@@ -0,0 +1,282 @@
+import os
+import socket
+import asyncio
+import logging
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, insert, or_, and_, func
+from sqlalchemy.orm import selectinload
+from fastapi import HTTPException, status
+from typing import Dict, Any, List
+from datetime import datetime, timezone, timedelta
+from dotenv import load_dotenv
+
+from Database.Database import AsyncSessionLocal
+from Models.PAYMENT.PaymentModel import Payment
+from Models.PAYMENT.PaymentWebhookEventModel import PaymentWebhookEvent
+from Controllers.PAYMENT.PaymentControllers import PaymentControllers
+from Utils.PaymentProvider.PaymentProviderClient import verify_webhook_signature
+from Utils.Enums.Enums import PaymentStatus
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+#### Webhook worker configuration ####
+PAYMENT_WEBHOOK_WORKERS = int(os.getenv("PAYMENT_WEBHOOK_WORKERS", 2))
+PAYMENT_WEBHOOK_BATCH_SIZE = int(os.getenv("PAYMENT_WEBHOOK_BATCH_SIZE", 100))
+PAYMENT_WEBHOOK_POLL_SECONDS = float(os.getenv("PAYMENT_WEBHOOK_POLL_SECONDS", 1))
+PAYMENT_WEBHOOK_MAX_ATTEMPTS = int(os.getenv("PAYMENT_WEBHOOK_MAX_ATTEMPTS", 10))
+#### claims older than this are considered abandoned (crashed worker) and can be taken again ####
+PAYMENT_WEBHOOK_CLAIM_TIMEOUT_SECONDS = int(os.getenv("PAYMENT_WEBHOOK_CLAIM_TIMEOUT_SECONDS", 60))
+
+#### provider status -> payment status ####
+WEBHOOK_STATUS_MAP = {
+    "SUCCESS": PaymentStatus.COMPLETED,
+    "FAILURE": PaymentStatus.FAILED,
+}
+
+#### wakes the workers right after an enqueue instead of waiting for the next poll ####
+_new_events = asyncio.Event()
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class PaymentWebhookControllers:
+
+    #### ============================================ ####
+    #### INGESTION (request path) ####
+    #### ============================================ ####
+
+    @staticmethod
+    async def enqueue_iyzico_webhook(payload: Dict[str, Any], signature: str, db: AsyncSession) -> Dict[str, Any]:
+        """
+        Verify the notification and append it to the webhook inbox.
+        No payment lookups here , a single INSERT keeps the endpoint fast during provider retry storms.
+        """
+        if not verify_webhook_signature(payload, signature):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid webhook signature"
+            )
+
+        provider_payment_id = payload.get("iyziPaymentId") or payload.get("paymentId")
+        event_status = str(payload.get("status", "")).upper()
+        if not provider_payment_id or event_status not in WEBHOOK_STATUS_MAP:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Webhook must contain a payment id and a SUCCESS / FAILURE status"
+            )
+
+        try:
+            await db.execute(
+                insert(PaymentWebhookEvent).values(
+                    provider="iyzico",
+                    provider_payment_id=str(provider_payment_id),
+                    event_status=event_status,
+                    token=payload.get("token"),
+                    conversation_id=payload.get("paymentConversationId"),
+                    payload=payload,
+                    attempts=0,
+                )
+            )
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to enqueue webhook: {str(e)}"
+            )
+
+        _new_events.set()
+        return {"status": "queued"}
+
+    #### ============================================ ####
+    #### PROCESSING (background workers) ####
+    #### ============================================ ####
+
+    @staticmethod
+    async def _claim_batch(worker_name: str, db: AsyncSession) -> List[PaymentWebhookEvent]:
+        """ Mark up to PAYMENT_WEBHOOK_BATCH_SIZE unprocessed events as ours and return them """
+        now = _utcnow()
+        stale_before = now - timedelta(seconds=PAYMENT_WEBHOOK_CLAIM_TIMEOUT_SECONDS)
+
+        candidate_ids = select(PaymentWebhookEvent.id).where(
+            and_(
+                PaymentWebhookEvent.processed_at.is_(None),
+                or_(PaymentWebhookEvent.claimed_at.is_(None), PaymentWebhookEvent.claimed_at < stale_before)
+            )
+        ).order_by(PaymentWebhookEvent.id).limit(PAYMENT_WEBHOOK_BATCH_SIZE).scalar_subquery()
+
+        #### the claim condition is repeated so two workers can't take the same row ####
+        await db.execute(
+            update(PaymentWebhookEvent).where(
+                and_(
+                    PaymentWebhookEvent.id.in_(candidate_ids),
+                    PaymentWebhookEvent.processed_at.is_(None),
+                    or_(PaymentWebhookEvent.claimed_at.is_(None), PaymentWebhookEvent.claimed_at < stale_before)
+                )
+            ).values(
+                claimed_at=now,
+                claimed_by=worker_name,
+                attempts=PaymentWebhookEvent.attempts + 1,
+            ).execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+        stmt = select(PaymentWebhookEvent).where(
+            and_(
+                PaymentWebhookEvent.claimed_by == worker_name,
+                PaymentWebhookEvent.claimed_at == now,
+                PaymentWebhookEvent.processed_at.is_(None)
+            )
+        ).order_by(PaymentWebhookEvent.id)
+        return list((await db.execute(stmt)).scalars().all())
+
+    @staticmethod
+    async def process_batch(worker_name: str, db: AsyncSession) -> int:
+        """
+        Claim a batch, keep the newest event per provider_payment_id and apply the
+        status transitions to Payment, Order and Reservation in one transaction.
+        Every event is applied in its own savepoint , a failing event does not take the batch down.
+        Returns the number of claimed events.
+        """
+        events = await PaymentWebhookControllers._claim_batch(worker_name, db)
+        if not events:
+            return 0
+
+        now = _utcnow()
+
+        #### De-duplicate : provider retries send the same notification many times ####
+        latest: Dict[str, PaymentWebhookEvent] = {}
+        for event in events:
+            latest[event.provider_payment_id] = event
+        for event in events:
+            if latest[event.provider_payment_id] is not event:
+                event.processed_at = now
+                event.result = "duplicate"
+
+        #### Load every affected payment in one query ####
+        unique_events = list(latest.values())
+        tokens = [event.token for event in unique_events if event.token]
+        conversation_ids = [event.conversation_id for event in unique_events if event.conversation_id]
+        provider_ids = [event.provider_payment_id for event in unique_events]
+
+        payment_stmt = select(Payment).options(
+            selectinload(Payment.orders),
+            selectinload(Payment.reservation)
+        ).where(
+            or_(
+                Payment.provider_payment_id.in_(provider_ids),
+                Payment.provider_payment_token.in_(tokens),
+                Payment.conversation_id.in_(conversation_ids)
+            )
+        )
+        payments = (await db.execute(payment_stmt)).scalars().all()
+
+        by_provider_id = {payment.provider_payment_id: payment for payment in payments if payment.provider_payment_id}
+        by_token = {payment.provider_payment_token: payment for payment in payments if payment.provider_payment_token}
+        by_conversation = {payment.conversation_id: payment for payment in payments if payment.conversation_id}
+
+        for event in unique_events:
+            payment = (
+                by_provider_id.get(event.provider_payment_id)
+                or by_token.get(event.token)
+                or by_conversation.get(event.conversation_id)
+            )
+
+            if payment is None:
+                #### The webhook can arrive before the checkout token is stored ####
+                #### the claim is kept , so it's retried once the claim timeout passes ####
+                if event.attempts >= PAYMENT_WEBHOOK_MAX_ATTEMPTS:
+                    event.processed_at = now
+                    event.result = "error: payment not found"
+                continue
+
+            try:
+                async with db.begin_nested():
+                    result = await PaymentWebhookControllers._apply_event(event, payment, db)
+            except Exception as e:
+                #### the claim is kept , so it's retried once the claim timeout passes ####
+                logger.error(f"Payment webhook event {event.id} failed (attempt {event.attempts}): {str(e)}")
+                if event.attempts >= PAYMENT_WEBHOOK_MAX_ATTEMPTS:
+                    event.processed_at = now
+                    event.result = f"error: {str(e)}"
+                continue
+
+            event.processed_at = now
+            event.result = result
+
+        await db.commit()
+        return len(events)
+
+    @staticmethod
+    async def _apply_event(event: PaymentWebhookEvent, payment: Payment, db: AsyncSession) -> str:
+        """ Apply one event to its payment , returns the event result. Caller commits """
+        #### Transitions only leave PENDING , replays of an applied event are no-ops ####
+        if payment.status != PaymentStatus.PENDING:
+            return "ignored"
+
+        payment.provider_payment_id = event.provider_payment_id
+        payment.status = WEBHOOK_STATUS_MAP[event.event_status]
+        if payment.status == PaymentStatus.COMPLETED:
+            await PaymentControllers._apply_payment_completion(payment, db)
+        return "applied"
+
+    @staticmethod
+    async def run_worker(worker_name: str) -> None:
+        """ Worker loop , drains the inbox then waits for new events or the poll interval """
+        while True:
+            try:
+                async with AsyncSessionLocal() as session:
+                    claimed = await PaymentWebhookControllers.process_batch(worker_name, session)
+                if claimed:
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Payment webhook worker {worker_name} failed: {str(e)}")
+
+            try:
+                await asyncio.wait_for(_new_events.wait(), timeout=PAYMENT_WEBHOOK_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            _new_events.clear()
+
+    @staticmethod
+    def start_workers() -> List[asyncio.Task]:
+        """ Start PAYMENT_WEBHOOK_WORKERS worker tasks , called from the app lifespan """
+        host = f"{socket.gethostname()}-{os.getpid()}"
+        return [
+            asyncio.create_task(PaymentWebhookControllers.run_worker(f"{host}-{index}"))
+            for index in range(PAYMENT_WEBHOOK_WORKERS)
+        ]
+
+    #### ============================================ ####
+    #### ADMIN FUNCTIONS ####
+    #### ============================================ ####
+
+    @staticmethod
+    async def admin_get_queue_statistics(db: AsyncSession) -> Dict[str, Any]:
+        """ Admin : Inbox depth and processing results """
+        try:
+            pending_stmt = select(func.count(PaymentWebhookEvent.id)).where(PaymentWebhookEvent.processed_at.is_(None))
+            pending = (await db.execute(pending_stmt)).scalar()
+
+            results_stmt = select(
+                PaymentWebhookEvent.result,
+                func.count(PaymentWebhookEvent.id)
+            ).where(PaymentWebhookEvent.processed_at.is_not(None)).group_by(PaymentWebhookEvent.result)
+            results = {result: count for result, count in (await db.execute(results_stmt)).all()}
+
+            return {
+                "pending": pending,
+                "processed": results,
+                "workers": PAYMENT_WEBHOOK_WORKERS
+            }
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to fetch webhook queue statistics: {str(e)}"
+            )
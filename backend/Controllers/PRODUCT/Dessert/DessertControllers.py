@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 
 from Models.PRODUCT.Dessert.DessertModel import Dessert
 from Schemas.PRODUCT.Dessert.DessertSchemas import DessertCreate, DessertUpdate
+from Controllers.PRODUCT.ProductRating.ProductRatingControllers import ProductRatingControllers
 
 
 class DessertControllers:
@@ -15,6 +16,7 @@ class DessertControllers:
         skip: int = 0,
         limit: int = 100,
         include_inactive: bool = False,
+        sort_by: str = "newest",
         db: AsyncSession = None
     ) -> Dict[str, Any]:
         """Get all desserts with pagination"""
@@ -31,7 +33,7 @@ class DessertControllers:
             total = count_result.scalar()
             
             # Get desserts
-            stmt = select(Dessert).offset(skip).limit(limit).order_by(Dessert.created_at.desc())
+            stmt = ProductRatingControllers.apply_product_sort(select(Dessert), Dessert, sort_by).offset(skip).limit(limit)
             if conditions:
                 stmt = stmt.where(and_(*conditions))
             
@@ -42,8 +44,11 @@ class DessertControllers:
                 "total": total,
                 "skip": skip,
                 "limit": limit,
+                "sort_by": sort_by,
                 "desserts": [dessert.to_dict() for dessert in desserts]
             }
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 
 from Models.PRODUCT.Doner.DonerModel import Doner
 from Schemas.PRODUCT.Doner.DonerSchemas import DonerCreate, DonerUpdate
+from Controllers.PRODUCT.ProductRating.ProductRatingControllers import ProductRatingControllers
 
 
 class DonerControllers:
@@ -15,6 +16,7 @@ class DonerControllers:
         skip: int = 0,
         limit: int = 100,
         include_inactive: bool = False,
+        sort_by: str = "newest",
         db: AsyncSession = None
     ) -> Dict[str, Any]:
         """Get all doners with pagination """
@@ -29,7 +31,7 @@ class DonerControllers:
             count_result = await db.execute(count_stmt)
             total = count_result.scalar()
             
-            stmt = select(Doner).offset(skip).limit(limit).order_by(Doner.created_at.desc())
+            stmt = ProductRatingControllers.apply_product_sort(select(Doner), Doner, sort_by).offset(skip).limit(limit)
             if conditions:
                 stmt = stmt.where(and_(*conditions))
             
@@ -40,8 +42,11 @@ class DonerControllers:
                 "total": total,
                 "skip": skip,
                 "limit": limit,
+                "sort_by": sort_by,
                 "doners": [doner.to_dict() for doner in doners]
             }
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
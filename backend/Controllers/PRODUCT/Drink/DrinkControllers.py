@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 
 from Models.PRODUCT.Drink.DrinkModel import Drink
 from Schemas.PRODUCT.Drink.DrinkSchemas import DrinkCreate, DrinkUpdate
+from Controllers.PRODUCT.ProductRating.ProductRatingControllers import ProductRatingControllers
 
 
 class DrinkControllers:
@@ -15,6 +16,7 @@ class DrinkControllers:
         skip: int = 0,
         limit: int = 100,
         include_inactive: bool = False,
+        sort_by: str = "newest",
         db: AsyncSession = None
     ) -> Dict[str, Any]:
         """Get all drinks with pagination"""
@@ -29,7 +31,7 @@ class DrinkControllers:
             count_result = await db.execute(count_stmt)
             total = count_result.scalar()
             
-            stmt = select(Drink).offset(skip).limit(limit).order_by(Drink.created_at.desc())
+            stmt = ProductRatingControllers.apply_product_sort(select(Drink), Drink, sort_by).offset(skip).limit(limit)
             if conditions:
                 stmt = stmt.where(and_(*conditions))
             
@@ -40,8 +42,11 @@ class DrinkControllers:
                 "total": total,
                 "skip": skip,
                 "limit": limit,
+                "sort_by": sort_by,
                 "drinks": [drink.to_dict() for drink in drinks]
             }
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
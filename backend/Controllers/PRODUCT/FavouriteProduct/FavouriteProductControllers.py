@@ -8,6 +8,7 @@ from Models.PRODUCT.FavouriteProduct.FavouriteProductModel import FavouriteProdu
 from Models.PRODUCT.BaseProduct.BaseProductModel import Product
 from Models.USER.UserModel import User
 from Schemas.PRODUCT.FavouriteProduct.FavouriteProductSchemas import FavouriteProductCreate
+from Controllers.PRODUCT.ProductLeaderboard.ProductLeaderboardControllers import ProductLeaderboardControllers
 
 
 class FavouriteProductControllers:
@@ -245,28 +246,10 @@ class FavouriteProductControllers:
             unique_products_result = await db.execute(unique_products_stmt)
             unique_products = unique_products_result.scalar()
             
-            #### Most favourited products (top 10) ####
-            most_favourited_stmt = select(
-                FavouriteProduct.product_id,
-                func.count(FavouriteProduct.id).label('count')
-            ).group_by(FavouriteProduct.product_id).order_by(func.count(FavouriteProduct.id).desc()).limit(10)
-            
-            most_favourited_result = await db.execute(most_favourited_stmt)
-            most_favourited_raw = most_favourited_result.all()
-            
-            #### Get product details for most favourited ####
-            most_favourited = []
-            for product_id, count in most_favourited_raw:
-                product_stmt = select(Product).where(Product.id == product_id)
-                product_result = await db.execute(product_stmt)
-                product = product_result.scalar_one_or_none()
-                
-                if product:
-                    most_favourited.append({
-                        "product_id": product_id,
-                        "product_name": product.name,
-                        "favourite_count": count
-                    })
+            #### Most favourited products (top 10) , one grouped query joined to products ####
+            most_favourited = await ProductLeaderboardControllers.get_leaderboard_entries(
+                "most_favourited", "all", 10, False, db
+            )
             
             return {
                 "total_favourites": total_favourites,
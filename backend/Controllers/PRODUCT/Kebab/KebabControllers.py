@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 
 from Models.PRODUCT.Kebab.KebabModel import Kebab
 from Schemas.PRODUCT.Kebab.KebabSchemas import KebabCreate, KebabUpdate
+from Controllers.PRODUCT.ProductRating.ProductRatingControllers import ProductRatingControllers
 
 
 class KebabControllers:
@@ -15,6 +16,7 @@ class KebabControllers:
         skip: int = 0,
         limit: int = 100,
         include_inactive: bool = False,
+        sort_by: str = "newest",
         db: AsyncSession = None
     ) -> Dict[str, Any]:
         """Get all kebabs with pagination"""
@@ -29,7 +31,7 @@ class KebabControllers:
             count_result = await db.execute(count_stmt)
             total = count_result.scalar()
             
-            stmt = select(Kebab).offset(skip).limit(limit).order_by(Kebab.created_at.desc())
+            stmt = ProductRatingControllers.apply_product_sort(select(Kebab), Kebab, sort_by).offset(skip).limit(limit)
             if conditions:
                 stmt = stmt.where(and_(*conditions))
             
@@ -40,8 +42,11 @@ class KebabControllers:
                 "total": total,
                 "skip": skip,
                 "limit": limit,
+                "sort_by": sort_by,
                 "kebabs": [kebab.to_dict() for kebab in kebabs]
             }
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,150 @@
+import os
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, and_
+from fastapi import HTTPException, status
+from typing import Dict, Any, List
+from datetime import datetime, timezone, timedelta
+from dotenv import load_dotenv
+
+from Models.PRODUCT.BaseProduct.BaseProductModel import Product
+from Models.PRODUCT.FavouriteProduct.FavouriteProductModel import FavouriteProduct
+from Models.COMMENT.CommentModel import Comment
+from Utils.Cache.TTLCache import TTLCache
+
+load_dotenv()
+
+#### Leaderboards are cached per (board, window, limit) for a few seconds ####
+LEADERBOARD_CACHE_SECONDS = float(os.getenv("LEADERBOARD_CACHE_SECONDS", 30))
+
+LEADERBOARD_WINDOWS = {
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30),
+    "all": None,
+}
+
+#### board name -> table counted per product , its timestamp , filters and the count key ####
+LEADERBOARDS = {
+    "most_commented": {
+        "model": Comment,
+        "product_id": Comment.product_id,
+        "row_id": Comment.id,
+        "created_at": Comment.created_at,
+        "conditions": [Comment.is_active == True],
+        "count_key": "comment_count",
+    },
+    "most_favourited": {
+        "model": FavouriteProduct,
+        "product_id": FavouriteProduct.product_id,
+        "row_id": FavouriteProduct.id,
+        "created_at": FavouriteProduct.created_at,
+        "conditions": [],
+        "count_key": "favourite_count",
+    },
+}
+
+leaderboard_cache = TTLCache(LEADERBOARD_CACHE_SECONDS, max_entries=256)
+
+
+class ProductLeaderboardControllers:
+
+    @staticmethod
+    async def get_leaderboard_entries(
+        board: str,
+        window: str,
+        limit: int,
+        active_products_only: bool,
+        db: AsyncSession
+    ) -> List[Dict[str, Any]]:
+        """
+        Top products of a board , one grouped query joined to products (no per product lookups).
+        Served from leaderboard_cache when a fresh entry exists.
+        """
+        spec = LEADERBOARDS.get(board)
+        if spec is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"board must be one of: {', '.join(LEADERBOARDS)}"
+            )
+        if window not in LEADERBOARD_WINDOWS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"window must be one of: {', '.join(LEADERBOARD_WINDOWS)}"
+            )
+
+        cache_key = (board, window, limit, active_products_only)
+        cached = leaderboard_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        conditions = list(spec["conditions"])
+        if LEADERBOARD_WINDOWS[window] is not None:
+            since = datetime.now(timezone.utc).replace(tzinfo=None) - LEADERBOARD_WINDOWS[window]
+            conditions.append(spec["created_at"] >= since)
+        if active_products_only:
+            conditions.append(Product.is_active == True)
+
+        count = func.count(spec["row_id"]).label("count")
+        stmt = select(
+            Product.id,
+            Product.name,
+            Product.category,
+            Product.image_url,
+            count
+        ).select_from(
+            spec["model"]
+        ).join(
+            Product, Product.id == spec["product_id"]
+        ).group_by(
+            Product.id, Product.name, Product.category, Product.image_url
+        ).order_by(count.desc(), Product.id).limit(limit)
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+
+        result = await db.execute(stmt)
+        entries = [
+            {
+                "rank": rank,
+                "product_id": row.id,
+                "product_name": row.name,
+                "category": row.category,
+                "image_url": row.image_url,
+                spec["count_key"]: row.count,
+            }
+            for rank, row in enumerate(result.all(), start=1)
+        ]
+
+        leaderboard_cache.set(cache_key, entries)
+        return entries
+
+    @staticmethod
+    async def get_leaderboard(
+        board: str,
+        window: str = "all",
+        limit: int = 10,
+        db: AsyncSession = None
+    ) -> Dict[str, Any]:
+        """ Public : Top active products of a leaderboard within a time window """
+        try:
+            entries = await ProductLeaderboardControllers.get_leaderboard_entries(board, window, limit, True, db)
+            return {
+                "board": board,
+                "window": window,
+                "limit": limit,
+                "products": entries
+            }
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to fetch leaderboard: {str(e)}"
+            )
+
+    @staticmethod
+    def list_leaderboards() -> Dict[str, Any]:
+        """ Public : Available boards and windows """
+        return {
+            "boards": list(LEADERBOARDS),
+            "windows": list(LEADERBOARD_WINDOWS),
+            "cache_seconds": LEADERBOARD_CACHE_SECONDS
+        }
@@ -0,0 +1,139 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, and_, delete, insert
+from fastapi import HTTPException, status
+from typing import Dict, Any
+
+from Models.PRODUCT.ProductRating.ProductRatingSummaryModel import (
+    ProductRatingSummary,
+    RATING_STARS,
+    average_rating_expression,
+    empty_rating_summary,
+)
+from Models.PRODUCT.BaseProduct.BaseProductModel import Product
+from Models.COMMENT.CommentModel import Comment
+
+#### Orders product listings can use ####
+PRODUCT_SORTS = ("newest", "rating", "most_rated")
+
+
+class ProductRatingControllers:
+
+    #### HELPER METHODS ####
+    #### ============================================ ####
+
+    @staticmethod
+    def apply_product_sort(stmt, model, sort_by: str):
+        """
+        Order a product listing. Rating sorts join the summary table , unrated products come last.
+        Raises 400 for an unknown sort_by.
+        """
+        if sort_by not in PRODUCT_SORTS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"sort_by must be one of: {', '.join(PRODUCT_SORTS)}"
+            )
+
+        if sort_by == "newest":
+            return stmt.order_by(model.created_at.desc())
+
+        stmt = stmt.outerjoin(ProductRatingSummary, ProductRatingSummary.product_id == model.id)
+        rating_count = func.coalesce(ProductRatingSummary.rating_count, 0)
+        if sort_by == "rating":
+            return stmt.order_by(func.coalesce(average_rating_expression, 0).desc(), rating_count.desc(), model.id)
+        return stmt.order_by(rating_count.desc(), func.coalesce(average_rating_expression, 0).desc(), model.id)
+
+    @staticmethod
+    async def _rebuild_summaries(db: AsyncSession) -> int:
+        """ Recompute every rating summary with one grouped query , caller commits """
+        stmt = select(
+            Comment.product_id,
+            Comment.rating,
+            func.count(Comment.id)
+        ).where(
+            and_(
+                Comment.is_active == True,
+                Comment.rating.in_(RATING_STARS)
+            )
+        ).group_by(Comment.product_id, Comment.rating)
+
+        products: Dict[int, Dict[str, Any]] = {}
+        for product_id, rating, count in (await db.execute(stmt)).all():
+            entry = products.setdefault(product_id, {
+                "product_id": product_id,
+                "rating_count": 0,
+                "rating_sum": 0,
+                **{f"stars_{stars}": 0 for stars in RATING_STARS},
+            })
+            entry["rating_count"] += count
+            entry["rating_sum"] += rating * count
+            entry[f"stars_{rating}"] += count
+
+        await db.execute(delete(ProductRatingSummary))
+        if products:
+            await db.execute(insert(ProductRatingSummary), list(products.values()))
+        return len(products)
+
+    @staticmethod
+    async def backfill_rating_summaries(db: AsyncSession) -> int:
+        """ Build the summaries for comments written before they existed. Called on startup """
+        summaries_exist = (await db.execute(select(ProductRatingSummary.product_id).limit(1))).first()
+        if summaries_exist:
+            return 0
+        rebuilt = await ProductRatingControllers._rebuild_summaries(db)
+        await db.commit()
+        return rebuilt
+
+    #### ============================================ ####
+    #### READ FUNCTIONS ####
+    #### ============================================ ####
+
+    @staticmethod
+    async def get_product_rating(product_id: int, db: AsyncSession) -> Dict[str, Any]:
+        """ Public : Rating summary of a product , a primary key read """
+        try:
+            stmt = select(Product.name, ProductRatingSummary).outerjoin(
+                ProductRatingSummary, ProductRatingSummary.product_id == Product.id
+            ).where(Product.id == product_id)
+            row = (await db.execute(stmt)).one_or_none()
+
+            if row is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Product not found"
+                )
+
+            name, summary = row
+            return {
+                "product_id": product_id,
+                "product_name": name,
+                **(summary.to_dict() if summary else empty_rating_summary())
+            }
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to fetch product rating: {str(e)}"
+            )
+
+    #### ============================================ ####
+    #### ADMIN FUNCTIONS ####
+    #### ============================================ ####
+
+    @staticmethod
+    async def admin_rebuild_summaries(db: AsyncSession) -> Dict[str, Any]:
+        """ Admin : Recompute the rating summaries from the comments table """
+        try:
+            products = await ProductRatingControllers._rebuild_summaries(db)
+            await db.commit()
+
+            return {
+                "message": "Product rating summaries rebuilt successfully",
+                "products": products
+            }
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to rebuild product rating summaries: {str(e)}"
+            )
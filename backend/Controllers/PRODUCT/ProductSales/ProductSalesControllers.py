@@ -0,0 +1,265 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, and_, delete, insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from fastapi import HTTPException, status
+from typing import Dict, Any, List, Optional
+from decimal import Decimal
+
+from Models.PRODUCT.ProductSales.ProductSalesModel import ProductSales
+from Models.PRODUCT.BaseProduct.BaseProductModel import Product
+from Models.ORDER.OrderModel import Order
+from Models.ORDER.OrderItemModel import OrderItem
+from Models.ORDER.ArchivedOrderModel import ArchivedOrder
+from Models.ORDER.ArchivedOrderItemModel import ArchivedOrderItem
+from Utils.Enums.Enums import OrderStatus
+
+#### Columns best sellers can be ranked by ####
+BEST_SELLER_SORTS = {
+    "quantity": ProductSales.quantity_sold,
+    "revenue": ProductSales.revenue,
+    "orders": ProductSales.order_count,
+}
+
+
+class ProductSalesControllers:
+
+    #### HELPER METHODS ####
+    #### ============================================ ####
+
+    @staticmethod
+    async def _aggregate_order_items(order_ids: List[int], db: AsyncSession) -> List[Dict[str, Any]]:
+        """ Sum order items of the given orders per product , one grouped query """
+        stmt = select(
+            OrderItem.product_id,
+            func.count(OrderItem.id),
+            func.sum(OrderItem.quantity),
+            func.sum(OrderItem.subtotal)
+        ).where(OrderItem.order_id.in_(order_ids)).group_by(OrderItem.product_id)
+        result = await db.execute(stmt)
+        return [
+            {
+                "product_id": product_id,
+                "order_count": order_count,
+                "quantity_sold": quantity or 0,
+                "revenue": Decimal(revenue or 0),
+            }
+            for product_id, order_count, quantity, revenue in result.all()
+        ]
+
+    @staticmethod
+    async def _apply_deltas(rows: List[Dict[str, Any]], sign: int, db: AsyncSession) -> None:
+        """ Add (sign=1) or subtract (sign=-1) counter rows with a single multi-row upsert """
+        if not rows:
+            return
+
+        values = [
+            {
+                "product_id": row["product_id"],
+                "order_count": sign * row["order_count"],
+                "quantity_sold": sign * row["quantity_sold"],
+                "revenue": sign * row["revenue"],
+            }
+            for row in rows
+        ]
+
+        dialect_insert = postgresql_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+        stmt = dialect_insert(ProductSales).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ProductSales.product_id],
+            set_={
+                "order_count": ProductSales.order_count + stmt.excluded.order_count,
+                "quantity_sold": ProductSales.quantity_sold + stmt.excluded.quantity_sold,
+                "revenue": ProductSales.revenue + stmt.excluded.revenue,
+                "updated_at": func.now(),
+            }
+        )
+        await db.execute(stmt)
+
+    #### ============================================ ####
+    #### COUNTER MAINTENANCE (called inside the caller's transaction, caller commits) ####
+    #### ============================================ ####
+
+    @staticmethod
+    async def record_completed_orders(order_ids: List[int], db: AsyncSession) -> None:
+        """ Add the items of newly completed orders to the counters """
+        if not order_ids:
+            return
+        rows = await ProductSalesControllers._aggregate_order_items(order_ids, db)
+        await ProductSalesControllers._apply_deltas(rows, 1, db)
+
+    @staticmethod
+    async def revert_completed_orders(order_ids: List[int], db: AsyncSession) -> None:
+        """ Take the items of orders that left the completed status back out of the counters """
+        if not order_ids:
+            return
+        rows = await ProductSalesControllers._aggregate_order_items(order_ids, db)
+        await ProductSalesControllers._apply_deltas(rows, -1, db)
+
+    @staticmethod
+    async def apply_order_status_change(
+        order_id: int,
+        old_status: OrderStatus,
+        new_status: OrderStatus,
+        db: AsyncSession
+    ) -> None:
+        """ Keep counters in sync when an order moves into or out of the completed status """
+        if old_status != OrderStatus.COMPLETED and new_status == OrderStatus.COMPLETED:
+            await ProductSalesControllers.record_completed_orders([order_id], db)
+        elif old_status == OrderStatus.COMPLETED and new_status != OrderStatus.COMPLETED:
+            await ProductSalesControllers.revert_completed_orders([order_id], db)
+
+    #### ============================================ ####
+    #### READ FUNCTIONS ####
+    #### ============================================ ####
+
+    @staticmethod
+    async def get_best_sellers(
+        limit: int = 10,
+        sort_by: str = "quantity",
+        db: AsyncSession = None
+    ) -> Dict[str, Any]:
+        """ Public : Top-N selling active products, an indexed read of the counters table """
+        try:
+            sort_column = BEST_SELLER_SORTS.get(sort_by)
+            if sort_column is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"sort_by must be one of: {', '.join(BEST_SELLER_SORTS)}"
+                )
+
+            stmt = select(
+                Product.id,
+                Product.name,
+                Product.category,
+                Product.image_url,
+                Product.price,
+                Product.discount_percentage,
+                ProductSales.order_count,
+                ProductSales.quantity_sold,
+                ProductSales.revenue,
+            ).join(
+                ProductSales, ProductSales.product_id == Product.id
+            ).where(
+                and_(Product.is_active == True, ProductSales.quantity_sold > 0)
+            ).order_by(sort_column.desc(), Product.id).limit(limit)
+
+            result = await db.execute(stmt)
+
+            best_sellers = []
+            for rank, row in enumerate(result.all(), start=1):
+                price = Decimal(row.price or 0)
+                discount = Decimal(row.discount_percentage or 0)
+                best_sellers.append({
+                    "rank": rank,
+                    "product_id": row.id,
+                    "name": row.name,
+                    "category": row.category,
+                    "image_url": row.image_url,
+                    "price": float(price),
+                    "final_price": float(price * (Decimal('1.00') - discount / Decimal('100.00'))),
+                    "order_count": row.order_count,
+                    "quantity_sold": row.quantity_sold,
+                    "revenue": float(row.revenue or 0),
+                })
+
+            return {
+                "sort_by": sort_by,
+                "limit": limit,
+                "best_sellers": best_sellers
+            }
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to fetch best sellers: {str(e)}"
+            )
+
+    @staticmethod
+    async def get_product_sales(product_id: int, db: AsyncSession) -> Optional[Dict[str, Any]]:
+        """ Product name and its counters in one query , None if the product doesn't exist """
+        stmt = select(
+            Product.name,
+            ProductSales.order_count,
+            ProductSales.quantity_sold,
+            ProductSales.revenue,
+        ).outerjoin(
+            ProductSales, ProductSales.product_id == Product.id
+        ).where(Product.id == product_id)
+
+        row = (await db.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+
+        return {
+            "product_id": product_id,
+            "product_name": row.name,
+            "times_ordered": row.order_count or 0,
+            "total_quantity_sold": row.quantity_sold or 0,
+            "total_revenue": float(row.revenue or 0),
+        }
+
+    @staticmethod
+    async def _rebuild_counters(db: AsyncSession) -> int:
+        """ Recompute every counter from completed orders (hot + archived) , caller commits """
+        totals: Dict[int, Dict[str, Any]] = {}
+        for order_model, item_model in ((Order, OrderItem), (ArchivedOrder, ArchivedOrderItem)):
+            stmt = select(
+                item_model.product_id,
+                func.count(item_model.id),
+                func.sum(item_model.quantity),
+                func.sum(item_model.subtotal)
+            ).join(
+                order_model, order_model.id == item_model.order_id
+            ).where(
+                order_model.status == OrderStatus.COMPLETED
+            ).group_by(item_model.product_id)
+
+            for product_id, order_count, quantity, revenue in (await db.execute(stmt)).all():
+                entry = totals.setdefault(product_id, {
+                    "product_id": product_id,
+                    "order_count": 0,
+                    "quantity_sold": 0,
+                    "revenue": Decimal('0.00'),
+                })
+                entry["order_count"] += order_count
+                entry["quantity_sold"] += quantity or 0
+                entry["revenue"] += Decimal(revenue or 0)
+
+        await db.execute(delete(ProductSales))
+        if totals:
+            await db.execute(insert(ProductSales), list(totals.values()))
+        return len(totals)
+
+    @staticmethod
+    async def backfill_sales_counters(db: AsyncSession) -> int:
+        """ Build the counters for orders completed before they existed. Called on startup """
+        counters_exist = (await db.execute(select(ProductSales.product_id).limit(1))).first()
+        if counters_exist:
+            return 0
+        rebuilt = await ProductSalesControllers._rebuild_counters(db)
+        await db.commit()
+        return rebuilt
+
+    #### ============================================ ####
+    #### ADMIN FUNCTIONS ####
+    #### ============================================ ####
+
+    @staticmethod
+    async def admin_rebuild_counters(db: AsyncSession) -> Dict[str, Any]:
+        """ Admin : Recompute every counter from completed orders (hot + archived) """
+        try:
+            products = await ProductSalesControllers._rebuild_counters(db)
+            await db.commit()
+
+            return {
+                "message": "Product sales counters rebuilt successfully",
+                "products": products
+            }
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to rebuild product sales counters: {str(e)}"
+            )
@@ -0,0 +1 @@
+### Product Sales Controllers __init__.py file ###
\ No newline at end of file
@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 
 from Models.PRODUCT.Salad.SaladModel import Salad
 from Schemas.PRODUCT.Salad.SaladSchemas import SaladCreate, SaladUpdate
+from Controllers.PRODUCT.ProductRating.ProductRatingControllers import ProductRatingControllers
 
 
 class SaladControllers:
@@ -15,6 +16,7 @@ class SaladControllers:
         skip: int = 0,
         limit: int = 100,
         include_inactive: bool = False,
+        sort_by: str = "newest",
         db: AsyncSession = None
     ) -> Dict[str, Any]:
         """Get all salads with pagination"""
@@ -29,7 +31,7 @@ class SaladControllers:
             count_result = await db.execute(count_stmt)
             total = count_result.scalar()
             
-            stmt = select(Salad).offset(skip).limit(limit).order_by(Salad.created_at.desc())
+            stmt = ProductRatingControllers.apply_product_sort(select(Salad), Salad, sort_by).offset(skip).limit(limit)
             if conditions:
                 stmt = stmt.where(and_(*conditions))
             
@@ -40,8 +42,11 @@ class SaladControllers:
                 "total": total,
                 "skip": skip,
                 "limit": limit,
+                "sort_by": sort_by,
                 "salads": [salad.to_dict() for salad in salads]
             }
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
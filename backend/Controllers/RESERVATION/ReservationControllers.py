@@ -1,18 +1,162 @@
+import os
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_,func
+from sqlalchemy import select, and_,func, insert, delete, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from fastapi import HTTPException, status
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, date as date_type, timedelta, timezone
+from dotenv import load_dotenv
 
 from Models.RESERVATION.ReservationModel import Reservation
+from Models.RESERVATION.ReservationSlotModel import ReservationSlot
+from Models.RESERVATION.ReservationDayCountModel import ReservationDayCount
 from Models.RESERVATION.TableModel import Table
 from Models.USER.UserModel import User
 from Schemas.RESERVATION.ReservationSchemas import ReservationCreate,ReservationUpdate
 from Utils.Enums.Enums import ReservationStatus
+from Controllers.RESERVATION.TableControllers import RESERVATION_CONFLICT_WINDOW
+from Utils.ReservationIndex.ReservationIndex import reservation_index, to_naive_utc
+
+load_dotenv()
+
+#### Slot inventory granularity : a reservation holds every slot its sitting overlaps ####
+#### (changing it only affects reservations booked afterwards) ####
+RESERVATION_INVENTORY_SLOT_MINUTES = int(os.getenv("RESERVATION_INVENTORY_SLOT_MINUTES", 15))
+
+ACTIVE_RESERVATION_STATUSES = [ReservationStatus.PENDING, ReservationStatus.CONFIRMED]
+
+#### 400 detail of a slot already taken (conflict check or slot inventory) , auto assignment retries on it ####
+SLOT_TAKEN_DETAIL = "Table is not available at the requested time"
 
 
 class ReservationControllers:
 
+    #### ============================================ ####
+    #### SLOT INVENTORY HELPERS ####
+    #### ============================================ ####
+
+    @staticmethod
+    def _occupied_slots(reservation_time: datetime) -> List[datetime]:
+        """ Slot starts covered by [reservation_time, reservation_time + sitting) , aligned to midnight """
+        slot_size = timedelta(minutes=RESERVATION_INVENTORY_SLOT_MINUTES)
+        reservation_time = to_naive_utc(reservation_time)
+        day_start = reservation_time.replace(hour=0, minute=0, second=0, microsecond=0)
+        slot_start = day_start + ((reservation_time - day_start) // slot_size) * slot_size
+        sitting_end = reservation_time + RESERVATION_CONFLICT_WINDOW
+
+        slots = []
+        while slot_start < sitting_end:
+            slots.append(slot_start)
+            slot_start += slot_size
+        return slots
+
+    @staticmethod
+    async def _claim_slots(reservation: Reservation, db: AsyncSession) -> None:
+        """
+        Insert the slot rows of a reservation in one statement.
+        Raises IntegrityError when another reservation already holds one of them.
+        """
+        await db.execute(
+            insert(ReservationSlot).values([
+                {"table_id": reservation.table_id, "slot_start": slot_start, "reservation_id": reservation.id}
+                for slot_start in ReservationControllers._occupied_slots(reservation.reservation_time)
+            ])
+        )
+
+    @staticmethod
+    async def _release_slots(reservation_id: int, db: AsyncSession) -> None:
+        await db.execute(delete(ReservationSlot).where(ReservationSlot.reservation_id == reservation_id))
+
+    @staticmethod
+    async def backfill_reservation_slots(db: AsyncSession) -> int:
+        """
+        Create slot rows for active upcoming reservations that have none yet
+        (reservations made before the slot inventory existed). Called on startup.
+        """
+        horizon = datetime.now(timezone.utc).replace(tzinfo=None) - RESERVATION_CONFLICT_WINDOW
+        stmt = select(Reservation.id, Reservation.table_id, Reservation.reservation_time).where(
+            and_(
+                Reservation.status.in_(ACTIVE_RESERVATION_STATUSES),
+                Reservation.reservation_time >= horizon,
+                ~select(ReservationSlot.id).where(ReservationSlot.reservation_id == Reservation.id).exists()
+            )
+        )
+        reservations = (await db.execute(stmt)).all()
+
+        rows = [
+            {"table_id": table_id, "slot_start": slot_start, "reservation_id": reservation_id}
+            for reservation_id, table_id, reservation_time in reservations
+            for slot_start in ReservationControllers._occupied_slots(reservation_time)
+        ]
+        if rows:
+            #### Already overlapping old reservations keep the slots of the first one ####
+            dialect_insert = postgresql_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+            for offset in range(0, len(rows), 500):
+                await db.execute(dialect_insert(ReservationSlot).values(rows[offset:offset + 500]).on_conflict_do_nothing())
+        await db.commit()
+        return len(reservations)
+
+    #### ============================================ ####
+    #### DAY BUCKETS AND COUNTERS ####
+    #### ============================================ ####
+
+    @staticmethod
+    async def _rebuild_day_counts(db: AsyncSession) -> int:
+        """ Recompute every per day counter with one grouped query , caller commits """
+        stmt = select(
+            Reservation.reservation_date,
+            Reservation.status,
+            func.count(Reservation.id),
+            func.sum(Reservation.number_of_guests)
+        ).where(Reservation.reservation_date.is_not(None)).group_by(Reservation.reservation_date, Reservation.status)
+
+        days: Dict[Any, Dict[str, Any]] = {}
+        for reservation_date, reservation_status, count, guests in (await db.execute(stmt)).all():
+            entry = days.setdefault(reservation_date, {
+                "reservation_date": reservation_date,
+                "total": 0,
+                "pending": 0,
+                "confirmed": 0,
+                "cancelled": 0,
+                "guests": 0,
+            })
+            entry["total"] += count
+            entry[reservation_status.value] += count
+            if reservation_status != ReservationStatus.CANCELLED:
+                entry["guests"] += guests or 0
+
+        await db.execute(delete(ReservationDayCount))
+        if days:
+            await db.execute(insert(ReservationDayCount), list(days.values()))
+        return len(days)
+
+    @staticmethod
+    async def backfill_reservation_days(db: AsyncSession) -> int:
+        """
+        Fill reservation_date of rows written before the column existed and rebuild the
+        per day counters when they are missing. Called on startup.
+        """
+        result = await db.execute(
+            update(Reservation).where(
+                Reservation.reservation_date.is_(None)
+            ).values(
+                reservation_date=func.date(Reservation.reservation_time)
+            ).execution_options(synchronize_session=False)
+        )
+        backfilled = result.rowcount or 0
+
+        counters_exist = (await db.execute(select(ReservationDayCount.reservation_date).limit(1))).first()
+        if backfilled or not counters_exist:
+            await ReservationControllers._rebuild_day_counts(db)
+        await db.commit()
+        return backfilled
+
+    #### ============================================ ####
+    #### USER FUNCTIONS ####
+    #### ============================================ ####
+
     @staticmethod
     async def create_new_reservation(
         current_user: User,
@@ -57,22 +201,25 @@ class ReservationControllers:
             if not is_available:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Table is not available at the requested time"
+                    detail=SLOT_TAKEN_DETAIL
                 )
             
-            #### Create reservation ####
+            #### Create reservation and claim its slots in the same transaction ####
             new_reservation = Reservation(
                 user_id=current_user.id,
                 table_id=reservation_data.table_id,
-                reservation_time=reservation_data.reservation_time,
+                reservation_time=to_naive_utc(reservation_data.reservation_time),
                 number_of_guests=reservation_data.number_of_guests,
                 special_requests=reservation_data.special_requests,
                 status=ReservationStatus.PENDING
             )
             
             db.add(new_reservation)
+            await db.flush()
+            await ReservationControllers._claim_slots(new_reservation, db)
             await db.commit()
             await db.refresh(new_reservation)
+            reservation_index.sync(new_reservation)
             
             return {
                 "message": "Reservation created successfully",
@@ -80,6 +227,13 @@ class ReservationControllers:
             }
         except HTTPException:
             raise
+        except IntegrityError:
+            #### A concurrent booking took one of the slots between the check and the insert ####
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=SLOT_TAKEN_DETAIL
+            )
         except Exception as e:
             await db.rollback()
             raise HTTPException(
@@ -95,12 +249,20 @@ class ReservationControllers:
         exclude_reservation_id: int = None
     ) -> bool:
         """
-        Check if time slot is available (2-hour time window).
+        Check if time slot is available (RESERVATION_SITTING_MINUTES time window).
         """
         try:
-            #### Define time window (2 hours before and after) ####
-            window_start = reservation_time - timedelta(hours=2)
-            window_end = reservation_time + timedelta(hours=2)
+            #### Define time window (sitting duration before and after) ####
+            window_start = reservation_time - RESERVATION_CONFLICT_WINDOW
+            window_end = reservation_time + RESERVATION_CONFLICT_WINDOW
+            
+            #### A miss in the in-memory index is trusted (bookings made by other processes are still ####
+            #### stopped by the slot inventory) , a hit is confirmed below : the reservation may have ####
+            #### been cancelled or moved by another process since the last index refresh ####
+            if reservation_index.covers(window_start) and not reservation_index.has_conflict(
+                table_id, window_start, window_end, exclude_reservation_id
+            ):
+                return True
             
             #### query conditions ####
             conditions = [
@@ -114,9 +276,10 @@ class ReservationControllers:
             if exclude_reservation_id:
                 conditions.append(Reservation.id != exclude_reservation_id)
             
-            stmt = select(Reservation).where(and_(*conditions))
+            #### Any single conflict is enough ####
+            stmt = select(Reservation.id).where(and_(*conditions)).limit(1)
             result = await db.execute(stmt)
-            conflicting = result.scalar_one_or_none()
+            conflicting = result.first()
             
             return conflicting is None
         except Exception:
@@ -199,16 +362,25 @@ class ReservationControllers:
                 if not is_available:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Table is not available at the requested time"
+                        detail=SLOT_TAKEN_DETAIL
                     )
             
             #### Update fields ####
             update_dict = update_data.model_dump(exclude_unset=True)
+            if update_dict.get("reservation_time"):
+                update_dict["reservation_time"] = to_naive_utc(update_dict["reservation_time"])
             for key, value in update_dict.items():
                 setattr(reservation, key, value)
             
+            #### Move the slot rows along with the reservation ####
+            if {"reservation_time", "table_id", "status"} & update_dict.keys():
+                await ReservationControllers._release_slots(reservation.id, db)
+                if reservation.status in ACTIVE_RESERVATION_STATUSES:
+                    await ReservationControllers._claim_slots(reservation, db)
+            
             await db.commit()
             await db.refresh(reservation)
+            reservation_index.sync(reservation)
             
             return {
                 "message": "Reservation updated successfully",
@@ -216,6 +388,12 @@ class ReservationControllers:
             }
         except HTTPException:
             raise
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=SLOT_TAKEN_DETAIL
+            )
         except Exception as e:
             await db.rollback()
             raise HTTPException(
@@ -258,7 +436,9 @@ class ReservationControllers:
                 )
             
             reservation.status = ReservationStatus.CANCELLED
+            await ReservationControllers._release_slots(reservation.id, db)
             await db.commit()
+            reservation_index.sync(reservation)
             
             return {"message": "Reservation cancelled successfully"}
         except HTTPException:
@@ -413,6 +593,7 @@ class ReservationControllers:
             reservation.status = ReservationStatus.CONFIRMED
             await db.commit()
             await db.refresh(reservation)
+            reservation_index.sync(reservation)
             
             return {
                 "message": "Reservation confirmed successfully",
@@ -436,15 +617,9 @@ class ReservationControllers:
         Admin : Get all reservations for a specific date
         """
         try:
-            #### Get start and end of day ####
-            start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_of_day = date.replace(hour=23, minute=59, second=59, microsecond=999999)
-            
+            #### Day bucket lookup , served by the (reservation_date, status) index ####
             stmt = select(Reservation).where(
-                and_(
-                    Reservation.reservation_time >= start_of_day,
-                    Reservation.reservation_time <= end_of_day
-                )
+                Reservation.reservation_date == date.date()
             ).order_by(Reservation.reservation_time)
             
             result = await db.execute(stmt)
@@ -469,11 +644,14 @@ class ReservationControllers:
             now = datetime.now(timezone.utc)
             end_date = now + timedelta(days=days)
             
+            #### Date bucket range narrows the scan , the time bounds trim the first and last day ####
             stmt = select(Reservation).where(
                 and_(
-                    Reservation.reservation_time >= now,
-                    Reservation.reservation_time <= end_date,
-                    Reservation.status.in_([ReservationStatus.PENDING, ReservationStatus.CONFIRMED])
+                    Reservation.reservation_date >= now.date(),
+                    Reservation.reservation_date <= end_date.date(),
+                    Reservation.status.in_(ACTIVE_RESERVATION_STATUSES),
+                    Reservation.reservation_time >= now.replace(tzinfo=None),
+                    Reservation.reservation_time <= end_date.replace(tzinfo=None)
                 )
             ).order_by(Reservation.reservation_time)
             
@@ -493,49 +671,39 @@ class ReservationControllers:
         Admin: Get reservation statistics
         """
         try:
-            #### Total reservations ####
-            total_stmt = select(func.count(Reservation.id))
-            total_result = await db.execute(total_stmt)
-            total = total_result.scalar()
-            
-            #### By status ####
-            pending_stmt = select(func.count(Reservation.id)).where(Reservation.status == ReservationStatus.PENDING)
-            pending_result = await db.execute(pending_stmt)
-            pending = pending_result.scalar()
-            
-            confirmed_stmt = select(func.count(Reservation.id)).where(Reservation.status == ReservationStatus.CONFIRMED)
-            confirmed_result = await db.execute(confirmed_stmt)
-            confirmed = confirmed_result.scalar()
-            
-            cancelled_stmt = select(func.count(Reservation.id)).where(Reservation.status == ReservationStatus.CANCELLED)
-            cancelled_result = await db.execute(cancelled_stmt)
-            cancelled = cancelled_result.scalar()
-            
-            #### Upcoming reservations (for next 7 days) ####
-            now = datetime.now(timezone.utc)
-            upcoming_end = now + timedelta(days=7)
-            upcoming_stmt = select(func.count(Reservation.id)).where(
+            #### Totals by status : one aggregate over the per day counters ####
+            totals_stmt = select(
+                func.coalesce(func.sum(ReservationDayCount.total), 0),
+                func.coalesce(func.sum(ReservationDayCount.pending), 0),
+                func.coalesce(func.sum(ReservationDayCount.confirmed), 0),
+                func.coalesce(func.sum(ReservationDayCount.cancelled), 0)
+            )
+            total, pending, confirmed, cancelled = (await db.execute(totals_stmt)).one()
+            
+            #### Today and the next 7 days from the counters of those days ####
+            today = datetime.now(timezone.utc).date()
+            days_stmt = select(
+                ReservationDayCount.reservation_date,
+                ReservationDayCount.pending + ReservationDayCount.confirmed
+            ).where(
                 and_(
-                    Reservation.reservation_time >= now,
-                    Reservation.reservation_time <= upcoming_end,
-                    Reservation.status.in_([ReservationStatus.PENDING, ReservationStatus.CONFIRMED])
+                    ReservationDayCount.reservation_date >= today,
+                    ReservationDayCount.reservation_date <= today + timedelta(days=7)
                 )
             )
-            upcoming_result = await db.execute(upcoming_stmt)
-            upcoming = upcoming_result.scalar()
+            active_by_day = dict((await db.execute(days_stmt)).all())
+            today_count = active_by_day.get(today, 0)
             
-            #### Today's reservations ####
-            start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_of_day = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-            today_stmt = select(func.count(Reservation.id)).where(
+            #### Upcoming : the rest of today (one indexed bucket query) plus the next 7 calendar days ####
+            rest_of_today_stmt = select(func.count(Reservation.id)).where(
                 and_(
-                    Reservation.reservation_time >= start_of_day,
-                    Reservation.reservation_time <= end_of_day,
-                    Reservation.status.in_([ReservationStatus.PENDING, ReservationStatus.CONFIRMED])
+                    Reservation.reservation_date == today,
+                    Reservation.status.in_(ACTIVE_RESERVATION_STATUSES),
+                    Reservation.reservation_time >= datetime.now(timezone.utc).replace(tzinfo=None)
                 )
             )
-            today_result = await db.execute(today_stmt)
-            today = today_result.scalar()
+            rest_of_today = (await db.execute(rest_of_today_stmt)).scalar()
+            upcoming = rest_of_today + sum(count for day, count in active_by_day.items() if day != today)
             
             return {
                 "total_reservations": total,
@@ -545,10 +713,63 @@ class ReservationControllers:
                     "cancelled": cancelled
                 },
                 "upcoming_7_days": upcoming,
-                "today": today
+                "today": today_count
             }
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to fetch statistics: {str(e)}"
-            )
\ No newline at end of file
+            )
+
+    @staticmethod
+    async def get_day_counts(
+        start_date: date_type,
+        end_date: date_type,
+        db: AsyncSession
+    ) -> List[Dict[str, Any]]:
+        """
+        Admin : Per day reservation counters between two dates (inclusive)
+        """
+        try:
+            if end_date < start_date:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="end_date must be on or after start_date"
+                )
+            
+            stmt = select(ReservationDayCount).where(
+                and_(
+                    ReservationDayCount.reservation_date >= start_date,
+                    ReservationDayCount.reservation_date <= end_date
+                )
+            ).order_by(ReservationDayCount.reservation_date)
+            result = await db.execute(stmt)
+            
+            return [day.to_dict() for day in result.scalars().all()]
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to fetch reservation day counts: {str(e)}"
+            )
+
+    @staticmethod
+    async def admin_rebuild_day_counts(db: AsyncSession) -> Dict[str, Any]:
+        """
+        Admin : Recompute the per day counters from the reservations table
+        """
+        try:
+            days = await ReservationControllers._rebuild_day_counts(db)
+            await db.commit()
+            
+            return {
+                "message": "Reservation day counters rebuilt successfully",
+                "days": days
+            }
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to rebuild reservation day counters: {str(e)}"
+            )
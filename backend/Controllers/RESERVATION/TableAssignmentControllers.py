@@ -0,0 +1,273 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, and_
+from sqlalchemy.exc import IntegrityError
+from fastapi import HTTPException, status
+from typing import List, Dict, Any, Optional
+from datetime import datetime
+
+from Models.RESERVATION.TableModel import Table
+from Models.RESERVATION.ReservationModel import Reservation
+from Models.USER.UserModel import User
+from Schemas.RESERVATION.ReservationSchemas import ReservationCreate, PartyRequest
+from Controllers.RESERVATION.TableControllers import TableControllers, RESERVATION_CONFLICT_WINDOW
+from Controllers.RESERVATION.ReservationControllers import ReservationControllers, ACTIVE_RESERVATION_STATUSES, SLOT_TAKEN_DETAIL
+from Utils.ReservationIndex.ReservationIndex import reservation_index, to_naive_utc
+from Utils.Enums.Enums import ReservationStatus, TableLocation
+
+#### How many best-fit tables a booking tries when the first one is taken meanwhile ####
+AUTO_ASSIGN_ATTEMPTS = 3
+
+
+def _fit_key(table, party_size: int, location: Optional[TableLocation]):
+    """ Best fit : fewest empty seats first , then the preferred location , then table number """
+    return (table.capacity - party_size, location is not None and table.location != location, table.table_number)
+
+
+def _table_dict(table, party_size: int) -> Dict[str, Any]:
+    return {
+        "table_id": table.id,
+        "table_number": table.table_number,
+        "capacity": table.capacity,
+        "location": table.location.value,
+        "empty_seats": table.capacity - party_size
+    }
+
+
+class TableAssignmentControllers:
+
+    #### ============================================ ####
+    #### SINGLE PARTY ####
+    #### ============================================ ####
+
+    @staticmethod
+    async def _ranked_free_tables(
+        party_size: int,
+        reservation_time: datetime,
+        location: Optional[TableLocation],
+        db: AsyncSession
+    ) -> List[Any]:
+        """ Tables big enough and free at reservation_time , best fit first (one query) """
+        reservation_time = to_naive_utc(reservation_time)
+        stmt = select(
+            Table.id,
+            Table.table_number,
+            Table.capacity,
+            Table.location
+        ).where(
+            and_(
+                Table.is_available == True,
+                Table.capacity >= party_size,
+                ~TableControllers._conflicting_reservation_exists(
+                    reservation_time - RESERVATION_CONFLICT_WINDOW,
+                    reservation_time + RESERVATION_CONFLICT_WINDOW
+                )
+            )
+        )
+        tables = (await db.execute(stmt)).all()
+        return sorted(tables, key=lambda table: _fit_key(table, party_size, location))
+
+    @staticmethod
+    async def suggest_tables(
+        party_size: int,
+        reservation_time: datetime,
+        location: Optional[str] = None,
+        limit: int = 5,
+        db: AsyncSession = None
+    ) -> Dict[str, Any]:
+        """ Public : Best fitting free tables for a party """
+        try:
+            location_enum = None
+            if location:
+                try:
+                    location_enum = TableLocation(location.lower())
+                except ValueError:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Invalid location. Must be one of: {[loc.value for loc in TableLocation]}"
+                    )
+
+            tables = await TableAssignmentControllers._ranked_free_tables(party_size, reservation_time, location_enum, db)
+
+            return {
+                "party_size": party_size,
+                "reservation_time": reservation_time.isoformat(),
+                "tables": [_table_dict(table, party_size) for table in tables[:limit]]
+            }
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to suggest tables: {str(e)}"
+            )
+
+    @staticmethod
+    async def book_best_table(current_user: User, party: PartyRequest, db: AsyncSession) -> Dict[str, Any]:
+        """
+        User : Reserve the best fitting free table for a party.
+        When a concurrent booking takes the chosen table , the next best one is tried.
+        """
+        tables = await TableAssignmentControllers._ranked_free_tables(
+            party.number_of_guests, party.reservation_time, party.location, db
+        )
+        if not tables:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No table is available for this party at the requested time"
+            )
+
+        for table in tables[:AUTO_ASSIGN_ATTEMPTS]:
+            try:
+                return await ReservationControllers.create_new_reservation(
+                    current_user,
+                    ReservationCreate(
+                        table_id=table.id,
+                        reservation_time=party.reservation_time,
+                        number_of_guests=party.number_of_guests,
+                        special_requests=party.special_requests
+                    ),
+                    db
+                )
+            except HTTPException as e:
+                #### only a slot taken meanwhile moves on to the next table , other errors apply to every table ####
+                if e.status_code != status.HTTP_400_BAD_REQUEST or e.detail != SLOT_TAKEN_DETAIL:
+                    raise
+
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Tables were booked meanwhile, please try again"
+        )
+
+    #### ============================================ ####
+    #### BATCH MODE (event bookings) ####
+    #### ============================================ ####
+
+    @staticmethod
+    async def admin_assign_batch(
+        current_user: User,
+        parties: List[PartyRequest],
+        create_reservations: bool,
+        db: AsyncSession
+    ) -> Dict[str, Any]:
+        """
+        Admin : Seat many parties at once.
+        Best-fit decreasing : the largest parties are placed first, each on the free table
+        that leaves the fewest empty seats. Existing reservations are read with one query
+        and the batch's own placements block their tables in memory.
+        With create_reservations the placements are booked in a single transaction.
+        """
+        try:
+            times = [to_naive_utc(party.reservation_time) for party in parties]
+
+            tables = (await db.execute(
+                select(Table.id, Table.table_number, Table.capacity, Table.location).where(Table.is_available == True)
+            )).all()
+
+            #### Busy times and inventory slots per table around the batch (one query) ####
+            busy: Dict[int, List[datetime]] = {table.id: [] for table in tables}
+            busy_slots: Dict[int, set] = {table.id: set() for table in tables}
+            reservations_stmt = select(Reservation.table_id, Reservation.reservation_time).where(
+                and_(
+                    Reservation.status.in_(ACTIVE_RESERVATION_STATUSES),
+                    Reservation.reservation_time >= min(times) - RESERVATION_CONFLICT_WINDOW,
+                    Reservation.reservation_time <= max(times) + RESERVATION_CONFLICT_WINDOW
+                )
+            )
+            for table_id, reservation_time in (await db.execute(reservations_stmt)).all():
+                if table_id in busy:
+                    busy[table_id].append(reservation_time)
+                    busy_slots[table_id].update(ReservationControllers._occupied_slots(reservation_time))
+
+            #### Same rules as a single booking : the conflict window and the slot inventory ####
+            party_slots = [set(ReservationControllers._occupied_slots(at)) for at in times]
+
+            def is_free(table_id: int, index: int) -> bool:
+                return (
+                    busy_slots[table_id].isdisjoint(party_slots[index])
+                    and all(abs(times[index] - taken) > RESERVATION_CONFLICT_WINDOW for taken in busy[table_id])
+                )
+
+            placements: List[Optional[Any]] = [None] * len(parties)
+            order = sorted(range(len(parties)), key=lambda index: (-parties[index].number_of_guests, times[index]))
+            for index in order:
+                party = parties[index]
+                candidates = [
+                    table for table in tables
+                    if table.capacity >= party.number_of_guests and is_free(table.id, index)
+                ]
+                if not candidates:
+                    continue
+                best = min(candidates, key=lambda table: _fit_key(table, party.number_of_guests, party.location))
+                placements[index] = best
+                busy[best.id].append(times[index])
+                busy_slots[best.id].update(party_slots[index])
+
+            #### Optionally book the placements ####
+            created: List[Reservation] = []
+            if create_reservations:
+                for index, table in enumerate(placements):
+                    if table is None:
+                        continue
+                    reservation = Reservation(
+                        user_id=current_user.id,
+                        table_id=table.id,
+                        reservation_time=times[index],
+                        number_of_guests=parties[index].number_of_guests,
+                        special_requests=parties[index].special_requests,
+                        status=ReservationStatus.PENDING
+                    )
+                    db.add(reservation)
+                    created.append(reservation)
+                await db.flush()
+                for reservation in created:
+                    await ReservationControllers._claim_slots(reservation, db)
+                await db.commit()
+                for reservation in created:
+                    reservation_index.sync(reservation)
+
+            #### Results in request order ####
+            assignments = []
+            seated_guests = 0
+            seats_used = 0
+            reservation_ids = iter(reservation.id for reservation in created)
+            for index, table in enumerate(placements):
+                party = parties[index]
+                entry = {
+                    "index": index,
+                    "number_of_guests": party.number_of_guests,
+                    "reservation_time": times[index].isoformat(),
+                    "table": _table_dict(table, party.number_of_guests) if table else None
+                }
+                if table:
+                    seated_guests += party.number_of_guests
+                    seats_used += table.capacity
+                    if create_reservations:
+                        entry["reservation_id"] = next(reservation_ids)
+                assignments.append(entry)
+
+            total_guests = sum(party.number_of_guests for party in parties)
+            return {
+                "assignments": assignments,
+                "summary": {
+                    "parties": len(parties),
+                    "seated_parties": sum(1 for table in placements if table),
+                    "total_guests": total_guests,
+                    "seated_guests": seated_guests,
+                    "seat_utilization": round(seated_guests / seats_used, 3) if seats_used else 0.0
+                },
+                "reservations_created": len(created)
+            }
+        except HTTPException:
+            raise
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Tables were booked meanwhile, please run the assignment again"
+            )
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to assign tables: {str(e)}"
+            )
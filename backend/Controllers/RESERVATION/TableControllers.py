@@ -1,8 +1,10 @@
+import os
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
 from fastapi import HTTPException, status
 from typing import List, Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, date, time
+from dotenv import load_dotenv
 
 from Models.RESERVATION.TableModel import Table
 from Models.RESERVATION.ReservationModel import Reservation
@@ -12,6 +14,17 @@ from Utils.Enums.Enums import TableLocation
 
 from datetime import timedelta
 
+load_dotenv()
+
+#### A reservation blocks its table RESERVATION_SITTING_MINUTES before and after its time ####
+RESERVATION_SITTING_MINUTES = int(os.getenv("RESERVATION_SITTING_MINUTES", 120))
+RESERVATION_CONFLICT_WINDOW = timedelta(minutes=RESERVATION_SITTING_MINUTES)
+
+#### Availability grid : slot size and service hours of a day ####
+RESERVATION_SLOT_MINUTES = int(os.getenv("RESERVATION_SLOT_MINUTES", 30))
+RESERVATION_OPENING_TIME = time.fromisoformat(os.getenv("RESERVATION_OPENING_TIME", "10:00"))
+RESERVATION_CLOSING_TIME = time.fromisoformat(os.getenv("RESERVATION_CLOSING_TIME", "23:00"))
+
 
 
 class TableControllers:
@@ -112,20 +125,21 @@ class TableControllers:
                         detail=f"Invalid location. Must be one of: {[loc.value for loc in TableLocation]}"
                     )
             
-            stmt = select(Table).where(and_(*conditions)).order_by(Table.table_number)
-            result = await db.execute(stmt)
-            tables = result.scalars().all()
-            
-            #### If datetime is provided , filter by availability ####
+            #### If datetime is provided , drop tables with a conflicting reservation in the same query ####
             if date_time:
-                available_tables = []
-                for table in tables:
-                    is_available = await TableControllers._check_table_availability(
-                        table.id, date_time, db
-                    )
-                    if is_available:
-                        available_tables.append(table)
-                tables = available_tables
+                conditions.append(~TableControllers._conflicting_reservation_exists(
+                    date_time - RESERVATION_CONFLICT_WINDOW,
+                    date_time + RESERVATION_CONFLICT_WINDOW
+                ))
+            
+            stmt = select(
+                Table.id,
+                Table.table_number,
+                Table.capacity,
+                Table.location,
+                Table.is_available
+            ).where(and_(*conditions)).order_by(Table.table_number)
+            result = await db.execute(stmt)
             
             return [
                 {
@@ -135,7 +149,7 @@ class TableControllers:
                     "location": table.location.value,
                     "is_available": table.is_available
                 }
-                for table in tables
+                for table in result.all()
             ]
         except HTTPException:
             raise
@@ -146,35 +160,119 @@ class TableControllers:
             )
 
     @staticmethod
-    async def _check_table_availability(
-        table_id: int,
-        reservation_time: datetime,
-        db: AsyncSession
-    ) -> bool:
+    async def get_availability_grid(
+        day: date,
+        slot_minutes: Optional[int] = None,
+        min_capacity: Optional[int] = None,
+        location: Optional[str] = None,
+        db: AsyncSession = None
+    ) -> Dict[str, Any]:
         """
-        Helper: Check if table is available at specific time.
-        2-hour reservation time window.
+        Slots x tables availability matrix of a service day.
+        Every active reservation of the day is read once and marks the slots it blocks
+        in a per-table bitset (bit i = slot i is taken).
         """
         try:
-            #### Define time window (2 hours) ####
-            window_start = reservation_time - timedelta(hours=2)
-            window_end = reservation_time + timedelta(hours=2)
-            
-            #### Check for conflicting reservations ####
-            stmt = select(Reservation).where(
-                and_(
-                    Reservation.table_id == table_id,
-                    Reservation.status.in_([ReservationStatus.PENDING, ReservationStatus.CONFIRMED]),
-                    Reservation.reservation_time >= window_start,
-                    Reservation.reservation_time <= window_end
+            slot_minutes = slot_minutes or RESERVATION_SLOT_MINUTES
+            slot_size = timedelta(minutes=slot_minutes)
+
+            #### Build the slot list between opening and closing time ####
+            first_slot = datetime.combine(day, RESERVATION_OPENING_TIME)
+            closing = datetime.combine(day, RESERVATION_CLOSING_TIME)
+            if closing <= first_slot:
+                closing += timedelta(days=1)
+            slot_count = int((closing - first_slot) / slot_size)
+            slots = [first_slot + index * slot_size for index in range(slot_count)]
+
+            conditions = [Table.is_available == True]
+            if min_capacity:
+                conditions.append(Table.capacity >= min_capacity)
+            if location:
+                try:
+                    conditions.append(Table.location == TableLocation(location.lower()))
+                except ValueError:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Invalid location. Must be one of: {[loc.value for loc in TableLocation]}"
+                    )
+
+            tables_stmt = select(
+                Table.id,
+                Table.table_number,
+                Table.capacity,
+                Table.location
+            ).where(and_(*conditions)).order_by(Table.table_number)
+            tables = (await db.execute(tables_stmt)).all()
+
+            #### One query for every reservation that can block a slot of the day ####
+            taken = {table.id: 0 for table in tables}
+            if slots and taken:
+                reservations_stmt = select(
+                    Reservation.table_id,
+                    Reservation.reservation_time
+                ).join(
+                    Table, Table.id == Reservation.table_id
+                ).where(
+                    and_(
+                        *conditions,
+                        Reservation.status.in_([ReservationStatus.PENDING, ReservationStatus.CONFIRMED]),
+                        Reservation.reservation_time >= first_slot - RESERVATION_CONFLICT_WINDOW,
+                        Reservation.reservation_time <= slots[-1] + RESERVATION_CONFLICT_WINDOW
+                    )
                 )
+
+                #### A reservation at r blocks every slot s with |s - r| <= sitting window ####
+                for table_id, reservation_time in (await db.execute(reservations_stmt)).all():
+                    low = max(0, -((first_slot - (reservation_time - RESERVATION_CONFLICT_WINDOW)) // slot_size))
+                    high = min(slot_count - 1, (reservation_time + RESERVATION_CONFLICT_WINDOW - first_slot) // slot_size)
+                    if low <= high:
+                        taken[table_id] |= ((1 << (high - low + 1)) - 1) << low
+
+            free_per_slot = [0] * slot_count
+            table_rows = []
+            for table in tables:
+                mask = taken[table.id]
+                available = [not (mask >> index) & 1 for index in range(slot_count)]
+                for index, is_free in enumerate(available):
+                    free_per_slot[index] += is_free
+                table_rows.append({
+                    "id": table.id,
+                    "table_number": table.table_number,
+                    "capacity": table.capacity,
+                    "location": table.location.value,
+                    "available": available
+                })
+
+            return {
+                "date": day.isoformat(),
+                "slot_minutes": slot_minutes,
+                "sitting_minutes": RESERVATION_SITTING_MINUTES,
+                "slots": [slot.isoformat() for slot in slots],
+                "free_tables_per_slot": free_per_slot,
+                "tables": table_rows
+            }
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to build availability grid: {str(e)}"
             )
-            result = await db.execute(stmt)
-            conflicting = result.scalar_one_or_none()
-            
-            return conflicting is None
-        except Exception:
-            return False
+
+    @staticmethod
+    def _conflicting_reservation_exists(window_start: datetime, window_end: datetime):
+        """
+        Helper: EXISTS clause for an active reservation on the outer Table row inside the window.
+        Served by the (table_id, reservation_time) index on reservations.
+        """
+        return select(Reservation.id).where(
+            and_(
+                Reservation.table_id == Table.id,
+                Reservation.reservation_time >= window_start,
+                Reservation.reservation_time <= window_end,
+                Reservation.status.in_([ReservationStatus.PENDING, ReservationStatus.CONFIRMED])
+            )
+        ).exists()
 
     @staticmethod
     async def add_new_table(table_data: TableCreate, db: AsyncSession) -> Dict[str, Any]:
@@ -1,25 +1,118 @@
+import uuid
+import asyncio
+import logging
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_
+from sqlalchemy import select, func, or_, update, insert
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone, timedelta
 
+from Database.Database import AsyncSessionLocal
 from Models.USER.UserModel import User
-from Schemas.USER.UserSchemas import UserRegister,UserLogin,AdminCreateUser,AdminUpdateUser,UserProfileUpdate
-from Utils.Auth.JWT import create_access_token,create_refresh_token,decode_access_token,decode_refresh_token,TokenExpiredError,TokenInvalidError
-from Utils.Auth.HashPassword import get_password_hash,verify_password
+from Schemas.USER.UserSchemas import UserRegister,UserLogin,AdminCreateUser,AdminBulkCreateUsers,AdminUpdateUser,UserProfileUpdate
+from Utils.Auth.JWT import create_access_token,create_refresh_token,decode_access_token,decode_refresh_token,forget_access_token,TokenError,TokenExpiredError,TokenInvalidError
+from Utils.Auth.TokenRevocation import find_recent_rotation,is_token_revoked,issued_before_logout,logout_everywhere_time,revoke_token,rotation_time
+from Utils.Auth.HashPassword import get_password_hash_async,get_password_hashes_async,verify_password_async,password_needs_rehash
+from Utils.Auth.PrincipalCache import cache_principal,get_cached_principal,invalidate_principal
 from Utils.Enums.Enums import UserRole
+from Utils.Search.UserSearch import apply_user_search,typeahead_cache,TYPEAHEAD_MIN_LENGTH,TYPEAHEAD_MAX_RESULTS
 
 from Models.CART.CartModel import Cart
 from Models.CART.CartItemModel import CartItem
 from Models.PRODUCT.FavouriteProduct.FavouriteProductModel import FavouriteProduct
+from Models.ORDER.OrderModel import Order
+from Models.ORDER.ArchivedOrderModel import ArchivedOrder
+from Controllers.ORDER.OrderArchiveControllers import OrderArchiveControllers
+from Models.COMMENT.CommentModel import Comment
+from Models.RESERVATION.ReservationModel import Reservation
+from Models.PAYMENT.PaymentModel import Payment
 from Utils.Enums.Enums import ReservationStatus, OrderStatus
 
+logger = logging.getLogger(__name__)
+
 # OAuth2 scheme for token
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+#### running background password hash upgrades (asyncio only keeps weak references to tasks) ####
+_rehash_tasks = set()
+
+
+#### Admin user listings : user columns plus per user counts as correlated subqueries , ####
+#### one query per page instead of User.to_dict loading every relationship of every user ####
+def _count_per_user(model, user_id_column, *conditions):
+    return select(func.count()).select_from(model).where(
+        user_id_column == User.id, *conditions
+    ).correlate(User).scalar_subquery()
+
+
+USER_LISTING_COUNTS = {
+    "favourite_products_count": _count_per_user(FavouriteProduct, FavouriteProduct.user_id),
+    #### hot orders plus the ones moved to orders_archive ####
+    "orders_count": _count_per_user(Order, Order.user_id) + _count_per_user(ArchivedOrder, ArchivedOrder.user_id),
+    "comments_count": _count_per_user(Comment, Comment.user_id),
+    "reservations_count": _count_per_user(Reservation, Reservation.user_id),
+    "payments_count": _count_per_user(Payment, Payment.user_id),
+}
+
+
+#### Profile sub-resources : name -> (listed value , user id column , newest first column , filters) ####
+#### cancelled orders / reservations are left out of the profile ####
+PROFILE_SUB_RESOURCES = {
+    "favourite_products": (FavouriteProduct.product_id, FavouriteProduct.user_id, FavouriteProduct.id, ()),
+    "orders": (Order.id, Order.user_id, Order.id, (Order.status != OrderStatus.CANCELLED,)),
+    "comments": (Comment.id, Comment.user_id, Comment.id, ()),
+    "reservations": (Reservation.id, Reservation.user_id, Reservation.id, (Reservation.status != ReservationStatus.CANCELLED,)),
+    "payments": (Payment.id, Payment.user_id, Payment.id, ()),
+}
+
+PROFILE_COUNTS = {
+    f"{name}_count": _count_per_user(value.class_, user_id_column, *conditions)
+    for name, (value, user_id_column, newest_first, conditions) in PROFILE_SUB_RESOURCES.items()
+}
+#### orders moved to orders_archive still belong to the profile , counted and paged over both tables ####
+PROFILE_COUNTS["orders_count"] = PROFILE_COUNTS["orders_count"] + _count_per_user(
+    ArchivedOrder, ArchivedOrder.user_id, ArchivedOrder.status != OrderStatus.CANCELLED
+)
+
+
+def user_listing_select():
+    """ SELECT of the admin listing columns , callers add filters / order / paging """
+    return select(
+        User.id,
+        User.username,
+        User.email,
+        User.image_url,
+        User.is_active,
+        User.role,
+        User.phone,
+        User.address,
+        User.created_at,
+        User.updated_at,
+        User.deleted_at,
+        *(count.label(key) for key, count in USER_LISTING_COUNTS.items()),
+        select(Cart.id).where(Cart.user_id == User.id).correlate(User).scalar_subquery().label("cart_id")
+    )
+
+
+def user_listing_dict(row) -> Dict[str, Any]:
+    return {
+        "id": row.id,
+        "username": row.username,
+        "email": row.email,
+        "image_url": row.image_url,
+        "is_active": row.is_active,
+        "role": row.role.value if row.role else None,
+        "phone": row.phone,
+        "address": row.address,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+        "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+        "deleted_at": row.deleted_at.isoformat() if row.deleted_at else None,
+        **{key: row._mapping[key] for key in USER_LISTING_COUNTS},
+        "cart_id": row.cart_id,
+    }
+
 
 class UserControllers:
     ######################
@@ -54,8 +147,8 @@ class UserControllers:
                     detail="Email already registered"
                 )
 
-            #### Hash password #### comes from Utils folder ####
-            hashed_password = get_password_hash(user_data.password)
+            #### Hash password #### comes from Utils folder (password pool , off the event loop) ####
+            hashed_password = await get_password_hash_async(user_data.password)
             
             #### Create new user ####
             new_user = User(
@@ -108,8 +201,8 @@ class UserControllers:
                     detail="Incorrect username or password"
                 )
 
-            #### Verify password #### comes from Utils folder ####
-            if not verify_password(credentials.password, user.hashed_password):
+            #### Verify password #### comes from Utils folder (password pool , off the event loop) ####
+            if not await verify_password_async(credentials.password, user.hashed_password):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Incorrect username or password"
@@ -122,6 +215,14 @@ class UserControllers:
                     detail="Account is deactivated"
                 )
             
+            #### Hash made with an older scheme / cost : upgraded in the background , login is not delayed ####
+            if password_needs_rehash(user.hashed_password):
+                task = asyncio.create_task(
+                    UserControllers.upgrade_password_hash(user.id, user.username, credentials.password, user.hashed_password)
+                )
+                _rehash_tasks.add(task)
+                task.add_done_callback(_rehash_tasks.discard)
+            
             #### Create tokens #### comes from Utils folder ####
             token_data = {
                 "sub": user.username,
@@ -152,12 +253,81 @@ class UserControllers:
             )
 
     @staticmethod
-    async def logout_user() -> Dict[str, str]:
+    async def upgrade_password_hash(user_id: int, username: str, password: str, old_hash: str) -> bool:
         """
-        Logout user
-        Front End handles the Logout functionality
+        Re-hash a verified password with the configured scheme / cost , runs after login in the background.
+        Only replaces the hash when it is still the one that was verified (a password change wins).
         """
-        return {"message": "Logged out successfully. Please make sure to delete your tokens."}
+        try:
+            new_hash = await get_password_hash_async(password)
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    update(User).where(
+                        User.id == user_id,
+                        User.hashed_password == old_hash
+                    ).values(hashed_password=new_hash)
+                )
+                await session.commit()
+            if result.rowcount:
+                invalidate_principal(username)
+                return True
+            return False
+        except HTTPException:
+            #### password pool is busy , the next login tries again ####
+            return False
+        except Exception as e:
+            logger.warning(f"Password hash upgrade failed for user {user_id}: {str(e)}")
+            return False
+
+    @staticmethod
+    async def logout_user(token: str, refresh_token: Optional[str], current_user: User, db: AsyncSession) -> Dict[str, str]:
+        """
+        Logout user , revokes the access token and (when given) the refresh token of this session
+        """
+        try:
+            #### already verified by get_current_user , served from the token cache ####
+            payload = await decode_access_token(token)
+            await revoke_token(db, payload)
+            forget_access_token(token)
+
+            if refresh_token:
+                try:
+                    refresh_payload = await decode_refresh_token(refresh_token)
+                except TokenError:
+                    refresh_payload = None
+                if refresh_payload and refresh_payload["sub"] == current_user.username:
+                    await revoke_token(db, refresh_payload)
+
+            return {"message": "Logged out successfully. Please make sure to delete your tokens."}
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Logout failed: {str(e)}"
+            )
+
+    @staticmethod
+    async def logout_all_sessions(current_user: User, db: AsyncSession) -> Dict[str, str]:
+        """
+        Log out everywhere , every access and refresh token issued until now stops working.
+        Other processes keep accepting access tokens for up to PRINCIPAL_CACHE_SECONDS (their principal cache).
+        """
+        try:
+            current_user.tokens_valid_after = logout_everywhere_time()
+            await db.commit()
+            invalidate_principal(current_user.username)
+
+            return {"message": "Logged out from all sessions. Please log in again."}
+
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Logout failed: {str(e)}"
+            )
 
     @staticmethod
     async def refresh_token(refresh_token: str, db: AsyncSession) -> Dict[str, Any]:
@@ -185,17 +355,43 @@ class UserControllers:
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="User not found or inactive"
                 )
-            
-            #### Create new access token ####
+
+            if issued_before_logout(payload, user.tokens_valid_after):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Refresh token has been revoked. Please login again."
+                )
+
             token_data = {
                 "sub": user.username,
                 "role": user.role.value
             }
+
+            #### Rotation : the used refresh token is revoked and remembers the refresh token replacing it ####
+            successor_jti = str(uuid.uuid4())
+            rotated_at = rotation_time()
+            if is_token_revoked(payload) or not await revoke_token(db, payload, successor_jti, rotated_at):
+                #### Used again within the grace period : parallel refreshes of one client get the same successor ####
+                #### later it means the token leaked , so every session of the user is ended ####
+                rotation = await find_recent_rotation(db, payload)
+                if rotation is None:
+                    user.tokens_valid_after = logout_everywhere_time(include_current_second=True)
+                    await db.commit()
+                    invalidate_principal(token_data["sub"])
+                    raise HTTPException(
+                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        detail="Refresh token has already been used. Please login again."
+                    )
+                successor_jti = rotation.successor_jti
+                rotated_at = rotation.revoked_at
             
+            #### Create new access token and the next refresh token ####
             new_access_token = create_access_token(data=token_data)
+            new_refresh_token = create_refresh_token(data=token_data, jti=successor_jti, issued_at=rotated_at)
             
             return {
                 "access_token": new_access_token,
+                "refresh_token": new_refresh_token,
                 "token_type": "bearer"
             }
             
@@ -232,23 +428,40 @@ class UserControllers:
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Could not validate credentials"
                 )
-            
-            #### Get user from database ####
-            stmt = select(User).where(User.username == username)
-            result = await db.execute(stmt)
-            user = result.scalar_one_or_none()
-            
-            if not user:
+
+            #### Logged out token (in-memory set , no query) ####
+            if is_token_revoked(payload):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="User not found"
+                    detail="Token has been revoked"
                 )
             
+            #### Get user from the principal cache , from database on a miss ####
+            user = await get_cached_principal(username, db)
+            if user is None:
+                stmt = select(User).where(User.username == username)
+                result = await db.execute(stmt)
+                user = result.scalar_one_or_none()
+                
+                if not user:
+                    raise HTTPException(
+                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        detail="User not found"
+                    )
+                cache_principal(user)
+            
             if not user.is_active:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="Inactive user"
                 )
+
+            #### Issued before "log out everywhere" ####
+            if issued_before_logout(payload, user.tokens_valid_after):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Token has been revoked"
+                )
             
             return user
             
@@ -271,54 +484,90 @@ class UserControllers:
             )
 
     @staticmethod
-    async def get_user_profile(current_user: User, db: AsyncSession) -> Dict[str, Any]:
-        """
-        Get authenticated user's profile with all relationships
-        """
-        
-        stmt = select(User).options(
-            selectinload(User.orders),
-            selectinload(User.comments),
-            selectinload(User.cart).selectinload(Cart.cart_items),
-            selectinload(User.reservations),
-            selectinload(User.payments)
-        ).where(User.id == current_user.id)
-        
-        result = await db.execute(stmt)
-        user = result.scalar_one()
-        
-        #### Get favourite products count separately ####
-        fav_stmt = select(FavouriteProduct.product_id).where(FavouriteProduct.user_id == user.id)
-        fav_result = await db.execute(fav_stmt)
-        favourite_product_ids = [row[0] for row in fav_result.all()]
-        
-        #### Filter out cancelled reservations and orders for the count ####
-        active_reservations = [
-            reservation.id for reservation in user.reservations 
-            if reservation.status != ReservationStatus.CANCELLED
-        ]
-        active_orders = [
-            order.id for order in user.orders 
-            if order.status != OrderStatus.CANCELLED
-        ]
-        
-        return {
-            "id": user.id,
-            "username": user.username,
-            "email": user.email,
-            "image_url": user.image_url,
-            "phone": user.phone,
-            "address": user.address,
-            "role": user.role.value if user.role else None,
-            "is_active": user.is_active,
-            "created_at": user.created_at.isoformat() if user.created_at else None,
-            "favourite_products": favourite_product_ids,
-            "orders": active_orders,
-            "comments": [comment.id for comment in user.comments],
-            "cart": user.cart.to_dict() if user.cart else None,
-            "reservations": active_reservations,
-            "payments": [payment.id for payment in user.payments],
-        }
+    async def get_user_profile(
+        current_user: User,
+        db: AsyncSession,
+        include: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Dict[str, Any]:
+        """
+        Get authenticated user's profile with relationship counts (one query).
+        Sub-resources named in `include` are added as paginated ID lists , newest first.
+        """
+        try:
+            included = [name.strip() for name in include.split(",") if name.strip()] if include else []
+            unknown = [name for name in included if name not in PROFILE_SUB_RESOURCES and name != "cart"]
+            if unknown:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"include must be a comma separated list of: {', '.join([*PROFILE_SUB_RESOURCES, 'cart'])}"
+                )
+
+            #### Counts and the cart in one query ####
+            cart_id = select(Cart.id).where(Cart.user_id == User.id).correlate(User).scalar_subquery()
+            cart_items_count = select(func.count(CartItem.id)).join(
+                Cart, Cart.id == CartItem.cart_id
+            ).where(Cart.user_id == User.id).correlate(User).scalar_subquery()
+            counts_stmt = select(
+                *(count.label(key) for key, count in PROFILE_COUNTS.items()),
+                cart_id.label("cart_id"),
+                cart_items_count.label("cart_items_count")
+            ).select_from(User).where(User.id == current_user.id)
+            counts = (await db.execute(counts_stmt)).one()
+
+            profile = {
+                "id": current_user.id,
+                "username": current_user.username,
+                "email": current_user.email,
+                "image_url": current_user.image_url,
+                "phone": current_user.phone,
+                "address": current_user.address,
+                "role": current_user.role.value if current_user.role else None,
+                "is_active": current_user.is_active,
+                "created_at": current_user.created_at.isoformat() if current_user.created_at else None,
+                **{key: counts._mapping[key] for key in PROFILE_COUNTS},
+                "cart_items_count": counts.cart_items_count,
+                "favourite_products": [],
+                "orders": [],
+                "comments": [],
+                "cart": None,
+                "reservations": [],
+                "payments": [],
+            }
+
+            #### Optional sub-resources , one page each ####
+            for name in included:
+                if name == "cart":
+                    if counts.cart_id is not None:
+                        cart_stmt = select(Cart).options(selectinload(Cart.cart_items)).where(Cart.id == counts.cart_id)
+                        cart = (await db.execute(cart_stmt)).scalar_one_or_none()
+                        profile["cart"] = cart.to_dict() if cart else None
+                    continue
+                if name == "orders":
+                    def order_conditions(model):
+                        return [model.user_id == current_user.id, model.status != OrderStatus.CANCELLED]
+
+                    sources = await OrderArchiveControllers.get_order_sources(db)
+                    profile[name] = await OrderArchiveControllers.get_order_ids_page(
+                        db, sources, order_conditions, skip, limit
+                    )
+                    continue
+                value, user_id_column, newest_first, conditions = PROFILE_SUB_RESOURCES[name]
+                page_stmt = select(value).where(
+                    user_id_column == current_user.id, *conditions
+                ).order_by(newest_first.desc()).offset(skip).limit(limit)
+                profile[name] = list((await db.execute(page_stmt)).scalars().all())
+
+            return profile
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to fetch profile: {str(e)}"
+            )
 
     @staticmethod
     async def update_user_profile(
@@ -354,10 +603,17 @@ class UserControllers:
             
             #### User model's update_profile method ####
             update_dict = update_data.model_dump(exclude_unset=True)
+            old_username = current_user.username
+            #### a new password is hashed in the password pool , not inside update_profile ####
+            new_password = update_dict.pop("password", None)
             updated = current_user.update_profile(update_dict)
+            if new_password is not None:
+                current_user.hashed_password = await get_password_hash_async(new_password)
+                updated = True
             
             if updated:
                 await db.commit()
+                invalidate_principal(old_username, current_user.username)
                 await db.refresh(current_user)
                 return {
                     "message": "Profile updated successfully",
@@ -390,15 +646,16 @@ class UserControllers:
         """
         try:
             #### Verify current password ####
-            if not verify_password(current_password, current_user.hashed_password):
+            if not await verify_password_async(current_password, current_user.hashed_password):
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Current password is incorrect"
                 )
             
             ##### Hash and update password #####
-            current_user.hashed_password = get_password_hash(new_password)
+            current_user.hashed_password = await get_password_hash_async(new_password)
             await db.commit()
+            invalidate_principal(current_user.username)
             
             return {"message": "Password changed successfully"}
             
@@ -449,6 +706,14 @@ class UserControllers:
             )
 
 
+    @staticmethod
+    async def get_user_listing(user_id: int, db: AsyncSession) -> Optional[Dict[str, Any]]:
+        """
+        Admin : One user as in the listings (columns and counts) , returned after admin changes
+        """
+        row = (await db.execute(user_listing_select().where(User.id == user_id))).one_or_none()
+        return user_listing_dict(row) if row else None
+
     @staticmethod
     async def get_all_users(
         skip: int = 0,
@@ -459,21 +724,23 @@ class UserControllers:
         Admin: Get all users with pagination
         """
         try:
-            #### Get total count ####
-            count_stmt = select(func.count(User.id))
-            total_result = await db.execute(count_stmt)
-            total = total_result.scalar()
-            
-            #### Get users with pagination ####
-            stmt = select(User).offset(skip).limit(limit).order_by(User.created_at.desc())
-            result = await db.execute(stmt)
-            users = result.scalars().all()
+            #### Users with pagination , the total comes with the page as a window count ####
+            stmt = user_listing_select().add_columns(
+                func.count().over().label("total")
+            ).order_by(User.created_at.desc(), User.id.desc()).offset(skip).limit(limit)
+            rows = (await db.execute(stmt)).all()
+
+            if rows:
+                total = rows[0].total
+            else:
+                #### page past the end , only then a separate count ####
+                total = (await db.execute(select(func.count(User.id)))).scalar()
             
             return {
                 "total": total,
                 "skip": skip,
                 "limit": limit,
-                "users": [user.to_dict() for user in users]
+                "users": [user_listing_dict(row) for row in rows]
             }
             
         except Exception as e:
@@ -483,16 +750,17 @@ class UserControllers:
             )
 
     @staticmethod
-    async def get_users_by_role(role: UserRole, db: AsyncSession) -> List[Dict[str, Any]]:
+    async def get_users_by_role(role: UserRole, skip: int = 0, limit: int = 100, db: AsyncSession = None) -> List[Dict[str, Any]]:
         """
         Admin: Get all users with specific role
         """
         try:
-            stmt = select(User).where(User.role == role).order_by(User.created_at.desc())
-            result = await db.execute(stmt)
-            users = result.scalars().all()
+            stmt = user_listing_select().where(User.role == role).order_by(
+                User.created_at.desc(), User.id.desc()
+            ).offset(skip).limit(limit)
+            rows = (await db.execute(stmt)).all()
             
-            return [user.to_dict() for user in users]
+            return [user_listing_dict(row) for row in rows]
             
         except Exception as e:
             raise HTTPException(
@@ -523,11 +791,11 @@ class UserControllers:
             old_role = user.role
             user.role = new_role
             await db.commit()
-            await db.refresh(user)
+            invalidate_principal(user.username)
             
             return {
                 "message": f"User role changed from {old_role.value} to {new_role.value}",
-                "user": user.to_dict()
+                "user": await UserControllers.get_user_listing(user_id, db)
             }
             
         except HTTPException:
@@ -558,11 +826,11 @@ class UserControllers:
             user.is_active = True
             user.deleted_at = None
             await db.commit()
-            await db.refresh(user)
+            invalidate_principal(user.username)
             
             return {
                 "message": "User activated successfully",
-                "user": user.to_dict()
+                "user": await UserControllers.get_user_listing(user_id, db)
             }
             
         except HTTPException:
@@ -594,11 +862,11 @@ class UserControllers:
             user.is_active = False
             user.deleted_at = datetime.now(timezone.utc)
             await db.commit()
-            await db.refresh(user)
+            invalidate_principal(user.username)
             
             return {
                 "message": "User deactivated successfully",
-                "user": user.to_dict()
+                "user": await UserControllers.get_user_listing(user_id, db)
             }
             
         except HTTPException:
@@ -611,16 +879,17 @@ class UserControllers:
             )
 
     @staticmethod
-    async def get_users_by_status(is_active: bool, db: AsyncSession) -> List[Dict[str, Any]]:
+    async def get_users_by_status(is_active: bool, skip: int = 0, limit: int = 100, db: AsyncSession = None) -> List[Dict[str, Any]]:
         """
         Admin: Get users by active/inactive status
         """
         try:
-            stmt = select(User).where(User.is_active == is_active).order_by(User.created_at.desc())
-            result = await db.execute(stmt)
-            users = result.scalars().all()
+            stmt = user_listing_select().where(User.is_active == is_active).order_by(
+                User.created_at.desc(), User.id.desc()
+            ).offset(skip).limit(limit)
+            rows = (await db.execute(stmt)).all()
             
-            return [user.to_dict() for user in users]
+            return [user_listing_dict(row) for row in rows]
             
         except Exception as e:
             raise HTTPException(
@@ -727,18 +996,19 @@ class UserControllers:
             
             #### Update fields ####
             update_dict = update_data.model_dump(exclude_unset=True)
+            old_username = user.username
             for key, value in update_dict.items():
                 if key == "password":
-                    user.hashed_password = get_password_hash(value)
+                    user.hashed_password = await get_password_hash_async(value)
                 else:
                     setattr(user, key, value)
             
             await db.commit()
-            await db.refresh(user)
+            invalidate_principal(old_username, user.username)
             
             return {
                 "message": "User updated successfully",
-                "user": user.to_dict()
+                "user": await UserControllers.get_user_listing(user_id, db)
             }
             
         except HTTPException:
@@ -781,7 +1051,7 @@ class UserControllers:
             new_user = User(
                 username=user_data.username,
                 email=user_data.email,
-                hashed_password=get_password_hash(user_data.password),
+                hashed_password=await get_password_hash_async(user_data.password),
                 role=user_data.role,
                 image_url=user_data.image_url,
                 phone=user_data.phone,
@@ -791,11 +1061,10 @@ class UserControllers:
             
             db.add(new_user)
             await db.commit()
-            await db.refresh(new_user)
             
             return {
                 "message": "User created successfully",
-                "user": new_user.to_dict()
+                "user": await UserControllers.get_user_listing(new_user.id, db)
             }
             
         except HTTPException:
@@ -808,6 +1077,85 @@ class UserControllers:
             )
 
 
+    @staticmethod
+    async def bulk_create_users(
+        payload: AdminBulkCreateUsers,
+        db: AsyncSession
+    ) -> Dict[str, Any]:
+        """
+        Admin: Create many users with their carts in one transaction.
+        Passwords are hashed on all pool workers , users and carts are inserted set-based
+        (a bulk INSERT skips the per row create_user_cart listener , carts are inserted here).
+        """
+        try:
+            users = payload.users
+
+            #### Duplicates inside the request ####
+            usernames = [user.username for user in users]
+            emails = [user.email for user in users]
+            repeated = sorted(
+                {value for value in usernames if usernames.count(value) > 1} |
+                {value for value in emails if emails.count(value) > 1}
+            )
+            if repeated:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Duplicate usernames or emails in request: {', '.join(repeated)}"
+                )
+
+            #### Uniqueness against existing users , one query ####
+            stmt = select(User.username, User.email).where(
+                or_(User.username.in_(usernames), User.email.in_(emails))
+            )
+            taken = set()
+            for username, email in (await db.execute(stmt)).all():
+                taken.update(value for value in (username, email) if value in usernames or value in emails)
+            if taken:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Usernames or emails already exist: {', '.join(sorted(taken))}"
+                )
+
+            hashed_passwords = await get_password_hashes_async([user.password for user in users])
+
+            rows = [
+                {
+                    "username": user.username,
+                    "email": user.email,
+                    "hashed_password": hashed_password,
+                    "role": user.role,
+                    "image_url": user.image_url,
+                    "phone": user.phone,
+                    "address": user.address,
+                    "is_active": user.is_active
+                }
+                for user, hashed_password in zip(users, hashed_passwords)
+            ]
+            created = (await db.execute(
+                insert(User).returning(User.id, User.username, User.email), rows
+            )).all()
+            await db.execute(insert(Cart), [{"user_id": row.id} for row in created])
+            await db.commit()
+            typeahead_cache.clear()
+
+            return {
+                "message": f"{len(created)} users created successfully",
+                "users": [
+                    {"id": row.id, "username": row.username, "email": row.email}
+                    for row in sorted(created, key=lambda row: row.id)
+                ]
+            }
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to create users: {str(e)}"
+            )
+
+
     @staticmethod
     async def hard_delete_user_by_id(user_id: int, db: AsyncSession) -> Dict[str, str]:
         """
@@ -826,6 +1174,7 @@ class UserControllers:
             
             await db.delete(user)
             await db.commit()
+            invalidate_principal(user.username)
             
             return {"message": f"User {user.username} permanently deleted"}
             
@@ -848,24 +1197,52 @@ class UserControllers:
     @staticmethod
     async def search_user_by_values(
         search: str,
-        db: AsyncSession
+        skip: int = 0,
+        limit: int = 100,
+        typeahead: bool = False,
+        db: AsyncSession = None
     ) -> List[Dict[str, Any]]:
         """
-        Admin: Search users by username, email, or phone
+        Admin: Search users by username, email, or phone , most relevant first.
+        Typeahead mode returns a few light rows and caches them briefly.
         """
         try:
-            stmt = select(User).where(
-                or_(
-                    User.username.ilike(f"%{search}%"),
-                    User.email.ilike(f"%{search}%"),
-                    User.phone.ilike(f"%{search}%") if search else False
-                )
-            ).order_by(User.created_at.desc())
-            
-            result = await db.execute(stmt)
-            users = result.scalars().all()
+            term = search.strip()
+            dialect = db.bind.dialect.name
+
+            if typeahead:
+                if len(term) < TYPEAHEAD_MIN_LENGTH:
+                    return []
+                limit = min(limit, TYPEAHEAD_MAX_RESULTS)
+                cache_key = (dialect, term.lower(), skip, limit)
+                cached = typeahead_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+                stmt = apply_user_search(
+                    select(User.id, User.username, User.email, User.role, User.is_active), term, dialect
+                ).offset(skip).limit(limit)
+                rows = (await db.execute(stmt)).all()
+                results = [
+                    {
+                        "id": row.id,
+                        "username": row.username,
+                        "email": row.email,
+                        "role": row.role.value if row.role else None,
+                        "is_active": row.is_active
+                    }
+                    for row in rows
+                ]
+                typeahead_cache.set(cache_key, results)
+                return results
+
+            if not term:
+                return []
+
+            stmt = apply_user_search(user_listing_select(), term, dialect).offset(skip).limit(limit)
+            rows = (await db.execute(stmt)).all()
             
-            return [user.to_dict() for user in users]
+            return [user_listing_dict(row) for row in rows]
             
         except Exception as e:
             raise HTTPException(
@@ -879,15 +1256,16 @@ class UserControllers:
         Admin: Get user activity summary
         """
         try:
-            stmt = select(User).options(
-                selectinload(User.orders),
-                selectinload(User.comments),
-                selectinload(User.reservations),
-                selectinload(User.payments)
+            #### One query : user columns and grouped counts , no relationship loads ####
+            stmt = select(
+                User.id,
+                User.username,
+                User.created_at,
+                User.updated_at,
+                *(count.label(key) for key, count in USER_LISTING_COUNTS.items())
             ).where(User.id == user_id)
             
-            result = await db.execute(stmt)
-            user = result.scalar_one_or_none()
+            user = (await db.execute(stmt)).one_or_none()
             
             if not user:
                 raise HTTPException(
@@ -898,10 +1276,11 @@ class UserControllers:
             return {
                 "user_id": user.id,
                 "username": user.username,
-                "total_orders": len(user.orders),
-                "total_comments": len(user.comments),
-                "total_reservations": len(user.reservations),
-                "total_payments": len(user.payments),
+                "total_orders": user.orders_count,
+                "total_comments": user.comments_count,
+                "total_reservations": user.reservations_count,
+                "total_payments": user.payments_count,
+                "total_favourite_products": user.favourite_products_count,
                 "account_created": user.created_at.isoformat() if user.created_at else None,
                 "last_updated": user.updated_at.isoformat() if user.updated_at else None
             }
@@ -920,7 +1299,7 @@ class UserControllers:
         Admin : Get all orders for a specific user
         """
         try:
-            stmt = select(User).options(selectinload(User.orders)).where(User.id == user_id)
+            stmt = select(User.id).where(User.id == user_id)
             result = await db.execute(stmt)
             user = result.scalar_one_or_none()
             
@@ -929,8 +1308,16 @@ class UserControllers:
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="User not found"
                 )
+
+            def conditions_for(model):
+                return [model.user_id == user_id]
+
+            #### Hot table only, unless archived orders can match ####
+            sources = await OrderArchiveControllers.get_order_sources(db)
+            total = await OrderArchiveControllers.count_orders(db, sources, conditions_for)
+            orders = await OrderArchiveControllers.get_orders_page(db, sources, conditions_for, 0, total)
             
-            return [order.to_dict() for order in user.orders]
+            return [order.to_dict() for order in orders]
             
         except HTTPException:
             raise
@@ -0,0 +1,107 @@
+import os
+import time
+import random
+import asyncio
+import argparse
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import select, insert, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from Database.Database import Base
+import Models  # noqa: F401  (registers every model on Base.metadata)
+from Models.RESERVATION.TableModel import Table
+from Models.USER.UserModel import User
+from Controllers.RESERVATION.ReservationControllers import ReservationControllers
+from Controllers.RESERVATION.TableControllers import RESERVATION_SITTING_MINUTES
+from Schemas.RESERVATION.ReservationSchemas import ReservationCreate
+
+
+#### ------------------------------------------------------------------ ####
+#### Fires many concurrent bookings at a few tables and counts double bookings
+#### python -m Database.Benchmarks.ReservationLoadTest --requests 2000 --concurrency 200
+#### --without-slots skips the slot inventory to show the old check-then-insert race
+#### Uses its own SQLite file , the application database is never touched
+#### ------------------------------------------------------------------ ####
+
+
+DOUBLE_BOOKINGS_SQL = text("""
+    SELECT COUNT(*) FROM reservations a
+    JOIN reservations b ON a.table_id = b.table_id AND a.id < b.id
+    WHERE a.status IN ('PENDING', 'CONFIRMED') AND b.status IN ('PENDING', 'CONFIRMED')
+    AND ABS((julianday(a.reservation_time) - julianday(b.reservation_time)) * 1440) < :sitting
+""")
+
+
+async def run_load_test(args) -> None:
+    if os.path.exists(args.database):
+        os.remove(args.database)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{args.database}", connect_args={"timeout": 60})
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with session_factory() as session:
+        await session.execute(insert(User), [
+            {"username": f"guest{index}", "email": f"guest{index}@example.com", "hashed_password": "x"}
+            for index in range(args.users)
+        ])
+        await session.execute(insert(Table), [
+            {"table_number": f"L{index}", "capacity": 6, "is_available": True}
+            for index in range(args.tables)
+        ])
+        await session.commit()
+        users = (await session.execute(select(User))).scalars().all()
+
+    if args.without_slots:
+        async def no_slots(reservation, db):
+            return None
+        ReservationControllers._claim_slots = staticmethod(no_slots)
+
+    #### Few distinct tables and start times , so most requests collide ####
+    day = (datetime.utcnow() + timedelta(days=7)).replace(hour=18, minute=0, second=0, microsecond=0)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    outcomes = {}
+
+    async def book():
+        async with semaphore:
+            data = ReservationCreate(
+                table_id=random.randint(1, args.tables),
+                reservation_time=day + timedelta(minutes=15 * random.randrange(args.start_times)),
+                number_of_guests=2,
+            )
+            async with session_factory() as session:
+                try:
+                    await ReservationControllers.create_new_reservation(random.choice(users), data, session)
+                    outcome = "booked"
+                except HTTPException as e:
+                    outcome = f"http_{e.status_code}"
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(book() for _ in range(args.requests)))
+    elapsed = time.perf_counter() - started
+
+    async with session_factory() as session:
+        double_bookings = (await session.execute(DOUBLE_BOOKINGS_SQL, {"sitting": RESERVATION_SITTING_MINUTES})).scalar()
+
+    await engine.dispose()
+    os.remove(args.database)
+
+    print(f"requests        : {args.requests} (concurrency {args.concurrency}, slot inventory {'off' if args.without_slots else 'on'})")
+    print(f"throughput      : {args.requests / elapsed:.1f} req/s")
+    print(f"outcomes        : {outcomes}")
+    print(f"double bookings : {double_bookings}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent reservation load test")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--tables", type=int, default=5)
+    parser.add_argument("--start-times", type=int, default=16)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--without-slots", action="store_true")
+    parser.add_argument("--database", default="./reservation_load_test.db")
+    asyncio.run(run_load_test(parser.parse_args()))
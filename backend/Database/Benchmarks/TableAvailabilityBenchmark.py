@@ -0,0 +1,128 @@
+import os
+import time
+import random
+import asyncio
+import argparse
+import statistics
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, and_, insert
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from Database.Database import Base
+import Models  # noqa: F401  (registers every model on Base.metadata)
+from Models.RESERVATION.TableModel import Table
+from Models.RESERVATION.ReservationModel import Reservation
+from Models.USER.UserModel import User
+from Controllers.RESERVATION.TableControllers import TableControllers, RESERVATION_CONFLICT_WINDOW
+from Utils.Enums.Enums import ReservationStatus, TableLocation
+
+
+#### ------------------------------------------------------------------ ####
+#### Compares the per-table availability loop with the single NOT EXISTS query
+#### python -m Database.Benchmarks.TableAvailabilityBenchmark --tables 300 --reservations 50000
+#### Uses its own SQLite file , the application database is never touched
+#### ------------------------------------------------------------------ ####
+
+
+async def seed(session_factory, tables: int, reservations: int, days: int) -> None:
+    locations = list(TableLocation)
+    statuses = [ReservationStatus.PENDING, ReservationStatus.CONFIRMED, ReservationStatus.CANCELLED]
+    start = datetime(2025, 1, 1, 12, 0)
+
+    async with session_factory() as session:
+        await session.execute(insert(User), [{"username": "benchmark", "email": "benchmark@example.com", "hashed_password": "x"}])
+        await session.execute(insert(Table), [
+            {
+                "table_number": f"B{index}",
+                "capacity": random.choice([2, 2, 4, 4, 6, 8]),
+                "location": random.choice(locations),
+                "is_available": random.random() > 0.05,
+            }
+            for index in range(tables)
+        ])
+        rows = [
+            {
+                "user_id": 1,
+                "table_id": random.randint(1, tables),
+                "reservation_time": start + timedelta(days=random.randrange(days), minutes=30 * random.randrange(20)),
+                "number_of_guests": random.randint(1, 8),
+                "status": random.choice(statuses),
+            }
+            for _ in range(reservations)
+        ]
+        for offset in range(0, len(rows), 5000):
+            await session.execute(insert(Reservation), rows[offset:offset + 5000])
+        await session.commit()
+
+
+async def legacy_available_tables(date_time: datetime, min_capacity: int, session) -> list:
+    """ The previous implementation : load tables, then one conflict query per table """
+    tables = (await session.execute(
+        select(Table).where(and_(Table.is_available == True, Table.capacity >= min_capacity)).order_by(Table.table_number)
+    )).scalars().all()
+
+    available = []
+    for table in tables:
+        conflict = (await session.execute(
+            select(Reservation.id).where(
+                and_(
+                    Reservation.table_id == table.id,
+                    Reservation.status.in_([ReservationStatus.PENDING, ReservationStatus.CONFIRMED]),
+                    Reservation.reservation_time >= date_time - RESERVATION_CONFLICT_WINDOW,
+                    Reservation.reservation_time <= date_time + RESERVATION_CONFLICT_WINDOW
+                )
+            ).limit(1)
+        )).first()
+        if conflict is None:
+            available.append(table.id)
+    return available
+
+
+async def timed(label: str, runs: int, call) -> None:
+    durations = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await call()
+        durations.append((time.perf_counter() - started) * 1000)
+    print(f"{label:<12}: mean {statistics.mean(durations):8.2f} ms   p95 {sorted(durations)[int(0.95 * (len(durations) - 1))]:8.2f} ms")
+
+
+async def run_benchmark(args) -> None:
+    if os.path.exists(args.database):
+        os.remove(args.database)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{args.database}")
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    started = time.perf_counter()
+    await seed(session_factory, args.tables, args.reservations, args.days)
+    print(f"seeded {args.tables} tables / {args.reservations} reservations in {time.perf_counter() - started:.1f}s")
+
+    probe_times = [datetime(2025, 1, 1, 12, 0) + timedelta(days=random.randrange(args.days), minutes=30 * random.randrange(20)) for _ in range(args.runs)]
+
+    async with session_factory() as session:
+        #### both implementations must agree before timing them ####
+        for probe in probe_times[:5]:
+            legacy = await legacy_available_tables(probe, args.min_capacity, session)
+            current = await TableControllers.get_available_tables(probe, args.min_capacity, None, session)
+            assert legacy == [table["id"] for table in current], "implementations disagree"
+
+        probes = iter(probe_times * 2)
+        await timed("per-table", args.runs, lambda: legacy_available_tables(next(probes), args.min_capacity, session))
+        await timed("not-exists", args.runs, lambda: TableControllers.get_available_tables(next(probes), args.min_capacity, None, session))
+
+    await engine.dispose()
+    os.remove(args.database)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark table availability search")
+    parser.add_argument("--tables", type=int, default=300)
+    parser.add_argument("--reservations", type=int, default=50000)
+    parser.add_argument("--days", type=int, default=120)
+    parser.add_argument("--min-capacity", type=int, default=2)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--database", default="./table_availability_benchmark.db")
+    asyncio.run(run_benchmark(parser.parse_args()))
@@ -0,0 +1 @@
+### Database Benchmarks __init__.py file ###
\ No newline at end of file
@@ -3,7 +3,7 @@ import os
 
 from dotenv import load_dotenv
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import declarative_base
 
 logger = logging.getLogger(__name__)
@@ -72,9 +72,32 @@ async def init_db():
         # In non-development environment, use a proper migration tool like  'Alembic' #
         logger.info("Initializing database tables...")
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_missing_columns_and_indexes)
+        #### trigram / FTS5 index of the admin user search ####
+        from Utils.Search.UserSearch import ensure_user_search_index
+        await conn.run_sync(ensure_user_search_index)
         logger.info("Database tables initialized.")
 
 
+def _add_missing_columns_and_indexes(connection):
+    """
+    create_all skips tables that already exist , so new nullable columns and new indexes
+    of existing tables are added here (keeps existing development databases usable).
+    """
+    inspector = inspect(connection)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing_columns and column.nullable:
+                column_type = column.type.compile(dialect=connection.dialect)
+                connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                logger.info(f"Added column {table.name}.{column.name}")
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
 async def get_db():
     async with AsyncSessionLocal() as session:
         try:
@@ -1,7 +1,8 @@
 from Database.Database import Base
-from sqlalchemy import CheckConstraint, Column, Integer, String, DateTime, func, Boolean
+from sqlalchemy import CheckConstraint, Column, Integer, String, DateTime, func, Boolean, Index, Float, JSON, Enum as SAEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy import ForeignKey
+from Utils.Enums.Enums import CommentModerationStatus
 
 
 class Comment(Base):
@@ -11,6 +12,14 @@ class Comment(Base):
         CheckConstraint("content IS NOT NULL"),
         CheckConstraint("user_id IS NOT NULL"),
         CheckConstraint("product_id IS NOT NULL"),
+        # leaderboard time windows #
+        Index("ix_comments_created_at", "created_at"),
+        # keyset paginated product comment feed #
+        Index("ix_comments_product_active_id", "product_id", "is_active", "id"),
+        # moderation worker and queue #
+        Index("ix_comments_moderation_status", "moderation_status"),
+        # per user counts of the admin user listings #
+        Index("ix_comments_user_id", "user_id"),
         {"extend_existing": True},
     )
 
@@ -24,6 +33,12 @@ class Comment(Base):
     deleted_at = Column(DateTime, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
 
+    # Moderation (scored in the background after posting , None for comments older than moderation)
+    moderation_status = Column(SAEnum(CommentModerationStatus, native_enum=False), nullable=True, default=CommentModerationStatus.PENDING)
+    moderation_score = Column(Float, nullable=True)
+    moderation_reasons = Column(JSON, nullable=True)
+    moderated_at = Column(DateTime, nullable=True)
+
     # Relationships
     user = relationship("User", back_populates="comments")
     product = relationship("Product", back_populates="comments")
@@ -39,6 +54,7 @@ class Comment(Base):
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
             "deleted_at": self.deleted_at.isoformat() if self.deleted_at else None,
             "is_active": self.is_active,
+            "moderation_status": self.moderation_status.value if self.moderation_status else None,
         }
 
     def __repr__(self):
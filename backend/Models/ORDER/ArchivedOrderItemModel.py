@@ -0,0 +1,38 @@
+from Database.Database import Base
+from sqlalchemy import Column, Integer, ForeignKey, Numeric, DateTime, Index
+from sqlalchemy.orm import relationship
+
+class ArchivedOrderItem(Base):
+    __tablename__ = "order_items_archive"
+
+    __table_args__ = (
+        Index("ix_order_items_archive_order", "order_id"),
+        Index("ix_order_items_archive_product", "product_id"),
+        {'extend_existing': True}
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    order_id = Column(Integer, ForeignKey("orders_archive.id", ondelete="CASCADE"), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False)
+    quantity = Column(Integer, nullable=False, default=1)
+    unit_price = Column(Numeric(10, 2), nullable=False)
+    subtotal = Column(Numeric(10, 2), nullable=False)
+    created_at = Column(DateTime)
+
+    # Relationships
+    order = relationship("ArchivedOrder", back_populates="order_items")
+    product = relationship("Product")
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "order_id": self.order_id,
+            "product_id": self.product_id,
+            "quantity": self.quantity,
+            "unit_price": float(self.unit_price) if self.unit_price is not None else None,
+            "subtotal": float(self.subtotal) if self.subtotal is not None else None,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
+
+    def __repr__(self):
+        return f"<ArchivedOrderItem(id={self.id}, order_id={self.order_id}, product_id={self.product_id}, qty={self.quantity})>"
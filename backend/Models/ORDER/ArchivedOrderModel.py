@@ -0,0 +1,62 @@
+from sqlalchemy import Column, Integer, DateTime, func, ForeignKey, Numeric, String, Index, Table
+from sqlalchemy.orm import relationship
+from Database.Database import Base
+from Utils.Enums.Enums import OrderStatus
+from sqlalchemy import Enum as SAEnum
+
+
+# archived payment <-> order links (no FK to orders, the order row lives in orders_archive now)
+payment_orders_archive = Table(
+    "payment_orders_archive",
+    Base.metadata,
+    Column("payment_id", Integer, ForeignKey("payments.id", ondelete="CASCADE"), primary_key=True),
+    Column("order_id", Integer, ForeignKey("orders_archive.id", ondelete="CASCADE"), primary_key=True),
+)
+
+
+class ArchivedOrder(Base):
+    """
+    Cold storage for completed / cancelled orders moved out of 'orders' by the archive job.
+    Keeps the original order id so links and references stay valid.
+    """
+    __tablename__ = "orders_archive"
+
+    __table_args__ = (
+        Index("ix_orders_archive_user_created", "user_id", "created_at"),
+        Index("ix_orders_archive_created", "created_at"),
+        {'extend_existing': True}
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    status = Column(SAEnum(OrderStatus, native_enum=False), nullable=False)
+    total_amount = Column(Numeric(10, 2), nullable=False)
+    delivery_address = Column(String, nullable=True)
+    special_instructions = Column(String, nullable=True)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    completed_at = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, server_default=func.now())
+
+    # Relationships
+    user = relationship("User")
+    order_items = relationship("ArchivedOrderItem", back_populates="order", cascade="all, delete-orphan")
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "status": self.status.value if hasattr(self.status, "value") else self.status,
+            "total_amount": float(self.total_amount) if self.total_amount is not None else None,
+            "delivery_address": self.delivery_address,
+            "special_instructions": self.special_instructions,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "archived_at": self.archived_at.isoformat() if self.archived_at else None,
+            "is_archived": True,
+            "order_items": [item.to_dict() for item in self.order_items]
+        }
+
+    def __repr__(self):
+        return f"<ArchivedOrder(id={self.id}, user_id={self.user_id}, status={self.status}, total={self.total_amount})>"
@@ -1,5 +1,5 @@
 from Database.Database import Base
-from sqlalchemy import Column, Integer, ForeignKey, Numeric, DateTime, func
+from sqlalchemy import Column, Integer, ForeignKey, Numeric, DateTime, func, Index
 from sqlalchemy.orm import relationship
 from decimal import Decimal
 
@@ -7,7 +7,9 @@ class OrderItem(Base):
     __tablename__ = "order_items"
 
     __table_args__ = (
-        {'extend_existing': True}
+        Index("ix_order_items_order", "order_id"),
+        Index("ix_order_items_product", "product_id"),
+        {'extend_existing': True, 'sqlite_autoincrement': True}
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
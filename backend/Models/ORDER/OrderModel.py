@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, func, ForeignKey, Numeric,String
+from sqlalchemy import Column, Integer, DateTime, func, ForeignKey, Numeric,String, Index
 from sqlalchemy.orm import relationship, validates
 from Database.Database import Base
 from Utils.Enums.Enums import OrderStatus
@@ -10,7 +10,9 @@ class Order(Base):
     __tablename__ = "orders"
 
     __table_args__ = (
-        {'extend_existing': True}
+        Index("ix_orders_user_created", "user_id", "created_at"),
+        Index("ix_orders_status_created", "status", "created_at"),
+        {'extend_existing': True, 'sqlite_autoincrement': True}
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
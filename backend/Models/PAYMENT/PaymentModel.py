@@ -18,8 +18,11 @@ payment_orders = Table(
 class Payment(Base):
     __tablename__ = "payments"
 
+    #### fetch server defaults (created_at / updated_at) with the INSERT itself , no refresh round trip ####
+    __mapper_args__ = {"eager_defaults": True}
+
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     reservation_id = Column(Integer, ForeignKey("reservations.id"), nullable=True)
     amount = Column(Numeric(10, 2), nullable=False)
     currency = Column(String, nullable=False, default="TRY")
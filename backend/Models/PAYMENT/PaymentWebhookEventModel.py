@@ -0,0 +1,47 @@
+from Database.Database import Base
+from sqlalchemy import Column, Integer, String, DateTime, func, JSON, Index
+
+
+class PaymentWebhookEvent(Base):
+    """
+    Durable inbox for payment provider notifications.
+    The webhook route only appends here , background workers claim, de-duplicate and apply them.
+    """
+    __tablename__ = "payment_webhook_events"
+
+    __table_args__ = (
+        Index("ix_payment_webhook_events_pending", "processed_at", "claimed_at"),
+        {'extend_existing': True}
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    provider = Column(String, nullable=False, default="iyzico")
+    provider_payment_id = Column(String, nullable=False, index=True)
+    event_status = Column(String, nullable=False)  # provider status , 'SUCCESS' / 'FAILURE'
+    token = Column(String, nullable=True)  # checkout form token
+    conversation_id = Column(String, nullable=True)
+    payload = Column(JSON, nullable=True)
+
+    received_at = Column(DateTime, server_default=func.now())
+    claimed_at = Column(DateTime, nullable=True)
+    claimed_by = Column(String, nullable=True)
+    processed_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    result = Column(String, nullable=True)  # 'applied', 'duplicate', 'ignored', 'error: ...'
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "provider": self.provider,
+            "provider_payment_id": self.provider_payment_id,
+            "event_status": self.event_status,
+            "token": self.token,
+            "conversation_id": self.conversation_id,
+            "received_at": self.received_at.isoformat() if self.received_at else None,
+            "processed_at": self.processed_at.isoformat() if self.processed_at else None,
+            "attempts": self.attempts,
+            "result": self.result,
+        }
+
+    def __repr__(self):
+        return f"<PaymentWebhookEvent(id={self.id}, provider_payment_id={self.provider_payment_id}, status={self.event_status})>"
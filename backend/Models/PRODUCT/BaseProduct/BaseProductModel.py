@@ -1,8 +1,10 @@
 from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, func, Boolean , Numeric , JSON
 from Database.Database import Base
 from sqlalchemy.orm import relationship
+from sqlalchemy import inspect
 from sqlalchemy.sql.schema import CheckConstraint
 from decimal import Decimal
+from Models.PRODUCT.ProductRating.ProductRatingSummaryModel import empty_rating_summary
 
 ##### BASE PRODUCT MODEL FOR PRODUCT MODELS TO INHERIT #####
 
@@ -49,6 +51,9 @@ class Product(Base):
     comments = relationship("Comment", back_populates="product", cascade="all, delete-orphan")
     cart_items = relationship("CartItem",back_populates="product",cascade="all, delete-orphan",lazy="select")
 
+    # Rating summary (kept up to date by comment listeners) , loaded with every product query in one extra query
+    rating_summary = relationship("ProductRatingSummary", uselist=False, cascade="all, delete-orphan", lazy="selectin")
+
 
     def to_dict(self):
         return {
@@ -66,8 +71,15 @@ class Product(Base):
             "deleted_at": self.deleted_at.isoformat() if self.deleted_at else None,
             "is_active": self.is_active,
             "is_front_page": self.is_front_page,
+            "rating": self.rating_to_dict(),
         }
 
+    def rating_to_dict(self):
+        #### never lazy load here , a product created in this session has no summary yet ####
+        if "rating_summary" in inspect(self).unloaded or self.rating_summary is None:
+            return empty_rating_summary()
+        return self.rating_summary.to_dict()
+
     def summary(self):
         return f"{self.name} | {self.description} | {self.tags} | {self.price} | {self.discount_percentage} | {self.image_url} | {self.created_at} | {self.updated_at} | {self.deleted_at} | {self.is_active} | {self.is_front_page}"
 
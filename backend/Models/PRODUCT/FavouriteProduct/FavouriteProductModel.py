@@ -1,5 +1,5 @@
 from Database.Database import Base
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, func, UniqueConstraint
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, func, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 
 
@@ -15,6 +15,8 @@ class FavouriteProduct(Base):
 
     __table_args__ = (
         UniqueConstraint("user_id", "product_id", name="unique_user_product_favourite"),
+        # leaderboard time windows #
+        Index("ix_favourite_products_created_at", "created_at"),
         {'extend_existing': True}
     )
 
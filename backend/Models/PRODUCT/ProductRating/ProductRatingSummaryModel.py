@@ -0,0 +1,148 @@
+from Database.Database import Base
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, func, event, inspect, update, case
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from Models.COMMENT.CommentModel import Comment
+
+#### Stars a comment rating can have ####
+RATING_STARS = (1, 2, 3, 4, 5)
+
+
+class ProductRatingSummary(Base):
+    """
+    Per product rating summary (count, sum and a 1-5 histogram of active rated comments).
+    Maintained by the Comment listeners below , in the same flush that writes the comment.
+    """
+    __tablename__ = "product_rating_summary"
+
+    __table_args__ = (
+        {'extend_existing': True}
+    )
+
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), primary_key=True)
+    rating_count = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(Integer, nullable=False, default=0)
+    stars_1 = Column(Integer, nullable=False, default=0)
+    stars_2 = Column(Integer, nullable=False, default=0)
+    stars_3 = Column(Integer, nullable=False, default=0)
+    stars_4 = Column(Integer, nullable=False, default=0)
+    stars_5 = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, onupdate=func.now(), server_default=func.now())
+
+    @property
+    def average_rating(self):
+        if not self.rating_count:
+            return None
+        return round(self.rating_sum / self.rating_count, 2)
+
+    def to_dict(self):
+        return {
+            "average": self.average_rating,
+            "count": self.rating_count or 0,
+            "histogram": {str(stars): getattr(self, f"stars_{stars}") or 0 for stars in RATING_STARS},
+        }
+
+    def __repr__(self):
+        return f"<ProductRatingSummary(product_id={self.product_id}, rating_count={self.rating_count}, rating_sum={self.rating_sum})>"
+
+
+#### Sortable average , products without ratings sort last ####
+average_rating_expression = case(
+    (ProductRatingSummary.rating_count > 0, ProductRatingSummary.rating_sum * 1.0 / ProductRatingSummary.rating_count),
+    else_=None
+)
+
+
+def empty_rating_summary() -> dict:
+    """ Rating of a product nobody rated yet """
+    return {"average": None, "count": 0, "histogram": {str(stars): 0 for stars in RATING_STARS}}
+
+
+def rating_row(product_id, rating, is_active, sign: int) -> dict:
+    """ Summary deltas of one comment , sign=1 adds it and sign=-1 removes it """
+    counted = bool(is_active) and rating in RATING_STARS
+    row = {
+        "product_id": product_id,
+        "rating_count": sign if counted else 0,
+        "rating_sum": sign * rating if counted else 0,
+    }
+    for stars in RATING_STARS:
+        row[f"stars_{stars}"] = sign if counted and rating == stars else 0
+    return row
+
+
+def _delta_columns():
+    return ["rating_count", "rating_sum"] + [f"stars_{stars}" for stars in RATING_STARS]
+
+
+def upsert_rating_summaries(connection, rows: list) -> None:
+    """ Add summary deltas with a single multi-row upsert """
+    #### one row per product , PostgreSQL can't update the same row twice in one upsert ####
+    merged = {}
+    for row in rows:
+        entry = merged.setdefault(row["product_id"], dict.fromkeys(_delta_columns(), 0))
+        for column in _delta_columns():
+            entry[column] += row[column]
+    rows = [
+        {"product_id": product_id, **deltas}
+        for product_id, deltas in merged.items()
+        if any(deltas.values())
+    ]
+    if not rows:
+        return
+    dialect_insert = postgresql_insert if connection.dialect.name == "postgresql" else sqlite_insert
+    stmt = dialect_insert(ProductRatingSummary).values(rows)
+    set_ = {
+        column: getattr(ProductRatingSummary, column) + getattr(stmt.excluded, column)
+        for column in _delta_columns()
+    }
+    set_["updated_at"] = func.now()
+    stmt = stmt.on_conflict_do_update(index_elements=[ProductRatingSummary.product_id], set_=set_)
+    connection.execute(stmt)
+
+
+def subtract_rating_summary(connection, row: dict) -> None:
+    """
+    Remove a deleted comment from its summary. A plain UPDATE , so a summary removed together
+    with its product (cascade) is never inserted back.
+    """
+    if not row["rating_count"]:
+        return
+    values = {column: getattr(ProductRatingSummary, column) + row[column] for column in _delta_columns()}
+    values["updated_at"] = func.now()
+    connection.execute(
+        update(ProductRatingSummary).where(ProductRatingSummary.product_id == row["product_id"]).values(**values)
+    )
+
+
+# SqlAlchemy Event listeners keeping the rating summaries in sync with comments #
+@event.listens_for(Comment, 'after_insert')
+def rate_new_comment(mapper, connection, target):
+    upsert_rating_summaries(connection, [
+        rating_row(target.product_id, target.rating, target.is_active, 1)
+    ])
+
+
+@event.listens_for(Comment, 'after_update')
+def rate_updated_comment(mapper, connection, target):
+    """ Move the comment between stars when its rating changed , drop it when it was soft deleted """
+    state = inspect(target)
+
+    def previous(attribute: str):
+        history = state.attrs[attribute].history
+        return history.deleted[0] if history.deleted else getattr(target, attribute)
+
+    old = (previous("product_id"), previous("rating"), previous("is_active"))
+    new = (target.product_id, target.rating, target.is_active)
+    if old == new:
+        return
+
+    upsert_rating_summaries(connection, [
+        rating_row(*old, -1),
+        rating_row(*new, 1),
+    ])
+
+
+@event.listens_for(Comment, 'after_delete')
+def rate_deleted_comment(mapper, connection, target):
+    subtract_rating_summary(connection, rating_row(target.product_id, target.rating, target.is_active, -1))
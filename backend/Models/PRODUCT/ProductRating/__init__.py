@@ -0,0 +1 @@
+### Product Rating Model __init__.py file ###
\ No newline at end of file
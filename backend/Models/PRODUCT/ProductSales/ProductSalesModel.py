@@ -0,0 +1,37 @@
+from Database.Database import Base
+from sqlalchemy import Column, Integer, ForeignKey, Numeric, DateTime, func
+from sqlalchemy.orm import relationship
+from decimal import Decimal
+
+
+class ProductSales(Base):
+    """
+    Per product sales counters, maintained in the same transaction that completes an order.
+    One row per product that has been sold at least once.
+    """
+    __tablename__ = "product_sales"
+
+    __table_args__ = (
+        {'extend_existing': True}
+    )
+
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), primary_key=True)
+    order_count = Column(Integer, nullable=False, default=0)
+    quantity_sold = Column(Integer, nullable=False, default=0, index=True)
+    revenue = Column(Numeric(12, 2), nullable=False, default=Decimal('0.00'), index=True)
+    updated_at = Column(DateTime, onupdate=func.now(), server_default=func.now())
+
+    # Relationships
+    product = relationship("Product")
+
+    def to_dict(self):
+        return {
+            "product_id": self.product_id,
+            "order_count": self.order_count,
+            "quantity_sold": self.quantity_sold,
+            "revenue": float(self.revenue) if self.revenue is not None else 0.0,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+    def __repr__(self):
+        return f"<ProductSales(product_id={self.product_id}, quantity_sold={self.quantity_sold}, revenue={self.revenue})>"
@@ -0,0 +1 @@
+### Product Sales Model __init__.py file ###
\ No newline at end of file
@@ -0,0 +1,115 @@
+from Database.Database import Base
+from sqlalchemy import Column, Integer, Date, DateTime, func, event, inspect
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from Models.RESERVATION.ReservationModel import Reservation
+from Utils.Enums.Enums import ReservationStatus
+
+
+class ReservationDayCount(Base):
+    """
+    Per day reservation counters for the admin dashboard.
+    Maintained by the Reservation listeners below , in the same flush that writes the reservation.
+    """
+    __tablename__ = "reservation_day_counts"
+
+    __table_args__ = (
+        {'extend_existing': True}
+    )
+
+    reservation_date = Column(Date, primary_key=True)
+    total = Column(Integer, nullable=False, default=0)
+    pending = Column(Integer, nullable=False, default=0)
+    confirmed = Column(Integer, nullable=False, default=0)
+    cancelled = Column(Integer, nullable=False, default=0)
+    guests = Column(Integer, nullable=False, default=0)  # guests of pending + confirmed reservations
+    updated_at = Column(DateTime, onupdate=func.now(), server_default=func.now())
+
+    def to_dict(self):
+        return {
+            "date": self.reservation_date.isoformat() if self.reservation_date else None,
+            "total": self.total,
+            "pending": self.pending,
+            "confirmed": self.confirmed,
+            "cancelled": self.cancelled,
+            "active": self.pending + self.confirmed,
+            "guests": self.guests,
+        }
+
+    def __repr__(self):
+        return f"<ReservationDayCount(reservation_date={self.reservation_date}, total={self.total})>"
+
+
+def counter_row(reservation_date, reservation_status, guests, sign: int) -> dict:
+    """ Counter deltas of one reservation , sign=1 adds it and sign=-1 removes it """
+    return {
+        "reservation_date": reservation_date,
+        "total": sign,
+        "pending": sign if reservation_status == ReservationStatus.PENDING else 0,
+        "confirmed": sign if reservation_status == ReservationStatus.CONFIRMED else 0,
+        "cancelled": sign if reservation_status == ReservationStatus.CANCELLED else 0,
+        "guests": sign * (guests or 0) if reservation_status != ReservationStatus.CANCELLED else 0,
+    }
+
+
+def upsert_day_counts(connection, rows: list) -> None:
+    """ Add counter deltas with a single multi-row upsert """
+    #### one row per day , PostgreSQL can't update the same row twice in one upsert ####
+    merged = {}
+    for row in rows:
+        if row["reservation_date"] is None:
+            continue
+        entry = merged.setdefault(row["reservation_date"], dict(row, total=0, pending=0, confirmed=0, cancelled=0, guests=0))
+        for column in ("total", "pending", "confirmed", "cancelled", "guests"):
+            entry[column] += row[column]
+    if not merged:
+        return
+    dialect_insert = postgresql_insert if connection.dialect.name == "postgresql" else sqlite_insert
+    stmt = dialect_insert(ReservationDayCount).values(list(merged.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ReservationDayCount.reservation_date],
+        set_={
+            "total": ReservationDayCount.total + stmt.excluded.total,
+            "pending": ReservationDayCount.pending + stmt.excluded.pending,
+            "confirmed": ReservationDayCount.confirmed + stmt.excluded.confirmed,
+            "cancelled": ReservationDayCount.cancelled + stmt.excluded.cancelled,
+            "guests": ReservationDayCount.guests + stmt.excluded.guests,
+            "updated_at": func.now(),
+        }
+    )
+    connection.execute(stmt)
+
+
+# SqlAlchemy Event listeners keeping the per day counters in sync with reservations #
+@event.listens_for(Reservation, 'after_insert')
+def count_new_reservation(mapper, connection, target):
+    upsert_day_counts(connection, [
+        counter_row(target.reservation_date, target.status, target.number_of_guests, 1)
+    ])
+
+
+@event.listens_for(Reservation, 'after_update')
+def count_updated_reservation(mapper, connection, target):
+    """ Move the reservation between buckets when its day, status or guest count changed """
+    state = inspect(target)
+
+    def previous(attribute: str):
+        history = state.attrs[attribute].history
+        return history.deleted[0] if history.deleted else getattr(target, attribute)
+
+    old = (previous("reservation_date"), previous("status"), previous("number_of_guests"))
+    new = (target.reservation_date, target.status, target.number_of_guests)
+    if old == new:
+        return
+
+    upsert_day_counts(connection, [
+        counter_row(*old, -1),
+        counter_row(*new, 1),
+    ])
+
+
+@event.listens_for(Reservation, 'after_delete')
+def count_deleted_reservation(mapper, connection, target):
+    upsert_day_counts(connection, [
+        counter_row(target.reservation_date, target.status, target.number_of_guests, -1)
+    ])
@@ -1,15 +1,21 @@
 from Database.Database import Base
-from sqlalchemy import Column, Integer, String, DateTime, func, Enum as SAEnum, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Date, func, Enum as SAEnum, ForeignKey, Index, event
 from sqlalchemy.orm import relationship
 from Utils.Enums.Enums import ReservationStatus
 
 class Reservation(Base):
     __tablename__ = "reservations"
+    __table_args__ = (
+        Index("ix_reservations_table_time", "table_id", "reservation_time"),
+        Index("ix_reservations_date_status", "reservation_date", "status"),
+        Index("ix_reservations_user_id", "user_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     table_id = Column(Integer, ForeignKey("tables.id"), nullable=False)
     reservation_time = Column(DateTime, nullable=False)
+    reservation_date = Column(Date, nullable=True)  # derived from reservation_time , kept in sync by the listener below
     number_of_guests = Column(Integer, nullable=False)
     status = Column(SAEnum(ReservationStatus, native_enum=False), nullable=False, default=ReservationStatus.PENDING)
     special_requests = Column(String, nullable=True)
@@ -37,4 +43,15 @@ class Reservation(Base):
         }
 
     def __repr__(self):
-        return f"<Reservation(user_id={self.user_id}, table_id={self.table_id}, reservation_time={self.reservation_time})>"
\ No newline at end of file
+        return f"<Reservation(user_id={self.user_id}, table_id={self.table_id}, reservation_time={self.reservation_time})>"
+
+
+# SqlAlchemy Event listeners keeping reservation_date in sync with reservation_time #
+@event.listens_for(Reservation, 'before_insert')
+@event.listens_for(Reservation, 'before_update')
+def set_reservation_date(mapper, connection, target):
+    """
+    Day bucket of the reservation , admin day views and per-day counters read it instead of ranges on reservation_time.
+    """
+    if target.reservation_time is not None:
+        target.reservation_date = target.reservation_time.date()
@@ -0,0 +1,24 @@
+from Database.Database import Base
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, UniqueConstraint
+
+
+class ReservationSlot(Base):
+    """
+    Slot inventory of reservations : one row per table and slot an active reservation occupies.
+    The unique (table_id, slot_start) constraint makes the database reject double bookings,
+    even when two requests pass the availability check at the same time.
+    """
+    __tablename__ = "reservation_slots"
+
+    __table_args__ = (
+        UniqueConstraint("table_id", "slot_start", name="uq_reservation_slots_table_slot"),
+        {'extend_existing': True}
+    )
+
+    id = Column(Integer, primary_key=True)
+    table_id = Column(Integer, ForeignKey("tables.id", ondelete="CASCADE"), nullable=False)
+    slot_start = Column(DateTime, nullable=False)
+    reservation_id = Column(Integer, ForeignKey("reservations.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<ReservationSlot(table_id={self.table_id}, slot_start={self.slot_start}, reservation_id={self.reservation_id})>"
@@ -0,0 +1,36 @@
+from Database.Database import Base
+from sqlalchemy import Column, Integer, String, DateTime
+
+
+class RevokedToken(Base):
+    """
+    JWT ids (jti) of logged out access tokens and rotated / logged out refresh tokens.
+    A row is only needed until the token would have expired anyway , expired rows are cleaned up.
+    """
+    __tablename__ = "revoked_tokens"
+
+    __table_args__ = (
+        {'extend_existing': True}
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    jti = Column(String(64), nullable=False, unique=True, index=True)
+    username = Column(String, nullable=False, index=True)
+    token_type = Column(String(16), nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    revoked_at = Column(DateTime, nullable=False, index=True)
+    successor_jti = Column(String(64), nullable=True)  # refresh token that replaced a rotated one
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "jti": self.jti,
+            "username": self.username,
+            "token_type": self.token_type,
+            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
+            "revoked_at": self.revoked_at.isoformat() if self.revoked_at else None,
+            "successor_jti": self.successor_jti,
+        }
+
+    def __repr__(self):
+        return f"<RevokedToken(jti={self.jti}, token_type={self.token_type})>"
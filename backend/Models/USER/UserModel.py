@@ -21,6 +21,8 @@ class User(Base):
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now(), server_default=func.now())
     deleted_at = Column(DateTime)
+    #### tokens issued before this second are rejected ("log out everywhere") ####
+    tokens_valid_after = Column(DateTime, nullable=True)
 
     # Relationships
     favourite_products = relationship("FavouriteProduct", back_populates="user", lazy="dynamic")
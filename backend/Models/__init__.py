@@ -2,6 +2,7 @@
 
 # User model
 from Models.USER.UserModel import User
+from Models.USER.RevokedTokenModel import RevokedToken
 
 # Product models (bstarting with Base Product for others to inherits)
 from Models.PRODUCT.BaseProduct.BaseProductModel import Product
@@ -11,6 +12,8 @@ from Models.PRODUCT.Drink.DrinkModel import Drink
 from Models.PRODUCT.Kebab.KebabModel import Kebab
 from Models.PRODUCT.Salad.SaladModel import Salad
 from Models.PRODUCT.FavouriteProduct.FavouriteProductModel import FavouriteProduct
+from Models.PRODUCT.ProductSales.ProductSalesModel import ProductSales
+from Models.PRODUCT.ProductRating.ProductRatingSummaryModel import ProductRatingSummary
 
 # Cart models
 from Models.CART.CartModel import Cart
@@ -19,6 +22,8 @@ from Models.CART.CartItemModel import CartItem
 # Order models
 from Models.ORDER.OrderModel import Order
 from Models.ORDER.OrderItemModel import OrderItem
+from Models.ORDER.ArchivedOrderModel import ArchivedOrder
+from Models.ORDER.ArchivedOrderItemModel import ArchivedOrderItem
 
 # Comment model
 from Models.COMMENT.CommentModel import Comment
@@ -26,12 +31,16 @@ from Models.COMMENT.CommentModel import Comment
 # Reservation models
 from Models.RESERVATION.TableModel import Table
 from Models.RESERVATION.ReservationModel import Reservation
+from Models.RESERVATION.ReservationSlotModel import ReservationSlot
+from Models.RESERVATION.ReservationDayCountModel import ReservationDayCount
 
 # Payment model
 from Models.PAYMENT.PaymentModel import Payment
+from Models.PAYMENT.PaymentWebhookEventModel import PaymentWebhookEvent
 
 __all__ = [
     "User",
+    "RevokedToken",
     "Product",
     "Dessert",
     "Doner",
@@ -39,12 +48,19 @@ __all__ = [
     "Kebab",
     "Salad",
     "FavouriteProduct",
+    "ProductSales",
+    "ProductRatingSummary",
     "Cart",
     "CartItem",
     "Order",
     "OrderItem",
+    "ArchivedOrder",
+    "ArchivedOrderItem",
     "Comment",
     "Table",
     "Reservation",
+    "ReservationSlot",
+    "ReservationDayCount",
     "Payment",
+    "PaymentWebhookEvent",
 ]
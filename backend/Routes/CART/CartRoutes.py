@@ -6,7 +6,7 @@ from Controllers.CART.CartControllers import CartControllers
 from Schemas.CART.CartSchemas import CartItemCreate, CartItemUpdate
 from Models.USER.UserModel import User
 from Database.Database import get_db
-from Utils.SlowApi.SlowApi import limiter
+from Utils.SlowApi.SlowApi import limiter, route_limit
 from Routes.USER.UserRoutes import get_current_active_user, require_admin, require_staff_or_admin
 
 CartRouter = APIRouter(prefix="/cart", tags=["Cart"])
@@ -46,7 +46,7 @@ async def get_cart_summary(
 
 
 @CartRouter.post("/items", status_code=status.HTTP_201_CREATED, response_model=Dict[str, Any])
-@limiter.limit("30/minute")
+@limiter.limit(route_limit("cart.add_item"))
 async def add_item_to_cart(
     request: Request,
     item_data: CartItemCreate,
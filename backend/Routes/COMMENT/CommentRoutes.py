@@ -1,12 +1,13 @@
 from fastapi import APIRouter, status, Request, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from Controllers.COMMENT.CommentControllers import CommentControllers
+from Controllers.COMMENT.CommentModerationControllers import CommentModerationControllers
 from Schemas.COMMENT.CommentSchemas import CommentCreate, CommentUpdate
 from Models.USER.UserModel import User
 from Database.Database import get_db
-from Utils.SlowApi.SlowApi import limiter
+from Utils.SlowApi.SlowApi import limiter, route_limit
 from Routes.USER.UserRoutes import get_current_active_user, require_admin, require_staff_or_admin
 
 CommentRouter = APIRouter(prefix="/comments", tags=["Comments"])
@@ -36,6 +37,28 @@ async def get_product_comments(
     return await CommentControllers.get_comments_by_product_id(product_id, skip, limit, db)
 
 
+@CommentRouter.get("/product/{product_id}/feed", response_model=Dict[str, Any])
+async def get_product_comment_feed(
+    product_id: int,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of comments"),
+    include_total: bool = Query(False, description="Also count all active comments of the product"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get the active comments of a product, newest first, page by page.
+    
+    - **product_id**: ID of the product
+    - **cursor**: Cursor returned as next_cursor by the previous page (omit for the first page)
+    - **limit**: Maximum comments per page (default: 20, max: 100)
+    - **include_total**: Include the total number of active comments (default: false)
+    
+    Cursor pages stay fast on products with many comments, unlike skip/limit.
+    Public endpoint.
+    """
+    return await CommentControllers.get_product_comment_feed(product_id, cursor, limit, include_total, db)
+
+
 @CommentRouter.get("/{comment_id}", response_model=Dict[str, Any])
 async def get_comment_by_id(
     comment_id: int,
@@ -54,7 +77,7 @@ async def get_comment_by_id(
 # ============================================ #
 
 @CommentRouter.post("/", status_code=status.HTTP_201_CREATED, response_model=Dict[str, Any])
-@limiter.limit("10/minute")
+@limiter.limit(route_limit("comments.create"))
 async def create_comment(
     request: Request,
     comment_data: CommentCreate,
@@ -184,6 +207,41 @@ async def get_comment_statistics(db: AsyncSession = Depends(get_db)):
     return await CommentControllers.get_comment_statistics(db)
 
 
+@CommentRouter.get("/admin/moderation/queue", response_model=Dict[str, Any], dependencies=[Depends(require_staff_or_admin)])
+async def get_moderation_queue(
+    queue_status: str = Query("flagged", alias="status", description="flagged, hidden or pending"),
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of records"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Admin/Staff: Comments in the moderation queue, highest spam / profanity score first.
+    
+    - **status**: flagged (visible, needs a decision), hidden (auto-hidden or hidden by staff) or pending (not scored yet)
+    - **skip**: Number of records to skip (default: 0)
+    - **limit**: Maximum records to return (default: 50, max: 200)
+    """
+    return await CommentModerationControllers.get_moderation_queue(queue_status, skip, limit, db)
+
+
+@CommentRouter.post("/admin/moderation/{comment_id}/approve", response_model=Dict[str, Any], dependencies=[Depends(require_staff_or_admin)])
+async def approve_moderated_comment(comment_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Admin/Staff: Approve a comment from the moderation queue.
+    
+    A comment hidden by moderation becomes visible again.
+    """
+    return await CommentModerationControllers.review_comment(comment_id, True, db)
+
+
+@CommentRouter.post("/admin/moderation/{comment_id}/hide", response_model=Dict[str, Any], dependencies=[Depends(require_staff_or_admin)])
+async def hide_moderated_comment(comment_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Admin/Staff: Hide a comment from the moderation queue.
+    """
+    return await CommentModerationControllers.review_comment(comment_id, False, db)
+
+
 @CommentRouter.post("/{comment_id}/deactivate", response_model=Dict[str, Any], dependencies=[Depends(require_admin)])
 async def deactivate_comment(
     comment_id: int,
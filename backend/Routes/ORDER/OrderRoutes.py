@@ -4,10 +4,11 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 
 from Controllers.ORDER.OrderControllers import OrderControllers
+from Controllers.ORDER.OrderArchiveControllers import OrderArchiveControllers
 from Schemas.ORDER.OrderSchemas import OrderCreate, OrderUpdate
 from Models.USER.UserModel import User
 from Database.Database import get_db
-from Utils.SlowApi.SlowApi import limiter
+from Utils.SlowApi.SlowApi import limiter, route_limit
 from Utils.Enums.Enums import OrderStatus
 from Routes.USER.UserRoutes import get_current_active_user, require_admin, require_staff_or_admin
 
@@ -52,7 +53,7 @@ async def get_my_order(
 
 
 @OrderRouter.post("/", status_code=status.HTTP_201_CREATED, response_model=Dict[str, Any])
-@limiter.limit("10/minute")
+@limiter.limit(route_limit("orders.create"))
 async def create_order(
     request: Request,
     order_data: OrderCreate,
@@ -191,6 +192,24 @@ async def admin_cancel_order(
     return await OrderControllers.admin_cancels_order(order_id, db)
 
 
+@OrderRouter.post("/admin/archive/run", response_model=Dict[str, Any], dependencies=[Depends(require_admin)])
+async def run_order_archive(
+    older_than_days: Optional[int] = Query(None, ge=0, description="Archive finished orders older than this many days (default: ORDER_ARCHIVE_AFTER_DAYS)"),
+    batch_size: Optional[int] = Query(None, ge=1, le=10000, description="Orders moved per transaction (default: ORDER_ARCHIVE_BATCH_SIZE)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Admin: Move old completed / cancelled orders into the archive tables.
+    
+    - **older_than_days**: Minimum order age in days
+    - **batch_size**: Number of orders moved per transaction
+    
+    Archived orders still show up in listings, lookups and statistics.
+    Pending orders are never archived.
+    """
+    return await OrderArchiveControllers.archive_orders(db, older_than_days, batch_size)
+
+
 @OrderRouter.get("/admin/statistics/overview", response_model=Dict[str, Any], dependencies=[Depends(require_staff_or_admin)])
 async def get_order_statistics(db: AsyncSession = Depends(get_db)):
     """
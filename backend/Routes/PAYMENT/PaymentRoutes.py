@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends, status, Request, Query
+from fastapi import APIRouter, Depends, status, Request, Query, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any, Optional
 
 from Controllers.PAYMENT.PaymentControllers import PaymentControllers
+from Controllers.PAYMENT.PaymentWebhookControllers import PaymentWebhookControllers
 from Schemas.PAYMENT.PaymentSchemas import PaymentCreate, PaymentUpdate
 from Models.USER.UserModel import User
 from Database.Database import get_db
-from Utils.SlowApi.SlowApi import limiter
+from Utils.SlowApi.SlowApi import limiter, route_limit
 from Utils.Enums.Enums import PaymentStatus
 from Routes.USER.UserRoutes import get_current_active_user, require_admin, require_staff_or_admin
 
@@ -18,7 +19,7 @@ PaymentRouter = APIRouter(prefix="/payments", tags=["Payments"])
 # ============================================ #
 
 @PaymentRouter.post("/", status_code=status.HTTP_201_CREATED, response_model=Dict[str, Any])
-@limiter.limit("5/minute")
+@limiter.limit(route_limit("payments.create"))
 async def create_payment(
     request: Request,
     payment_data: PaymentCreate,
@@ -95,6 +96,27 @@ async def simulate_payment_completion(
     return await PaymentControllers.simulate_payment_completion(current_user, payment_id, db)
 
 
+# ============================================ #
+        # PROVIDER WEBHOOK ROUTES #
+# ============================================ #
+
+@PaymentRouter.post("/webhook/iyzico", status_code=status.HTTP_202_ACCEPTED, response_model=Dict[str, Any])
+async def iyzico_webhook(
+    payload: Dict[str, Any],
+    x_iyz_signature_v3: Optional[str] = Header(None, alias="X-IYZ-SIGNATURE-V3"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Provider : Iyzico payment notification.
+
+    - **X-IYZ-SIGNATURE-V3**: HMAC signature of the notification (header)
+
+    The notification is verified and stored in the webhook inbox , background workers
+    update the payment, its orders and reservation. Duplicate deliveries are applied once.
+    """
+    return await PaymentWebhookControllers.enqueue_iyzico_webhook(payload, x_iyz_signature_v3, db)
+
+
 # ============================================ #
         # ADMIN/STAFF ROUTES #
 # ============================================ #
@@ -159,6 +181,18 @@ async def get_payment_statistics(db: AsyncSession = Depends(get_db)):
     return await PaymentControllers.admin_get_payment_statistics(db)
 
 
+@PaymentRouter.get("/admin/webhooks/statistics", response_model=Dict[str, Any], dependencies=[Depends(require_admin)])
+async def get_webhook_queue_statistics(db: AsyncSession = Depends(get_db)):
+    """
+    Admin : Get payment webhook inbox statistics.
+
+    Returns:
+    - Pending (not yet processed) notifications
+    - Processed notifications by result (applied, duplicate, ignored, error)
+    """
+    return await PaymentWebhookControllers.admin_get_queue_statistics(db)
+
+
 @PaymentRouter.get("/admin/user/{user_id}", response_model=Dict[str, Any], dependencies=[Depends(require_staff_or_admin)])
 async def get_user_payments(
     user_id: int,
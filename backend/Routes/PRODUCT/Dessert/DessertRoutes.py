@@ -5,7 +5,7 @@ from typing import Dict, Any
 from Controllers.PRODUCT.Dessert.DessertControllers import DessertControllers
 from Schemas.PRODUCT.Dessert.DessertSchemas import DessertCreate, DessertUpdate
 from Database.Database import get_db
-from Utils.SlowApi.SlowApi import limiter
+from Utils.SlowApi.SlowApi import limiter, route_limit
 from Routes.USER.UserRoutes import require_admin
 
 DessertRouter = APIRouter(prefix="/desserts", tags=["Desserts"])
@@ -20,6 +20,7 @@ async def get_all_desserts(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=500, description="Maximum number of records"),
     include_inactive: bool = Query(False, description="Include inactive desserts"),
+    sort_by: str = Query("newest", description="Order by newest, rating or most_rated"),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -28,8 +29,9 @@ async def get_all_desserts(
     - **skip**: Number of records to skip (default: 0)
     - **limit**: Maximum records to return (default: 100, max: 500)
     - **include_inactive**: Include inactive desserts (default: false)
+    - **sort_by**: newest (default), rating (highest average first) or most_rated
     """
-    return await DessertControllers.get_all_desserts(skip, limit, include_inactive, db)
+    return await DessertControllers.get_all_desserts(skip, limit, include_inactive, sort_by, db)
 
 
 @DessertRouter.get("/{dessert_id}", response_model=Dict[str, Any])
@@ -48,7 +50,7 @@ async def get_dessert_by_id(
 # ============================================ #
 
 @DessertRouter.post("/", status_code=status.HTTP_201_CREATED, response_model=Dict[str, Any], dependencies=[Depends(require_admin)])
-@limiter.limit("10/minute")
+@limiter.limit(route_limit("products.create"))
 async def create_dessert(
     request: Request,
     dessert_data: DessertCreate,
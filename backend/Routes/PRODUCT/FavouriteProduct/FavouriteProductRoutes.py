@@ -6,7 +6,7 @@ from Controllers.PRODUCT.FavouriteProduct.FavouriteProductControllers import Fav
 from Schemas.PRODUCT.FavouriteProduct.FavouriteProductSchemas import FavouriteProductCreate
 from Models.USER.UserModel import User
 from Database.Database import get_db
-from Utils.SlowApi.SlowApi import limiter
+from Utils.SlowApi.SlowApi import limiter, route_limit
 from Routes.USER.UserRoutes import get_current_active_user, require_admin
 
 FavouriteProductRouter = APIRouter(prefix="/favourites", tags=["Favourites"])
@@ -32,7 +32,7 @@ async def get_my_favourite_products(
 
 
 @FavouriteProductRouter.post("/", status_code=status.HTTP_201_CREATED, response_model=Dict[str, Any])
-@limiter.limit("20/minute")
+@limiter.limit(route_limit("favourites.add"))
 async def add_favourite_product(
     request: Request,
     favourite_data: FavouriteProductCreate,
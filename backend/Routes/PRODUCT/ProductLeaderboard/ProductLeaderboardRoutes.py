@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Any
+
+from Controllers.PRODUCT.ProductLeaderboard.ProductLeaderboardControllers import ProductLeaderboardControllers
+from Database.Database import get_db
+
+ProductLeaderboardRouter = APIRouter(prefix="/products/leaderboards", tags=["Products"])
+
+
+# ============================================ #
+            # PUBLIC ROUTES #
+# ============================================ #
+
+@ProductLeaderboardRouter.get("/", response_model=Dict[str, Any])
+async def list_leaderboards():
+    """
+    List the available leaderboards and time windows.
+    """
+    return ProductLeaderboardControllers.list_leaderboards()
+
+
+@ProductLeaderboardRouter.get("/{board}", response_model=Dict[str, Any])
+async def get_leaderboard(
+    board: str,
+    window: str = Query("all", description="Time window: 7d, 30d or all"),
+    limit: int = Query(10, ge=1, le=100, description="Number of products to return"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get a product leaderboard.
+
+    - **board**: most_commented or most_favourited
+    - **window**: 7d, 30d or all (default: all)
+    - **limit**: Number of products to return (default: 10, max: 100)
+
+    Results are cached for a few seconds (LEADERBOARD_CACHE_SECONDS).
+    """
+    return await ProductLeaderboardControllers.get_leaderboard(board, window, limit, db)
@@ -0,0 +1 @@
+### Product Leaderboard Routes __init__.py file ###
\ No newline at end of file
@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Any
+
+from Controllers.PRODUCT.ProductRating.ProductRatingControllers import ProductRatingControllers
+from Database.Database import get_db
+from Routes.USER.UserRoutes import require_admin
+
+ProductRatingRouter = APIRouter(prefix="/products", tags=["Products"])
+
+
+# ============================================ #
+            # PUBLIC ROUTES #
+# ============================================ #
+
+@ProductRatingRouter.get("/{product_id}/rating", response_model=Dict[str, Any])
+async def get_product_rating(product_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Get the rating summary of a product.
+
+    - **product_id**: Product ID
+
+    Returns the average, the number of ratings and a 1-5 star histogram of active comments.
+    """
+    return await ProductRatingControllers.get_product_rating(product_id, db)
+
+
+# ============================================ #
+            # ADMIN ROUTES #
+# ============================================ #
+
+@ProductRatingRouter.post("/ratings/rebuild", response_model=Dict[str, Any], dependencies=[Depends(require_admin)])
+async def rebuild_product_rating_summaries(db: AsyncSession = Depends(get_db)):
+    """
+    Admin: Recompute product rating summaries from all comments.
+
+    Summaries are kept up to date automatically , this is only needed after editing comments outside the API.
+    """
+    return await ProductRatingControllers.admin_rebuild_summaries(db)
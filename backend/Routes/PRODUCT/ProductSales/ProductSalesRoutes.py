@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Any
+
+from Controllers.PRODUCT.ProductSales.ProductSalesControllers import ProductSalesControllers
+from Database.Database import get_db
+from Routes.USER.UserRoutes import require_admin
+
+ProductSalesRouter = APIRouter(prefix="/products", tags=["Products"])
+
+
+# ============================================ #
+            # PUBLIC ROUTES #
+# ============================================ #
+
+@ProductSalesRouter.get("/best-sellers", response_model=Dict[str, Any])
+async def get_best_sellers(
+    limit: int = Query(10, ge=1, le=100, description="Number of products to return"),
+    sort_by: str = Query("quantity", description="Rank by quantity, revenue or orders"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get the best selling products across all categories.
+    
+    - **limit**: Number of products to return (default: 10, max: 100)
+    - **sort_by**: quantity (default), revenue or orders
+    
+    Only completed orders are counted.
+    """
+    return await ProductSalesControllers.get_best_sellers(limit, sort_by, db)
+
+
+# ============================================ #
+            # ADMIN ROUTES #
+# ============================================ #
+
+@ProductSalesRouter.post("/best-sellers/rebuild", response_model=Dict[str, Any], dependencies=[Depends(require_admin)])
+async def rebuild_product_sales_counters(db: AsyncSession = Depends(get_db)):
+    """
+    Admin: Recompute product sales counters from all completed orders.
+    
+    Only needed once for orders completed before counters existed , counters are kept up to date automatically afterwards.
+    """
+    return await ProductSalesControllers.admin_rebuild_counters(db)
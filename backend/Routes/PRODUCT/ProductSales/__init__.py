@@ -0,0 +1 @@
+### Product Sales Routes __init__.py file ###
\ No newline at end of file
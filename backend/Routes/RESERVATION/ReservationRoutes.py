@@ -1,13 +1,14 @@
 from fastapi import APIRouter, HTTPException, status, Request, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, date
 
 from Controllers.RESERVATION.ReservationControllers import ReservationControllers
-from Schemas.RESERVATION.ReservationSchemas import ReservationCreate, ReservationUpdate, ReservationRead
+from Controllers.RESERVATION.TableAssignmentControllers import TableAssignmentControllers
+from Schemas.RESERVATION.ReservationSchemas import ReservationCreate, ReservationUpdate, ReservationRead, PartyRequest, BatchAssignmentRequest
 from Models.USER.UserModel import User
 from Database.Database import get_db
-from Utils.SlowApi.SlowApi import limiter
+from Utils.SlowApi.SlowApi import limiter, route_limit
 from Utils.Enums.Enums import ReservationStatus
 
 # Import auth dependencies from UserRoutes
@@ -22,7 +23,7 @@ ReservationRouter = APIRouter(prefix="/reservations", tags=["Reservations"])
 # ============================================ #
 
 @ReservationRouter.post("/", status_code=status.HTTP_201_CREATED, response_model=Dict[str, Any])
-@limiter.limit("5/minute")
+@limiter.limit(route_limit("reservations.create"))
 async def create_reservation(
     request: Request,
     reservation_data: ReservationCreate,
@@ -49,6 +50,28 @@ async def create_reservation(
     )
 
 
+@ReservationRouter.post("/auto-assign", status_code=status.HTTP_201_CREATED, response_model=Dict[str, Any])
+@limiter.limit(route_limit("reservations.create"))
+async def create_reservation_auto_assign(
+    request: Request,
+    party: PartyRequest,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    User : Create a reservation on the best fitting free table.
+    
+    - **reservation_time**: Datetime for the reservation (must be in future)
+    - **number_of_guests**: Number of guests (1-20)
+    - **location**: Preferred location (window, patio, main_dining_room) (optional)
+    - **special_requests**: Optional special requests or notes
+
+    The table with the fewest empty seats is chosen, the preferred location breaks ties.
+    - Rate limited to 5 reservations per minute for security.
+    """
+    return await TableAssignmentControllers.book_best_table(current_user, party, db)
+
+
 @ReservationRouter.get("/my-reservations", response_model=List[Dict[str, Any]])
 async def get_my_reservations(
     include_cancelled: bool = Query(False, description="Include cancelled reservations"),
@@ -140,6 +163,26 @@ async def get_all_reservations(
     )
 
 
+@ReservationRouter.post("/admin/assign-batch", response_model=Dict[str, Any])
+async def assign_tables_batch(
+    batch: BatchAssignmentRequest,
+    current_user: User = Depends(require_staff_or_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Admin : Assign tables to many parties at once (event bookings).
+    
+    - **parties**: List of parties (reservation_time, number_of_guests, location, special_requests)
+    - **create_reservations**: Book the assignments (default: false , only plan them)
+    
+    Largest parties are seated first on the table leaving the fewest empty seats.
+    Returns the table of every party (null if it can't be seated) and seat utilization.
+    """
+    return await TableAssignmentControllers.admin_assign_batch(
+        current_user, batch.parties, batch.create_reservations, db
+    )
+
+
 @ReservationRouter.post("/{reservation_id}/confirm", response_model=Dict[str, Any], dependencies=[Depends(require_staff_or_admin)])
 async def confirm_reservation(
     reservation_id: int,
@@ -189,4 +232,31 @@ async def get_reservation_statistics(db: AsyncSession = Depends(get_db)):
     - Upcoming reservations (next 7 days)
     - Today's reservations
     """
-    return await ReservationControllers.get_reservation_statistics(db)
\ No newline at end of file
+    return await ReservationControllers.get_reservation_statistics(db)
+
+
+@ReservationRouter.get("/admin/day-counts", response_model=List[Dict[str, Any]], dependencies=[Depends(require_staff_or_admin)])
+async def get_reservation_day_counts(
+    start_date: date = Query(..., description="First day (YYYY-MM-DD)"),
+    end_date: date = Query(..., description="Last day (YYYY-MM-DD)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Admin : Get per day reservation counters for the dashboard.
+    
+    - **start_date**: First day (inclusive)
+    - **end_date**: Last day (inclusive)
+    
+    Days without reservations are left out.
+    """
+    return await ReservationControllers.get_day_counts(start_date, end_date, db)
+
+
+@ReservationRouter.post("/admin/day-counts/rebuild", response_model=Dict[str, Any], dependencies=[Depends(require_admin)])
+async def rebuild_reservation_day_counts(db: AsyncSession = Depends(get_db)):
+    """
+    Admin : Recompute the per day reservation counters from the reservations table.
+    
+    Counters are kept up to date automatically , use this after manual database edits.
+    """
+    return await ReservationControllers.admin_rebuild_day_counts(db)
@@ -1,14 +1,15 @@
-from fastapi import APIRouter, status, Depends, Request
+from fastapi import APIRouter, status, Depends, Request, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, date
 
 from Models.RESERVATION.TableModel import Table
 from Models.USER.UserModel import User
 from Schemas.RESERVATION.TableSchemas import TableCreate, TableUpdate, TableRead
 from Controllers.RESERVATION.TableControllers import TableControllers
+from Controllers.RESERVATION.TableAssignmentControllers import TableAssignmentControllers
 from Database.Database import get_db
-from Utils.SlowApi.SlowApi import limiter
+from Utils.SlowApi.SlowApi import limiter, route_limit
 from Utils.Enums.Enums import UserRole
 
 # Import auth dependencies from UserRoutes
@@ -32,6 +33,56 @@ async def get_all_tables(db: AsyncSession = Depends(get_db)):
     return await TableControllers.get_all_tables(db)
 
 
+@TableRouter.get("/availability-grid", response_model=Dict[str, Any])
+async def get_availability_grid(
+    date: date = Query(..., description="Service day (YYYY-MM-DD)"),
+    slot_minutes: Optional[int] = Query(None, ge=5, le=240, description="Slot size in minutes"),
+    min_capacity: Optional[int] = None,
+    location: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get availability of every table for every time slot of a day.
+    
+    - **date**: Service day (YYYY-MM-DD)
+    - **slot_minutes**: Slot size in minutes (default: RESERVATION_SLOT_MINUTES)
+    - **min_capacity**: Minimum table capacity required
+    - **location**: Filter by location (window, patio, main_dining_room)
+    
+    Each table has an "available" list aligned with "slots".
+    Public endpoint.
+    """
+    return await TableControllers.get_availability_grid(
+        day=date,
+        slot_minutes=slot_minutes,
+        min_capacity=min_capacity,
+        location=location,
+        db=db
+    )
+
+
+@TableRouter.get("/suggest", response_model=Dict[str, Any])
+async def suggest_tables(
+    party_size: int = Query(..., ge=1, le=20, description="Number of guests"),
+    date_time: datetime = Query(..., description="Reservation datetime (ISO format)"),
+    location: Optional[str] = None,
+    limit: int = Query(5, ge=1, le=20, description="Maximum number of tables"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get the best fitting free tables for a party.
+    
+    - **party_size**: Number of guests
+    - **date_time**: Reservation datetime (ISO format)
+    - **location**: Preferred location (window, patio, main_dining_room)
+    - **limit**: Maximum number of tables (default: 5)
+    
+    Tables with the fewest empty seats come first.
+    Public endpoint.
+    """
+    return await TableAssignmentControllers.suggest_tables(party_size, date_time, location, limit, db)
+
+
 @TableRouter.get("/{table_id}", response_model=Dict[str, Any])
 async def get_table_by_id(
     table_id: int,
@@ -89,7 +140,7 @@ async def get_tables_by_location(
 # ============================================ #
 
 @TableRouter.post("/", status_code=status.HTTP_201_CREATED, response_model=Dict[str, Any], dependencies=[Depends(require_admin)])
-@limiter.limit("10/minute")
+@limiter.limit(route_limit("tables.create"))
 async def create_table(
     request: Request,
     table_data: TableCreate,
@@ -1,6 +1,6 @@
-from fastapi import APIRouter, HTTPException, status, Depends, Request, Body
+from fastapi import APIRouter, HTTPException, status, Depends, Request, Body, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from Controllers.USER.UserControllers import UserControllers, oauth2_scheme
 from Schemas.USER.UserSchemas import (
@@ -8,6 +8,7 @@ from Schemas.USER.UserSchemas import (
     UserLogin, 
     UserProfileUpdate,
     AdminCreateUser,
+    AdminBulkCreateUsers,
     AdminUpdateUser,
     Token,
     UserProfileRead
@@ -15,7 +16,8 @@ from Schemas.USER.UserSchemas import (
 from Models.USER.UserModel import User
 from Database.Database import get_db
 from Utils.Enums.Enums import UserRole
-from Utils.SlowApi.SlowApi import limiter
+from Utils.SlowApi.SlowApi import limiter, route_limit
+from Utils.Auth.HashPassword import password_hash_pool
 
 UserRouter = APIRouter(prefix="/users", tags=["Users"])
 
@@ -73,7 +75,7 @@ async def require_staff_or_admin(
 ########################
 
 @UserRouter.post("/register", status_code=status.HTTP_201_CREATED, response_model=Dict[str, Any])
-@limiter.limit("5/minute")
+@limiter.limit(route_limit("users.register"))
 async def register(
     request: Request,
     user_data: UserRegister,
@@ -91,7 +93,7 @@ async def register(
 
 
 @UserRouter.post("/login", response_model=Dict[str, Any])
-@limiter.limit("10/minute")
+@limiter.limit(route_limit("users.login"))
 async def login(
     request: Request,
     credentials: UserLogin,
@@ -106,16 +108,35 @@ async def login(
 
 
 @UserRouter.post("/logout", response_model=Dict[str, str])
-async def logout(current_user: User = Depends(get_current_active_user)):
+async def logout(
+    refresh_token: Optional[str] = Body(None, embed=True),
+    token: str = Depends(oauth2_scheme),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
     """
     Logout current user.
-    Front End handles the Log Out functionality . Make Sure to Delete Tokens
+    Revokes the access token used for this request.
+
+    - **refresh_token**: Refresh token of this session , revoked as well (optional)
+    """
+    return await UserControllers.logout_user(token, refresh_token, current_user, db)
+
+
+@UserRouter.post("/logout-all", response_model=Dict[str, str])
+async def logout_all(
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Log out everywhere.
+    Every access and refresh token of the current user issued until now stops working.
     """
-    return await UserControllers.logout_user()
+    return await UserControllers.logout_all_sessions(current_user, db)
 
 
 @UserRouter.post("/refresh", response_model=Dict[str, Any])
-@limiter.limit("20/minute")
+@limiter.limit(route_limit("users.refresh"))
 async def refresh_access_token(
     request: Request,
     refresh_token: str = Body(..., embed=True),
@@ -123,8 +144,9 @@ async def refresh_access_token(
 ):
     """
     Get new access token using refresh token.
+    The refresh token is rotated : the response contains a new one and the used one is revoked.
     
-    - **refresh_token**: Valid refresh token from login
+    - **refresh_token**: Valid refresh token from login or the previous refresh
     20 requests per minute for security.
     """
     return await UserControllers.refresh_token(refresh_token, db)
@@ -136,13 +158,19 @@ async def refresh_access_token(
 
 @UserRouter.get("/me", response_model=UserProfileRead)
 async def get_my_profile(
+    include: Optional[str] = Query(None, description="Comma separated: favourite_products, orders, comments, reservations, payments, cart"),
+    skip: int = Query(0, ge=0, description="Number of records to skip in each included list"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of records in each included list"),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Get current user's profile information.
+    Get current user's profile information with relationship counts.
+    
+    - **include**: Sub-resources to list as IDs (newest first), e.g. orders,comments
+    - **skip** / **limit**: Page of each included list (default: 0 / 20)
     """
-    return await UserControllers.get_user_profile(current_user, db)
+    return await UserControllers.get_user_profile(current_user, db, include, skip, limit)
 
 
 @UserRouter.put("/me", response_model=Dict[str, Any])
@@ -194,6 +222,18 @@ async def get_all_users(
     return await UserControllers.get_all_users(skip, limit, db)
 
 
+@UserRouter.get("/admin/password-pool", response_model=Dict[str, Any], dependencies=[Depends(require_admin)])
+async def get_password_pool_stats():
+    """
+    Admin : Password hashing pool metrics.
+
+    - **pending**: Hash / verify operations running or waiting
+    - **queued**: Operations waiting for a free worker
+    - **rejected**: Operations refused with 429 because the pool was full
+    """
+    return password_hash_pool.stats()
+
+
 @UserRouter.get("/admin/{user_id}", response_model=Dict[str, Any], dependencies=[Depends(require_admin)])
 async def get_user_by_id(
     user_id: int,
@@ -216,6 +256,19 @@ async def create_user(
     return await UserControllers.create_new_user(user_data, db)
 
 
+@UserRouter.post("/admin/bulk-create", status_code=status.HTTP_201_CREATED, response_model=Dict[str, Any], dependencies=[Depends(require_admin)])
+async def bulk_create_users(
+    payload: AdminBulkCreateUsers,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Admin: Create up to 500 users (with their carts) in one request , all or nothing.
+    
+    - **users**: Same fields as /admin/create for every user
+    """
+    return await UserControllers.bulk_create_users(payload, db)
+
+
 @UserRouter.put("/admin/{user_id}", response_model=Dict[str, Any], dependencies=[Depends(require_admin)])
 async def update_user(
     user_id: int,
@@ -282,34 +335,51 @@ async def change_user_role(
 @UserRouter.get("/admin/role/{role}", response_model=List[Dict[str, Any]], dependencies=[Depends(require_admin)])
 async def get_users_by_role(
     role: UserRole,
+    skip: int = 0,
+    limit: int = 100,
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Admin: Get all users with specific role.
+    Admin: Get users with specific role.
+    
+    - **skip**: Number of records to skip (default: 0)
+    - **limit**: Maximum number of records to return (default: 100)
     """
-    return await UserControllers.get_users_by_role(role, db)
+    return await UserControllers.get_users_by_role(role, skip, limit, db)
 
 
 @UserRouter.get("/admin/status/{is_active}", response_model=List[Dict[str, Any]], dependencies=[Depends(require_admin)])
 async def get_users_by_status(
     is_active: bool,
+    skip: int = 0,
+    limit: int = 100,
     db: AsyncSession = Depends(get_db)
 ):
     """
     Admin: Get users by active/inactive status.
+    
+    - **skip**: Number of records to skip (default: 0)
+    - **limit**: Maximum number of records to return (default: 100)
     """
-    return await UserControllers.get_users_by_status(is_active, db)
+    return await UserControllers.get_users_by_status(is_active, skip, limit, db)
 
 
 @UserRouter.get("/admin/search/{search}", response_model=List[Dict[str, Any]], dependencies=[Depends(require_admin)])
 async def search_users(
     search: str,
+    skip: int = 0,
+    limit: int = 100,
+    typeahead: bool = Query(False, description="Light results for search-as-you-type (max 20 , cached briefly)"),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Admin: Search users by username, email, or phone.
+    Admin: Search users by username, email, or phone , most relevant first.
+    
+    - **skip**: Number of records to skip (default: 0)
+    - **limit**: Maximum number of records to return (default: 100)
+    - **typeahead**: Return id , username , email , role and status only (terms shorter than 2 characters return nothing)
     """
-    return await UserControllers.search_user_by_values(search, db)
+    return await UserControllers.search_user_by_values(search, skip, limit, typeahead, db)
 
 
 @UserRouter.get("/admin/statistics", response_model=Dict[str, Any], dependencies=[Depends(require_admin)])
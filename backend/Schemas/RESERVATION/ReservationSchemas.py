@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 from typing import Optional, List
 from datetime import datetime, timezone
-from Utils.Enums.Enums import ReservationStatus
+from Utils.Enums.Enums import ReservationStatus, TableLocation
 
 model_conf = ConfigDict(from_attributes=True, orm_mode=True)
 
@@ -49,4 +49,28 @@ class ReservationRead(ReservationBase):
 
 class ReservationInDB(ReservationRead):
     model_config = model_conf
-    deleted_at: Optional[datetime] = None
\ No newline at end of file
+    deleted_at: Optional[datetime] = None
+
+
+class PartyRequest(BaseModel):
+    """ A party to seat : the table is picked by the assignment engine """
+    model_config = model_conf
+    reservation_time: datetime
+    number_of_guests: int = Field(..., ge=1, le=20)
+    location: Optional[TableLocation] = None
+    special_requests: Optional[str] = Field(None, max_length=500)
+
+    @field_validator('reservation_time')
+    def validate_future_time(cls, v):
+        now = datetime.now(timezone.utc)
+        reservation_time = v if v.tzinfo else v.replace(tzinfo=timezone.utc)
+        
+        if reservation_time < now:
+            raise ValueError('Reservation time must be in the future')
+        return v
+
+
+class BatchAssignmentRequest(BaseModel):
+    model_config = model_conf
+    parties: List[PartyRequest] = Field(..., min_length=1, max_length=200)
+    create_reservations: bool = False
@@ -200,6 +200,16 @@ class AdminCreateUser(BaseModel):
             raise ValueError("Password must contain at least one special character")
         return v
 
+#### users per bulk create request , every password is hashed before the insert ####
+BULK_CREATE_MAX_USERS = 500
+
+class AdminBulkCreateUsers(BaseModel):
+    """
+    Schema for admin to create many users at once (e.g. corporate catering accounts).
+    """
+    model_config = model_conf
+    users: List[AdminCreateUser] = Field(..., min_length=1, max_length=BULK_CREATE_MAX_USERS)
+
 class AdminUpdateUser(BaseModel):
     """
     Schema for admin to update user information.
@@ -282,6 +292,13 @@ class UserProfileRead(BaseModel):
     role: str
     is_active: bool
     created_at: datetime
+    favourite_products_count: int = 0
+    orders_count: int = 0
+    comments_count: int = 0
+    reservations_count: int = 0
+    payments_count: int = 0
+    cart_items_count: int = 0
+    #### filled only for sub-resources requested with ?include= , one page each ####
     favourite_products: List[int] = Field(default_factory=list)
     orders: List[int] = Field(default_factory=list)
     comments: List[int] = Field(default_factory=list)
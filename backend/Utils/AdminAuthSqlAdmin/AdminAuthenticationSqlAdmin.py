@@ -2,9 +2,10 @@ from sqladmin.authentication import AuthenticationBackend
 from starlette.requests import Request
 from starlette.responses import RedirectResponse
 from sqlalchemy import select
+from fastapi import HTTPException
 from Database.Database import AsyncSessionLocal
 from Models.USER.UserModel import User
-from Utils.Auth.HashPassword import verify_password
+from Utils.Auth.HashPassword import verify_password_async
 from Utils.Enums.Enums import UserRole
 from Utils.Auth.JWT import create_access_token
 
@@ -25,7 +26,11 @@ class AdminAuth(AuthenticationBackend):
         if not user:
             return False
             
-        if not verify_password(password, user.hashed_password):
+        #### password pool saturated (429) -> treated as a failed login ####
+        try:
+            if not await verify_password_async(password, user.hashed_password):
+                return False
+        except HTTPException:
             return False
             
         #### Only allow ADMINs ####
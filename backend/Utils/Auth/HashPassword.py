@@ -1,15 +1,57 @@
-from typing import Dict
+from typing import Dict, Any, Callable, Optional, List
+import os
+import time
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
+from dotenv import load_dotenv
 
 ## logging config ##
 logger = logging.getLogger(__name__)
 
+load_dotenv()
+
+#### bcrypt runs in its own bounded thread pool (bcrypt releases the GIL) , never on the event loop ####
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", min(4, os.cpu_count() or 1)))
+#### running + waiting password operations allowed before new ones are rejected with 429 ####
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 32))
+
+#### Scheme and cost of new hashes , hashes made with another scheme or cost still verify ####
+#### and are upgraded on the next successful login (python -m Utils.Auth.PasswordHashCalibration picks the cost) ####
+SUPPORTED_PASSWORD_SCHEMES = ("bcrypt", "argon2", "pbkdf2_sha256")
+DEFAULT_PASSWORD_HASH_ROUNDS = {"bcrypt": 12}
+
+PASSWORD_HASH_SCHEME = os.getenv("PASSWORD_HASH_SCHEME", "bcrypt").strip().lower()
+PASSWORD_HASH_ROUNDS = os.getenv("PASSWORD_HASH_ROUNDS", "").strip()
+
+
+def build_password_context(scheme: str, rounds: Optional[int] = None) -> CryptContext:
+    """
+    CryptContext hashing with `scheme` at `rounds` (passlib's default cost when None).
+    The other supported schemes stay verify-only and are reported by needs_update.
+    """
+    if scheme not in SUPPORTED_PASSWORD_SCHEMES:
+        raise ValueError(f"PASSWORD_HASH_SCHEME must be one of: {', '.join(SUPPORTED_PASSWORD_SCHEMES)}")
+
+    settings = {}
+    if rounds is None:
+        rounds = DEFAULT_PASSWORD_HASH_ROUNDS.get(scheme)
+    if rounds is not None:
+        settings[f"{scheme}__rounds"] = rounds
+
+    return CryptContext(
+        schemes=[scheme] + [other for other in SUPPORTED_PASSWORD_SCHEMES if other != scheme],
+        deprecated="auto",
+        **settings,
+    )
+
+
 ## Configure password hashing ##
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__rounds=12,
+pwd_context = build_password_context(
+    PASSWORD_HASH_SCHEME,
+    int(PASSWORD_HASH_ROUNDS) if PASSWORD_HASH_ROUNDS else None,
 )
 
 
@@ -74,6 +116,106 @@ def get_password_hash(password: str) -> str:
 
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    True when a hash was made with another scheme or cost than configured now.
+    Cheap (no hashing) , checked after every successful login.
+    """
+    try:
+        return bool(hashed_password) and pwd_context.needs_update(hashed_password)
+    except (ValueError, TypeError):
+        return False
+
+
+
+
+class PasswordHashPool:
+    """
+    Bounded pool for bcrypt work. At most `max_pending` operations are running or queued ,
+    further calls fail fast with 429 instead of piling up behind a login burst.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self.pending = 0
+        self.max_pending_seen = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    async def run(self, function: Callable, *args) -> Any:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many password operations in progress, please try again shortly",
+                headers={"Retry-After": "1"}
+            )
+
+        self.pending += 1
+        self.max_pending_seen = max(self.max_pending_seen, self.pending)
+        submitted = time.perf_counter()
+
+        def timed():
+            started = time.perf_counter()
+            result = function(*args)
+            return result, started - submitted, time.perf_counter() - started
+
+        try:
+            result, waited, ran = await asyncio.get_running_loop().run_in_executor(self._executor, timed)
+            self.completed += 1
+            self.total_wait_seconds += waited
+            self.total_run_seconds += ran
+            return result
+        finally:
+            self.pending -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "queued": max(0, self.pending - self.workers),
+            "max_pending_seen": self.max_pending_seen,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.total_wait_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+            "avg_run_ms": round(self.total_run_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+        }
+
+
+#### Process wide pool ####
+password_hash_pool = PasswordHashPool(PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """ verify_password in the password pool , raises HTTPException 429 when the pool is saturated """
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """ get_password_hash in the password pool , raises HTTPException 429 when the pool is saturated """
+    return await password_hash_pool.run(get_password_hash, password)
+
+
+async def get_password_hashes_async(passwords: List[str]) -> List[str]:
+    """
+    Hash many passwords on every pool worker at once (bulk user provisioning).
+    At most one batch per worker is in flight , so logins wait for one batch at worst.
+    """
+    hashes: List[str] = []
+    batch_size = password_hash_pool.workers
+    for start in range(0, len(passwords), batch_size):
+        batch = passwords[start:start + batch_size]
+        hashes.extend(await asyncio.gather(*(password_hash_pool.run(get_password_hash, password) for password in batch)))
+    return hashes
+
+
+
+
 def is_password_strong(password: str) -> Dict[str, bool]:
     """
     Check if a password meets strength requirements.
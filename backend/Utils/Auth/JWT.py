@@ -1,4 +1,6 @@
 import os
+import time
+import hashlib
 import logging
 import uuid
 from datetime import datetime, timedelta, timezone
@@ -9,6 +11,8 @@ from jose import JWTError, jwt
 from jose.exceptions import ExpiredSignatureError, JWTClaimsError
 from dotenv import load_dotenv
 
+from Utils.Cache.TTLCache import TTLCache
+
 ## logging config ##
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,6 +27,11 @@ REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 7))
 ISSUER = os.getenv("JWT_ISSUER", "ecommerce-api")
 AUDIENCE = os.getenv("JWT_AUDIENCE", "ecommerce-client")
 
+#### Verified access tokens are remembered by SHA-256 digest until their exp (0 disables) ####
+ACCESS_TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("ACCESS_TOKEN_CACHE_MAX_ENTRIES", 10000))
+
+verified_token_cache = TTLCache(ACCESS_TOKEN_EXPIRE_MINUTES * 60, max_entries=ACCESS_TOKEN_CACHE_MAX_ENTRIES)
+
 
 class TokenError(Exception):
     """Base exception class for token related errors"""
@@ -142,9 +151,14 @@ def create_access_token(
 
 
 
-def create_refresh_token(data: Dict[str, Any]) -> str:
+def create_refresh_token(
+    data: Dict[str, Any],
+    jti: Optional[str] = None,
+    issued_at: Optional[datetime] = None
+) -> str:
     """
     Creates a refresh token with all required claims.
+    jti and issued_at (naive UTC , whole seconds) recreate the same token , e.g. the successor of a rotation.
         
     Returns : str: The encoded refresh token.
         
@@ -155,7 +169,7 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
             raise TokenError("Missing required 'sub' claim for refresh token creation")
         
         to_encode = data.copy()
-        now = datetime.now(timezone.utc)
+        now = issued_at.replace(tzinfo=timezone.utc) if issued_at else datetime.now(timezone.utc)
         expire = now + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
         
         to_encode.update({
@@ -164,7 +178,7 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
             "iss": ISSUER,
             "aud": AUDIENCE,
             "sub": str(data["sub"]),
-            "jti": str(uuid.uuid4()),
+            "jti": jti or str(uuid.uuid4()),
             "token_type": "refresh",
             "nbf": now,
         })
@@ -213,6 +227,12 @@ async def decode_access_token(token: str) -> Dict[str, Any]:
         ### Remove 'Bearer' prefix if present ###
         if token.startswith('Bearer '):
             token = token[7:]
+
+        ### Already verified and not expired yet -> no signature check ###
+        digest = _token_digest(token)
+        cached_payload = verified_token_cache.get(digest)
+        if cached_payload is not None:
+            return dict(cached_payload)
         
         ### Decode the token ###
         payload = jwt.decode(
@@ -228,23 +248,19 @@ async def decode_access_token(token: str) -> Dict[str, Any]:
                 "verify_iat": True,
                 "verify_nbf": True,
                 "verify_signature": True,
-                "require": ["exp", "iat", "sub", "iss", "aud", "jti", "token_type"]
+                ### python-jose ignores "require" , it only checks presence through the require_* flags ###
+                "require_exp": True,
+                "require_iat": True,
+                "require_sub": True,
+                "require_iss": True,
+                "require_aud": True,
+                "require_jti": True
             }
         )
-        
+
+        ### jwt.decode checked the signature , iss , aud , exp and nbf ; claim types and token_type are checked here ###
         _validate_token_claims(payload)
         
-        now = datetime.now(timezone.utc)
-        
-        if "nbf" in payload:
-            nbf = datetime.fromtimestamp(payload["nbf"], tz=timezone.utc)
-            if now < nbf:
-                raise TokenInvalidError(
-                    "Token is not yet valid",
-                    reason="Token not before time has not been reached",
-                    not_before=nbf.isoformat()
-                )
-        
         # Verify token type is access token
         if payload.get("token_type") != "access":
             raise TokenInvalidError(
@@ -253,8 +269,10 @@ async def decode_access_token(token: str) -> Dict[str, Any]:
                 token_type=payload.get("token_type")
             )
         
+        verified_token_cache.set(digest, payload, ttl_seconds=payload["exp"] - time.time())
+        
         logger.debug(f"Access token decoded successfully for user: {payload.get('sub')}")
-        return payload
+        return dict(payload)
         
     except ExpiredSignatureError as e:
         logger.warning(f"Token has expired: {str(e)}")
@@ -338,7 +356,13 @@ async def decode_refresh_token(token: str) -> Dict[str, Any]:
                 "verify_iat": True,
                 "verify_nbf": True,
                 "verify_signature": True,
-                "require": ["exp", "iat", "sub", "iss", "aud", "jti", "token_type"]
+                ### python-jose ignores "require" , it only checks presence through the require_* flags ###
+                "require_exp": True,
+                "require_iat": True,
+                "require_sub": True,
+                "require_iss": True,
+                "require_aud": True,
+                "require_jti": True
             }
         )
         
@@ -409,6 +433,37 @@ async def decode_refresh_token(token: str) -> Dict[str, Any]:
 
 
 
+def _token_digest(token: str) -> bytes:
+    """ Cache key of a token , the raw token itself is never kept in memory """
+    return hashlib.sha256(token.encode()).digest()
+
+
+def forget_access_token(token: str) -> None:
+    """
+    Drops a revoked access token from the verified token cache ,
+    the next request with it goes through full verification again.
+    """
+    if token and token.startswith('Bearer '):
+        token = token[7:]
+    if token:
+        verified_token_cache.invalidate(_token_digest(token))
+
+
+def peek_verified_access_token(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Payload of an access token this process already verified (and that has not expired) ,
+    None otherwise. Never decodes , so it is safe to call on every request.
+    """
+    if token and token.startswith('Bearer '):
+        token = token[7:]
+    if not token:
+        return None
+    cached_payload = verified_token_cache.get(_token_digest(token))
+    return dict(cached_payload) if cached_payload is not None else None
+
+
+
+
 def _validate_token_claims(payload: Dict[str, Any]) -> None:
     """
     Validates the structure and content of token claims.
@@ -0,0 +1,84 @@
+import time
+import argparse
+import statistics
+from typing import List, Tuple
+
+from Utils.Auth.HashPassword import SUPPORTED_PASSWORD_SCHEMES, build_password_context
+
+
+#### ------------------------------------------------------------------ ####
+#### Picks the highest password hash cost that keeps one hash / verify under a target latency
+#### on this host. Run it on the production hardware and copy the printed settings into .env
+#### python -m Utils.Auth.PasswordHashCalibration --scheme bcrypt --target-ms 250
+#### ------------------------------------------------------------------ ####
+
+#### bcrypt cost is a log2 work factor , the others scale linearly with rounds ####
+BCRYPT_ROUNDS_RANGE = range(10, 20)
+LINEAR_MIN_ROUNDS = {"argon2": 1, "pbkdf2_sha256": 29000}
+
+SAMPLE_PASSWORD = "Calibration-Password-123!"
+
+
+def measure(scheme: str, rounds: int, samples: int) -> float:
+    """ Median milliseconds of a hash or a verify (whichever is slower) , what one login costs a worker """
+    context = build_password_context(scheme, rounds)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hashed = context.hash(SAMPLE_PASSWORD)
+        hashed_at = time.perf_counter()
+        context.verify(SAMPLE_PASSWORD, hashed)
+        verified_at = time.perf_counter()
+        timings.append(max(hashed_at - started, verified_at - hashed_at) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_bcrypt(target_ms: float, samples: int) -> Tuple[int, List[Tuple[int, float]]]:
+    measured = []
+    for rounds in BCRYPT_ROUNDS_RANGE:
+        elapsed = measure("bcrypt", rounds, samples)
+        measured.append((rounds, elapsed))
+        if elapsed > target_ms:
+            break
+    fitting = [rounds for rounds, elapsed in measured if elapsed <= target_ms]
+    return (max(fitting) if fitting else BCRYPT_ROUNDS_RANGE.start), measured
+
+
+def calibrate_linear(scheme: str, target_ms: float, samples: int) -> Tuple[int, List[Tuple[int, float]]]:
+    minimum = LINEAR_MIN_ROUNDS[scheme]
+    measured = [(minimum, measure(scheme, minimum, samples))]
+    rounds = max(minimum, int(minimum * target_ms / max(measured[0][1], 0.001)))
+    #### extrapolated from the minimum , stepped down until it really fits ####
+    while rounds > minimum:
+        elapsed = measure(scheme, rounds, samples)
+        measured.append((rounds, elapsed))
+        if elapsed <= target_ms:
+            break
+        rounds = max(minimum, int(rounds * 0.9))
+    return rounds, measured
+
+
+def run_calibration(args) -> None:
+    if args.scheme == "bcrypt":
+        rounds, measured = calibrate_bcrypt(args.target_ms, args.samples)
+    else:
+        rounds, measured = calibrate_linear(args.scheme, args.target_ms, args.samples)
+
+    print(f"scheme       : {args.scheme} (target {args.target_ms:.0f} ms per hash / verify)")
+    for measured_rounds, elapsed in measured:
+        marker = "<-" if measured_rounds == rounds else ""
+        print(f"rounds {measured_rounds:>8} : {elapsed:8.1f} ms {marker}")
+    if measured[0][1] > args.target_ms:
+        print("warning      : even the lowest cost is slower than the target")
+    print()
+    print("#### add to .env ####")
+    print(f"PASSWORD_HASH_SCHEME={args.scheme}")
+    print(f"PASSWORD_HASH_ROUNDS={rounds}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calibrate the password hash cost for this host")
+    parser.add_argument("--scheme", choices=SUPPORTED_PASSWORD_SCHEMES, default="bcrypt")
+    parser.add_argument("--target-ms", type=float, default=250)
+    parser.add_argument("--samples", type=int, default=5)
+    run_calibration(parser.parse_args())
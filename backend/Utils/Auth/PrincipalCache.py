@@ -0,0 +1,47 @@
+import os
+from typing import Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from Models.USER.UserModel import User
+from Utils.Cache.TTLCache import TTLCache
+
+load_dotenv()
+
+#### Authenticated users are cached per token subject (username) for PRINCIPAL_CACHE_SECONDS ####
+#### changes made through the API invalidate right away , changes from other processes within the TTL ####
+PRINCIPAL_CACHE_SECONDS = float(os.getenv("PRINCIPAL_CACHE_SECONDS", 30))
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", 10000))
+
+principal_cache = TTLCache(PRINCIPAL_CACHE_SECONDS, max_entries=PRINCIPAL_CACHE_MAX_ENTRIES)
+
+_USER_COLUMNS = [column.key for column in inspect(User).column_attrs]
+
+
+def cache_principal(user: User) -> None:
+    """ Remember the column values of an authenticated user , never the ORM instance itself """
+    principal_cache.set(user.username, {column: getattr(user, column) for column in _USER_COLUMNS})
+
+
+async def get_cached_principal(username: str, db: AsyncSession) -> Optional[User]:
+    """
+    User for a token subject without a query , None on a cache miss.
+    The instance is attached to the request session (merge with load=False does not query),
+    so controllers can still change and commit current_user as before.
+    """
+    values = principal_cache.get(username)
+    if values is None:
+        return None
+    user = User(**values)
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
+
+
+def invalidate_principal(*usernames: Optional[str]) -> None:
+    """ Drop cached users , called whenever a user's row changes or is deleted """
+    for username in usernames:
+        if username:
+            principal_cache.invalidate(username)
@@ -0,0 +1,49 @@
+import time
+import asyncio
+import argparse
+import statistics
+
+from Utils.Auth.JWT import create_access_token, decode_access_token, verified_token_cache
+
+
+#### ------------------------------------------------------------------ ####
+#### Latency benchmark of decode_access_token , verified token cache off vs on
+#### python -m Utils.Auth.TokenBenchmark --decodes 20000
+#### ------------------------------------------------------------------ ####
+
+
+def _percentile(values, percent):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _measure(token: str, decodes: int, cached: bool) -> list:
+    latencies = []
+    for _ in range(decodes):
+        if not cached:
+            verified_token_cache.clear()
+        started = time.perf_counter()
+        await decode_access_token(token)
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+    return latencies
+
+
+async def run_benchmark(args) -> None:
+    token = create_access_token(data={"sub": "benchmark", "role": "user"})
+
+    for label, cached in (("uncached", False), ("cached", True)):
+        verified_token_cache.clear()
+        await _measure(token, args.warmup, cached)
+        latencies = await _measure(token, args.decodes, cached)
+        print(f"{label:<9}: p50 {_percentile(latencies, 50):.1f} us , "
+              f"p99 {_percentile(latencies, 99):.1f} us , mean {statistics.mean(latencies):.1f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark access token decoding with and without the cache")
+    parser.add_argument("--decodes", type=int, default=20000)
+    parser.add_argument("--warmup", type=int, default=500)
+    asyncio.run(run_benchmark(parser.parse_args()))
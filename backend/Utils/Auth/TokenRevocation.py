@@ -0,0 +1,201 @@
+import os
+import time
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import select, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from Database.Database import AsyncSessionLocal
+from Models.USER.RevokedTokenModel import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+#### Revocations made by other processes are pulled from the database every REVOKED_TOKEN_SYNC_SECONDS ####
+REVOKED_TOKEN_SYNC_SECONDS = float(os.getenv("REVOKED_TOKEN_SYNC_SECONDS", 5))
+#### Rows of tokens that expired anyway are deleted every REVOKED_TOKEN_CLEANUP_SECONDS ####
+REVOKED_TOKEN_CLEANUP_SECONDS = float(os.getenv("REVOKED_TOKEN_CLEANUP_SECONDS", 3600))
+#### A rotated refresh token used again within REFRESH_TOKEN_REUSE_GRACE_SECONDS is the same rotation ####
+#### (parallel requests of one client) and gets the same successor , later reuse means it leaked ####
+REFRESH_TOKEN_REUSE_GRACE_SECONDS = float(os.getenv("REFRESH_TOKEN_REUSE_GRACE_SECONDS", 10))
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _epoch(value: datetime) -> float:
+    """ Stored datetimes are naive UTC """
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+class RevokedTokenSet:
+    """
+    In-process copy of the revoked_tokens table : jti -> expiry (epoch seconds).
+    A membership check is one dict lookup , so it runs on every authenticated request.
+    The database stays the source of truth , entries are dropped once the token expired anyway.
+    """
+
+    def __init__(self):
+        self._expires: Dict[str, float] = {}
+        self.synced_at: Optional[datetime] = None
+
+    def __contains__(self, jti: str) -> bool:
+        return jti in self._expires
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+    def add(self, jti: str, expires_at: float) -> None:
+        self._expires[jti] = expires_at
+
+    def prune(self) -> int:
+        """ Forget tokens that expired , their signature check already rejects them """
+        now = time.time()
+        expired = [jti for jti, expires_at in self._expires.items() if expires_at <= now]
+        for jti in expired:
+            del self._expires[jti]
+        return len(expired)
+
+    async def sync(self, db: AsyncSession) -> int:
+        """
+        Pull revocations of unexpired tokens. After the first load only rows revoked since the
+        previous sync are read , overlapping by one interval so slow commits are not missed.
+        """
+        now = _utcnow()
+        stmt = select(RevokedToken.jti, RevokedToken.expires_at).where(RevokedToken.expires_at > now)
+        if self.synced_at is not None:
+            stmt = stmt.where(
+                RevokedToken.revoked_at >= self.synced_at - timedelta(seconds=REVOKED_TOKEN_SYNC_SECONDS)
+            )
+        rows = (await db.execute(stmt)).all()
+        for jti, expires_at in rows:
+            self.add(jti, _epoch(expires_at))
+        self.synced_at = now
+        return len(rows)
+
+
+#### Process wide set ####
+revoked_tokens = RevokedTokenSet()
+
+
+def is_token_revoked(payload: Dict[str, Any]) -> bool:
+    """ True when the jti of a decoded token was revoked """
+    return payload.get("jti") in revoked_tokens
+
+
+def rotation_time() -> datetime:
+    """ Now truncated to the second like the iat claim , the successor of a rotation is issued at it """
+    return _utcnow().replace(microsecond=0)
+
+
+def logout_everywhere_time(include_current_second: bool = False) -> datetime:
+    """
+    Value for User.tokens_valid_after , truncated to the second like the iat claim :
+    a token issued later in the same second as the logout must stay valid.
+    include_current_second also ends the tokens of this second , used when a refresh token
+    leaked (the pair handed to whoever rotated it first was issued moments ago).
+    """
+    valid_after = rotation_time()
+    if include_current_second:
+        valid_after += timedelta(seconds=1)
+    return valid_after
+
+
+def issued_before_logout(payload: Dict[str, Any], tokens_valid_after: Optional[datetime]) -> bool:
+    """
+    True when the token was issued before the user's "log out everywhere" second.
+    Both sides are compared in whole seconds (older rows may still hold microseconds).
+    Refresh tokens are checked against the users row , access tokens against the principal cache :
+    other processes keep accepting access tokens for up to PRINCIPAL_CACHE_SECONDS after the logout.
+    """
+    return tokens_valid_after is not None and payload.get("iat", 0) < int(_epoch(tokens_valid_after))
+
+
+async def revoke_token(
+    db: AsyncSession,
+    payload: Dict[str, Any],
+    successor_jti: Optional[str] = None,
+    revoked_at: Optional[datetime] = None
+) -> bool:
+    """
+    Record the jti of a decoded token and commit , a rotated refresh token also records
+    the jti of the refresh token that replaced it.
+    Returns False when it was already revoked , the unique jti makes that race safe.
+    """
+    expires_at = float(payload["exp"])
+    db.add(RevokedToken(
+        jti=payload["jti"],
+        username=payload["sub"],
+        token_type=payload.get("token_type", "access"),
+        expires_at=datetime.fromtimestamp(expires_at, tz=timezone.utc).replace(tzinfo=None),
+        revoked_at=revoked_at or _utcnow(),
+        successor_jti=successor_jti
+    ))
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        revoked_tokens.add(payload["jti"], expires_at)
+        return False
+    revoked_tokens.add(payload["jti"], expires_at)
+    return True
+
+
+async def find_recent_rotation(db: AsyncSession, payload: Dict[str, Any]) -> Optional[RevokedToken]:
+    """
+    Row of a refresh token rotated less than REFRESH_TOKEN_REUSE_GRACE_SECONDS ago whose successor
+    was not revoked since , None when using the token again means it leaked.
+    """
+    rotation = (await db.execute(
+        select(RevokedToken).where(RevokedToken.jti == payload["jti"])
+    )).scalar_one_or_none()
+    if rotation is None or rotation.successor_jti is None:
+        return None
+    if (_utcnow() - rotation.revoked_at).total_seconds() > REFRESH_TOKEN_REUSE_GRACE_SECONDS:
+        return None
+    if rotation.successor_jti in revoked_tokens:
+        return None
+    successor_revoked = (await db.execute(
+        select(RevokedToken.id).where(RevokedToken.jti == rotation.successor_jti)
+    )).first()
+    return None if successor_revoked else rotation
+
+
+async def cleanup_revoked_tokens(db: AsyncSession) -> int:
+    """ Delete rows of tokens that expired , returns the number of deleted rows """
+    result = await db.execute(delete(RevokedToken).where(RevokedToken.expires_at <= _utcnow()))
+    await db.commit()
+    return result.rowcount or 0
+
+
+async def load_revoked_tokens() -> int:
+    """ Load revocations of unexpired tokens , called on startup """
+    async with AsyncSessionLocal() as session:
+        return await revoked_tokens.sync(session)
+
+
+async def refresh_revoked_tokens_forever() -> None:
+    """ Background loop started from the app lifespan , syncs the set and cleans expired rows up """
+    last_cleanup: Optional[float] = None
+    while True:
+        await asyncio.sleep(REVOKED_TOKEN_SYNC_SECONDS)
+        try:
+            async with AsyncSessionLocal() as session:
+                await revoked_tokens.sync(session)
+                if last_cleanup is None or time.monotonic() - last_cleanup >= REVOKED_TOKEN_CLEANUP_SECONDS:
+                    deleted = await cleanup_revoked_tokens(session)
+                    last_cleanup = time.monotonic()
+                    if deleted:
+                        logger.info(f"Deleted {deleted} expired revoked tokens")
+            revoked_tokens.prune()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Revoked token sync failed: {str(e)}")
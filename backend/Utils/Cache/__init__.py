@@ -0,0 +1 @@
+### TTL Cache __init__.py file ###
\ No newline at end of file
@@ -3,7 +3,7 @@ from dotenv import load_dotenv
 load_dotenv()
 from pydantic import BaseModel, EmailStr, Field, field_validator
 import resend
-from Utils.SlowApi.SlowApi import limiter
+from Utils.SlowApi.SlowApi import limiter, route_limit
 from fastapi import APIRouter, Request, HTTPException, status
 from typing import Optional
 
@@ -74,7 +74,7 @@ class ContactMessage(BaseModel):
 
 
 @ContactFormRouter.post("/contact")
-@limiter.limit("5/minute")
+@limiter.limit(route_limit("contact.send"))
 async def send_contact_email(request: Request, data: ContactMessage):
     """
     Send contact form message via email using Resend as an email provider.
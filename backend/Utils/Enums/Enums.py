@@ -82,4 +82,12 @@ class ReservationStatus(Enum):
 class TableLocation(Enum):
     WINDOW = "window"
     PATIO = "patio"
-    MAIN_DINING_ROOM = "main_dining_room"
\ No newline at end of file
+    MAIN_DINING_ROOM = "main_dining_room"
+
+
+
+class CommentModerationStatus(Enum):
+    PENDING = "pending"
+    APPROVED = "approved"
+    FLAGGED = "flagged"
+    HIDDEN = "hidden"
\ No newline at end of file
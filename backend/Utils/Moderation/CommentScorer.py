@@ -0,0 +1,117 @@
+import re
+from typing import List, Tuple
+
+
+#### ------------------------------------------------------------------ ####
+#### Local rule and token based spam / profanity scorer for comments.
+#### Pure functions without database or app imports , so a process pool
+#### worker can import this module cheaply and score whole batches.
+#### ------------------------------------------------------------------ ####
+
+
+#### Tokens that are profanity on their own (English and Turkish) , matched after folding ####
+PROFANITY_TOKENS = {
+    "fuck", "fucking", "fucker", "shit", "bullshit", "bitch", "bastard", "asshole", "cunt", "whore", "slut",
+    "amk", "aq", "siktir", "sikerim", "orospu", "yavsak", "gavat", "serefsiz", "ibne", "pezevenk",
+}
+
+#### Profanity whose folded form is an ordinary word ("piç" -> "pic") , matched before folding ####
+UNFOLDED_PROFANITY_TOKENS = {"piç"}
+
+#### Also a name or an ordinary word : a weak signal when written in lower case , ignored capitalized ####
+AMBIGUOUS_PROFANITY_TOKENS = {"dick": 0.3}
+
+#### spam token -> weight , these are spam words on their own ####
+SPAM_TOKENS = {
+    "casino": 0.5, "bahis": 0.5, "crypto": 0.4, "bitcoin": 0.4, "forex": 0.4,
+    "whatsapp": 0.4, "telegram": 0.4, "followers": 0.4, "viagra": 0.7, "takipci": 0.4,
+}
+
+#### ordinary words ("free dessert" , "I bet") , they only add up once another spam signal fired ####
+WEAK_SPAM_TOKENS = {
+    "bet": 0.3, "promo": 0.3, "bonus": 0.3, "free": 0.2, "winner": 0.3, "click": 0.3, "subscribe": 0.3,
+    "instagram": 0.2, "dm": 0.2, "loan": 0.3, "kredi": 0.3, "kazan": 0.3,
+}
+
+#### leetspeak and Turkish letters folded before matching ####
+_FOLD = str.maketrans({
+    "0": "o", "1": "i", "3": "e", "4": "a", "5": "s", "7": "t", "@": "a", "$": "s",
+    "ı": "i", "ğ": "g", "ü": "u", "ş": "s", "ö": "o", "ç": "c",
+})
+
+_URL = re.compile(r"(https?://|www\.)\S+|\b\S+\.(com|net|org|io|xyz|ru|top|link|shop)\b", re.IGNORECASE)
+_EMAIL = re.compile(r"\b[\w.+-]+@[\w-]+\.[\w.]+\b")
+_PHONE = re.compile(r"(?:\+?\d[\s-]?){9,}")
+_REPEATED_CHARS = re.compile(r"(.)\1{4,}")
+_TOKEN = re.compile(r"[a-z]+")
+_WORD = re.compile(r"[^\W\d_]+")
+
+
+def _tokens(text: str) -> List[str]:
+    folded = text.lower().translate(_FOLD)
+    #### "fuuuuck" -> "fuck" , "s.h.i.t" -> "shit" ####
+    folded = re.sub(r"(.)\1{2,}", r"\1", folded)
+    joined = re.sub(r"\b(\w)[.\-_*](?=\w\b)", r"\1", folded)
+    return _TOKEN.findall(folded) + [token for token in _TOKEN.findall(joined) if token not in folded]
+
+
+def score_comment(text: str) -> Tuple[float, List[str]]:
+    """
+    Score one comment between 0 (clean) and 1 (certainly spam / profanity).
+    Returns the score and the rules that fired.
+    """
+    reasons: List[str] = []
+    if not text or not text.strip():
+        return 0.0, reasons
+
+    tokens = _tokens(text)
+    words = _WORD.findall(text)
+
+    #### Profanity : a single hit is already a strong signal ####
+    profanity_hits = sorted(
+        {token for token in tokens if token in PROFANITY_TOKENS} |
+        {word.lower() for word in words if word.lower() in UNFOLDED_PROFANITY_TOKENS}
+    )
+    profanity = min(1.0, 0.6 * len(profanity_hits)) if profanity_hits else 0.0
+    if profanity_hits:
+        reasons.append(f"profanity: {', '.join(profanity_hits)}")
+
+    #### Spam : independent weak signals combined as 1 - prod(1 - w) ####
+    signals: List[Tuple[str, float]] = []
+    links = len(_URL.findall(text))
+    if links:
+        signals.append((f"links: {links}", min(0.9, 0.5 + 0.2 * (links - 1))))
+    if _EMAIL.search(text):
+        signals.append(("email address", 0.5))
+    if _PHONE.search(text):
+        signals.append(("phone number", 0.5))
+    for token in sorted(set(tokens)):
+        if token in SPAM_TOKENS:
+            signals.append((f"spam word: {token}", SPAM_TOKENS[token]))
+    if signals:
+        for token in sorted(set(tokens)):
+            if token in WEAK_SPAM_TOKENS:
+                signals.append((f"spam word: {token}", WEAK_SPAM_TOKENS[token]))
+    for word in sorted({word for word in words if word.islower() and word in AMBIGUOUS_PROFANITY_TOKENS}):
+        signals.append((f"possible profanity: {word}", AMBIGUOUS_PROFANITY_TOKENS[word]))
+
+    letters = [char for char in text if char.isalpha()]
+    if len(letters) >= 15 and sum(char.isupper() for char in letters) / len(letters) > 0.7:
+        signals.append(("mostly capital letters", 0.3))
+    if _REPEATED_CHARS.search(text):
+        signals.append(("repeated characters", 0.2))
+    if len(tokens) >= 6 and len(set(tokens)) / len(tokens) < 0.4:
+        signals.append(("repeated words", 0.4))
+
+    clean = 1.0
+    for reason, weight in signals:
+        clean *= 1.0 - weight
+        reasons.append(reason)
+    spam = 1.0 - clean
+
+    return round(max(profanity, spam), 3), reasons
+
+
+def score_batch(comments: List[Tuple[int, str]]) -> List[Tuple[int, float, List[str]]]:
+    """ Score (comment_id, content) pairs , runs inside a process pool worker """
+    return [(comment_id, *score_comment(content)) for comment_id, content in comments]
@@ -0,0 +1 @@
+### Moderation __init__.py file ###
\ No newline at end of file
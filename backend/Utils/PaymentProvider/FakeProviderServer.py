@@ -0,0 +1,113 @@
+import asyncio
+import random
+import argparse
+import uuid
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from Utils.PaymentProvider.PaymentProviderClient import IYZICO_CREATE_PAYMENT_PATH, IYZICO_RETRIEVE_PAYMENT_PATH
+
+
+#### ------------------------------------------------------------------ ####
+#### Local stand-in for the Iyzico API, used for development and benchmarks
+#### python -m Utils.PaymentProvider.FakeProviderServer --latency-ms 80 --error-rate 0.1
+#### then point IYZICO_BASE_URL at http://127.0.0.1:8089
+#### ------------------------------------------------------------------ ####
+
+
+def create_fake_provider_app(
+    latency_ms: float = 50,
+    jitter_ms: float = 20,
+    error_rate: float = 0.0,
+    hang_rate: float = 0.0,
+) -> FastAPI:
+    """
+    Build the fake provider app.
+    - latency_ms / jitter_ms : simulated processing time per request
+    - error_rate : share of requests answered with HTTP 503
+    - hang_rate : share of requests that never answer in time (10s sleep)
+    """
+    app = FastAPI(title="Fake Payment Provider")
+    app.state.config = {
+        "latency_ms": latency_ms,
+        "jitter_ms": jitter_ms,
+        "error_rate": error_rate,
+        "hang_rate": hang_rate,
+    }
+    app.state.requests = 0
+
+    async def simulate(request: Request):
+        config = request.app.state.config
+        request.app.state.requests += 1
+
+        if random.random() < config["hang_rate"]:
+            await asyncio.sleep(10)
+
+        delay = max(0.0, config["latency_ms"] + random.uniform(-config["jitter_ms"], config["jitter_ms"]))
+        await asyncio.sleep(delay / 1000)
+
+        if random.random() < config["error_rate"]:
+            return JSONResponse(status_code=503, content={"status": "failure", "errorMessage": "Service unavailable"})
+        return None
+
+    @app.post(IYZICO_CREATE_PAYMENT_PATH)
+    async def initialize_checkout(request: Request):
+        failure = await simulate(request)
+        if failure:
+            return failure
+        payload = await request.json()
+        return {
+            "status": "success",
+            "conversationId": payload.get("conversationId"),
+            "token": str(uuid.uuid4()),
+            "checkoutFormContent": "<script>/* fake checkout form */</script>",
+            "tokenExpireTime": 1800,
+            "paymentPageUrl": "http://127.0.0.1/fake-checkout",
+        }
+
+    @app.post(IYZICO_RETRIEVE_PAYMENT_PATH)
+    async def retrieve_checkout(request: Request):
+        failure = await simulate(request)
+        if failure:
+            return failure
+        payload = await request.json()
+        return {
+            "status": "success",
+            "conversationId": payload.get("conversationId"),
+            "token": payload.get("token"),
+            "paymentStatus": "SUCCESS",
+            "paymentId": str(random.randint(10_000_000, 99_999_999)),
+            "fraudStatus": 1,
+            "lastFourDigits": "0000",
+            "cardAssociation": "VISA",
+            "cardFamily": "Test Card",
+            "cardType": "CREDIT_CARD",
+        }
+
+    @app.post("/_config")
+    async def update_config(request: Request):
+        """ Change latency / failure settings while the server runs """
+        request.app.state.config.update(await request.json())
+        return request.app.state.config
+
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the fake payment provider")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--jitter-ms", type=float, default=20)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    uvicorn.run(
+        create_fake_provider_app(args.latency_ms, args.jitter_ms, args.error_rate, args.hang_rate),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
@@ -0,0 +1,319 @@
+import os
+import time
+import json
+import random
+import base64
+import hmac
+import hashlib
+import asyncio
+import logging
+import secrets
+from typing import Optional, Dict, Any
+
+import httpx
+from dotenv import load_dotenv
+
+## logging config ##
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+###### Payment provider configuration - get .env fields #######
+IYZICO_API_KEY = os.getenv("IYZICO_API_KEY", "")
+IYZICO_SECRET_KEY = os.getenv("IYZICO_SECRET_KEY", "")
+IYZICO_BASE_URL = os.getenv("IYZICO_BASE_URL", "https://sandbox-api.iyzipay.com")
+IYZICO_CREATE_PAYMENT_PATH = os.getenv("IYZICO_CREATE_PAYMENT_PATH", "/payment/iyzipay/checkoutform/initialize")
+IYZICO_RETRIEVE_PAYMENT_PATH = os.getenv("IYZICO_RETRIEVE_PAYMENT_PATH", "/payment/iyzipay/checkoutform/auth/ecom/detail")
+
+PAYMENT_PROVIDER_ENABLED = os.getenv("PAYMENT_PROVIDER_ENABLED", "false").lower() == "true"
+PAYMENT_PROVIDER_TIMEOUT_SECONDS = float(os.getenv("PAYMENT_PROVIDER_TIMEOUT_SECONDS", 5))
+PAYMENT_PROVIDER_MAX_RETRIES = int(os.getenv("PAYMENT_PROVIDER_MAX_RETRIES", 2))
+PAYMENT_PROVIDER_POOL_SIZE = int(os.getenv("PAYMENT_PROVIDER_POOL_SIZE", 20))
+PAYMENT_PROVIDER_BREAKER_THRESHOLD = int(os.getenv("PAYMENT_PROVIDER_BREAKER_THRESHOLD", 5))
+PAYMENT_PROVIDER_BREAKER_RESET_SECONDS = float(os.getenv("PAYMENT_PROVIDER_BREAKER_RESET_SECONDS", 30))
+
+#### Backoff between retries : full jitter in [0, min(cap, base * 2^attempt)] ####
+RETRY_BACKOFF_BASE_SECONDS = 0.1
+RETRY_BACKOFF_CAP_SECONDS = 1.0
+
+
+
+
+class PaymentProviderError(Exception):
+    """ Base exception class for payment provider errors """
+    def __init__(self, message: str = "Payment provider request failed", error_code: str = "provider_error", **kwargs):
+        self.message = message
+        self.error_code = error_code
+        self.details = kwargs
+        super().__init__(self.message)
+
+    def to_dict(self) -> dict:
+        return {
+            "error": self.error_code,
+            "message": self.message,
+            **self.details
+        }
+
+
+
+class PaymentProviderTimeoutError(PaymentProviderError):
+    """ Raises when a provider call does not finish before its deadline """
+    def __init__(self, message: str = "Payment provider did not answer in time", **kwargs):
+        super().__init__(message=message, error_code="provider_timeout", **kwargs)
+
+
+
+class PaymentProviderUnavailableError(PaymentProviderError):
+    """ Raises when the circuit breaker is open and calls are failed fast """
+    def __init__(self, message: str = "Payment provider is temporarily unavailable", **kwargs):
+        super().__init__(message=message, error_code="provider_unavailable", **kwargs)
+
+
+
+
+
+class CircuitBreaker:
+    """
+    Counts consecutive provider failures.
+    CLOSED : calls go through. OPEN : calls fail fast until reset_seconds passed.
+    HALF_OPEN : a single trial call decides between CLOSED and OPEN again.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+
+    def before_call(self) -> bool:
+        """
+        Raises PaymentProviderUnavailableError when the call must not be attempted ,
+        returns True when the call is the half-open trial.
+        """
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_seconds:
+                raise PaymentProviderUnavailableError(
+                    retry_after=round(self.reset_seconds - (time.monotonic() - self.opened_at), 2)
+                )
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+
+        if self.state == self.HALF_OPEN:
+            if self._trial_in_flight:
+                raise PaymentProviderUnavailableError(reason="Trial request already in flight")
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """
+        Ends a half-open trial that recorded neither outcome (e.g. the request was cancelled) ,
+        so the next call becomes the trial instead of every call failing fast forever.
+        """
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"Payment provider circuit opened after {self.failures} failures")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"state": self.state, "consecutive_failures": self.failures}
+
+
+
+
+
+class PaymentProviderClient:
+    """
+    Async client for the payment provider (Iyzico) API.
+    One instance per process shares a single HTTP connection pool.
+    """
+
+    def __init__(
+        self,
+        base_url: str = IYZICO_BASE_URL,
+        api_key: str = IYZICO_API_KEY,
+        secret_key: str = IYZICO_SECRET_KEY,
+        timeout_seconds: float = PAYMENT_PROVIDER_TIMEOUT_SECONDS,
+        max_retries: int = PAYMENT_PROVIDER_MAX_RETRIES,
+        pool_size: int = PAYMENT_PROVIDER_POOL_SIZE,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.api_key = api_key
+        self.secret_key = secret_key
+        self.timeout_seconds = timeout_seconds
+        self.max_retries = max_retries
+        self.breaker = breaker or CircuitBreaker(
+            PAYMENT_PROVIDER_BREAKER_THRESHOLD,
+            PAYMENT_PROVIDER_BREAKER_RESET_SECONDS
+        )
+        self._http = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=httpx.Timeout(timeout_seconds),
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+            ),
+            headers={"Accept": "application/json", "Content-Type": "application/json"},
+        )
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    def _authorization_headers(self, path: str, body: str) -> Dict[str, str]:
+        """ Iyzico IYZWSv2 HMAC-SHA256 authorization header """
+        random_key = f"{int(time.time() * 1000)}{secrets.token_hex(4)}"
+        signature = hmac.new(
+            self.secret_key.encode(),
+            f"{random_key}{path}{body}".encode(),
+            hashlib.sha256
+        ).hexdigest()
+        auth_string = f"apiKey:{self.api_key}&randomKey:{random_key}&signature:{signature}"
+        return {
+            "Authorization": "IYZWSv2 " + base64.b64encode(auth_string.encode()).decode(),
+            "x-iyzi-rnd": random_key,
+        }
+
+    async def _post(self, path: str, payload: Dict[str, Any], idempotent: bool, timeout: Optional[float]) -> Dict[str, Any]:
+        """
+        POST with a total deadline covering all attempts.
+        Only idempotent operations are retried (connection errors, timeouts and 5xx).
+        """
+        is_trial = self.breaker.before_call()
+        try:
+            return await self._attempt_post(path, payload, idempotent, timeout)
+        finally:
+            #### a cancelled / crashed trial must not leave the breaker half open for good ####
+            if is_trial:
+                self.breaker.release_trial()
+
+    async def _attempt_post(self, path: str, payload: Dict[str, Any], idempotent: bool, timeout: Optional[float]) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (timeout or self.timeout_seconds)
+        attempts = 1 + (self.max_retries if idempotent else 0)
+        body = json.dumps(payload, separators=(",", ":"))
+        last_error: Optional[PaymentProviderError] = None
+
+        for attempt in range(attempts):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                response = await asyncio.wait_for(
+                    self._http.post(path, content=body, headers=self._authorization_headers(path, body)),
+                    timeout=remaining,
+                )
+                if response.status_code >= 500:
+                    last_error = PaymentProviderError(
+                        "Payment provider returned a server error",
+                        status_code=response.status_code
+                    )
+                else:
+                    self.breaker.record_success()
+                    data = response.json()
+                    if response.status_code >= 400 or data.get("status") == "failure":
+                        raise PaymentProviderError(
+                            data.get("errorMessage") or "Payment provider rejected the request",
+                            error_code="provider_rejected",
+                            status_code=response.status_code,
+                            provider_error_code=data.get("errorCode"),
+                        )
+                    return data
+            except PaymentProviderError:
+                raise
+            except asyncio.TimeoutError:
+                last_error = PaymentProviderTimeoutError(path=path)
+            except httpx.TimeoutException:
+                last_error = PaymentProviderTimeoutError(path=path)
+            except (httpx.TransportError, ValueError) as e:
+                last_error = PaymentProviderError(
+                    "Payment provider connection failed",
+                    error_type=type(e).__name__,
+                    details=str(e)
+                )
+
+            if attempt + 1 < attempts:
+                backoff = random.uniform(0, min(RETRY_BACKOFF_CAP_SECONDS, RETRY_BACKOFF_BASE_SECONDS * (2 ** attempt)))
+                if loop.time() + backoff >= deadline:
+                    break
+                await asyncio.sleep(backoff)
+
+        self.breaker.record_failure()
+        if last_error is None:
+            last_error = PaymentProviderTimeoutError(path=path)
+        logger.warning(f"Payment provider call to {path} failed: {last_error.message}")
+        raise last_error
+
+    #### ============================================ ####
+    #### PROVIDER OPERATIONS ####
+    #### ============================================ ####
+
+    async def initialize_checkout(self, payload: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """ Start a hosted checkout form. Creates state on the provider, so it is never retried """
+        return await self._post(IYZICO_CREATE_PAYMENT_PATH, payload, idempotent=False, timeout=timeout)
+
+    async def retrieve_checkout(self, token: str, conversation_id: Optional[str] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """ Read the result of a checkout form. Read-only, safe to retry """
+        payload = {"token": token}
+        if conversation_id:
+            payload["conversationId"] = conversation_id
+        return await self._post(IYZICO_RETRIEVE_PAYMENT_PATH, payload, idempotent=True, timeout=timeout)
+
+
+
+
+def verify_webhook_signature(payload: Dict[str, Any], signature: Optional[str], secret_key: str = IYZICO_SECRET_KEY) -> bool:
+    """
+    Verify an Iyzico webhook (X-IYZ-SIGNATURE-V3 header).
+    Signature is HMAC-SHA256(secretKey, secretKey + iyziEventType + iyziPaymentId + token + paymentConversationId + status)
+    """
+    if not signature or not secret_key:
+        return False
+
+    message = "".join([
+        secret_key,
+        str(payload.get("iyziEventType", "")),
+        str(payload.get("iyziPaymentId", "")),
+        str(payload.get("token", "")),
+        str(payload.get("paymentConversationId", "")),
+        str(payload.get("status", "")),
+    ])
+    expected = hmac.new(secret_key.encode(), message.encode(), hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature.lower())
+
+
+
+
+#### Shared client (one connection pool per process) ####
+_client: Optional[PaymentProviderClient] = None
+
+
+def get_payment_provider_client() -> PaymentProviderClient:
+    """ Returns the process wide client, created on first use """
+    global _client
+    if _client is None:
+        _client = PaymentProviderClient()
+    return _client
+
+
+async def close_payment_provider_client() -> None:
+    """ Close the shared connection pool , called on application shutdown """
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
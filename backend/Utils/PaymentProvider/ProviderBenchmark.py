@@ -0,0 +1,89 @@
+import time
+import asyncio
+import argparse
+import statistics
+
+import uvicorn
+
+from Utils.PaymentProvider.FakeProviderServer import create_fake_provider_app
+from Utils.PaymentProvider.PaymentProviderClient import PaymentProviderClient, PaymentProviderError, CircuitBreaker
+
+
+#### ------------------------------------------------------------------ ####
+#### Latency benchmark of PaymentProviderClient against the fake provider
+#### python -m Utils.PaymentProvider.ProviderBenchmark --requests 1000 --concurrency 50 --error-rate 0.05
+#### ------------------------------------------------------------------ ####
+
+
+def _percentile(values, percent):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_benchmark(args) -> None:
+    app = create_fake_provider_app(args.latency_ms, args.jitter_ms, args.error_rate, args.hang_rate)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=args.port, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    client = PaymentProviderClient(
+        base_url=f"http://127.0.0.1:{args.port}",
+        api_key="benchmark",
+        secret_key="benchmark",
+        timeout_seconds=args.timeout,
+        max_retries=args.retries,
+        pool_size=args.concurrency,
+        breaker=CircuitBreaker(args.breaker_threshold, args.breaker_reset),
+    )
+
+    latencies = []
+    outcomes = {}
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def one_call(index: int):
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await client.retrieve_checkout(token=f"token-{index}", conversation_id=str(index))
+                outcome = "ok"
+            except PaymentProviderError as e:
+                outcome = e.error_code
+            latencies.append((time.perf_counter() - started) * 1000)
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one_call(i) for i in range(args.requests)))
+    elapsed = time.perf_counter() - started
+
+    await client.aclose()
+    server.should_exit = True
+    await server_task
+
+    print(f"requests     : {args.requests} (concurrency {args.concurrency})")
+    print(f"throughput   : {args.requests / elapsed:.1f} req/s")
+    print(f"latency p50  : {_percentile(latencies, 50):.1f} ms")
+    print(f"latency p95  : {_percentile(latencies, 95):.1f} ms")
+    print(f"latency p99  : {_percentile(latencies, 99):.1f} ms")
+    print(f"latency mean : {statistics.mean(latencies):.1f} ms")
+    print(f"outcomes     : {outcomes}")
+    print(f"breaker      : {client.breaker.snapshot()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the payment provider client")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--jitter-ms", type=float, default=20)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=2.0)
+    parser.add_argument("--retries", type=int, default=2)
+    parser.add_argument("--breaker-threshold", type=int, default=5)
+    parser.add_argument("--breaker-reset", type=float, default=30)
+    asyncio.run(run_benchmark(parser.parse_args()))
@@ -0,0 +1 @@
+### Payment Provider __init__.py file ###
\ No newline at end of file
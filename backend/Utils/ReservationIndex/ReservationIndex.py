@@ -0,0 +1,183 @@
+import os
+import asyncio
+import logging
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy import select, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from Database.Database import AsyncSessionLocal
+from Models.RESERVATION.ReservationModel import Reservation
+from Utils.Enums.Enums import ReservationStatus
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+#### The index is rebuilt from the database every RESERVATION_INDEX_REFRESH_SECONDS ####
+#### so changes made by other processes are picked up ####
+RESERVATION_INDEX_REFRESH_SECONDS = int(os.getenv("RESERVATION_INDEX_REFRESH_SECONDS", 300))
+
+ACTIVE_RESERVATION_STATUSES = (ReservationStatus.PENDING, ReservationStatus.CONFIRMED)
+
+#### (reservation_id, table_id, reservation_time, status) of a synced reservation ####
+SyncedReservation = Tuple[int, int, datetime, ReservationStatus]
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """ Reservation times are stored naive , aware inputs are converted to naive UTC """
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class ReservationIntervalIndex:
+    """
+    In-process index of active (pending / confirmed) reservations.
+    Per table a sorted list of (reservation_time, reservation_id) , so a conflict check
+    is a binary search plus a scan of the few entries inside the window.
+    The database stays the source of truth : the index only covers reservations from
+    `horizon` on and callers fall back to a query outside of it or before it is loaded.
+    """
+
+    def __init__(self):
+        self._by_table: Dict[int, List[Tuple[datetime, int]]] = {}
+        self._entries: Dict[int, Tuple[int, datetime]] = {}
+        self.horizon: Optional[datetime] = None
+        self.loaded = False
+        #### one list per running load , syncs are recorded there and replayed on the new snapshot ####
+        self._loads_in_progress: List[List[SyncedReservation]] = []
+
+    async def load(self, db: AsyncSession, horizon: datetime) -> int:
+        """
+        Replace the index content with active reservations at or after horizon.
+        Syncs that arrive while the snapshot is read may be missing from it , they are
+        replayed on top of the new snapshot before it is used.
+        """
+        synced_during_load: List[SyncedReservation] = []
+        self._loads_in_progress.append(synced_during_load)
+        try:
+            rows = await self._read_active(db, horizon)
+        finally:
+            self._loads_in_progress = [
+                recorded for recorded in self._loads_in_progress if recorded is not synced_during_load
+            ]
+
+        by_table: Dict[int, List[Tuple[datetime, int]]] = {}
+        entries: Dict[int, Tuple[int, datetime]] = {}
+        for reservation_id, table_id, reservation_time in rows:
+            reservation_time = to_naive_utc(reservation_time)
+            by_table.setdefault(table_id, []).append((reservation_time, reservation_id))
+            entries[reservation_id] = (table_id, reservation_time)
+        for table_entries in by_table.values():
+            table_entries.sort()
+
+        self._by_table = by_table
+        self._entries = entries
+        self.horizon = horizon
+        self.loaded = True
+        for synced in synced_during_load:
+            self._apply(*synced)
+        return len(self._entries)
+
+    @staticmethod
+    async def _read_active(db: AsyncSession, horizon: datetime):
+        stmt = select(
+            Reservation.id,
+            Reservation.table_id,
+            Reservation.reservation_time
+        ).where(
+            and_(
+                Reservation.status.in_(ACTIVE_RESERVATION_STATUSES),
+                Reservation.reservation_time >= horizon
+            )
+        )
+        return (await db.execute(stmt)).all()
+
+    def covers(self, window_start: datetime) -> bool:
+        """ True when every reservation that can fall into the window is in the index """
+        return self.loaded and to_naive_utc(window_start) >= self.horizon
+
+    def remove(self, reservation_id: int) -> None:
+        entry = self._entries.pop(reservation_id, None)
+        if entry is None:
+            return
+        table_id, reservation_time = entry
+        table_entries = self._by_table.get(table_id, [])
+        position = bisect_left(table_entries, (reservation_time, reservation_id))
+        if position < len(table_entries) and table_entries[position] == (reservation_time, reservation_id):
+            table_entries.pop(position)
+
+    def sync(self, reservation: Reservation) -> None:
+        """ Mirror a committed reservation : active ones are (re)inserted , others removed """
+        synced = (
+            reservation.id,
+            reservation.table_id,
+            to_naive_utc(reservation.reservation_time),
+            reservation.status
+        )
+        for synced_during_load in self._loads_in_progress:
+            synced_during_load.append(synced)
+        self._apply(*synced)
+
+    def _apply(
+        self,
+        reservation_id: int,
+        table_id: int,
+        reservation_time: datetime,
+        reservation_status: ReservationStatus
+    ) -> None:
+        self.remove(reservation_id)
+        if not self.loaded or reservation_status not in ACTIVE_RESERVATION_STATUSES:
+            return
+        if reservation_time < self.horizon:
+            return
+        insort(self._by_table.setdefault(table_id, []), (reservation_time, reservation_id))
+        self._entries[reservation_id] = (table_id, reservation_time)
+
+    def has_conflict(
+        self,
+        table_id: int,
+        window_start: datetime,
+        window_end: datetime,
+        exclude_reservation_id: Optional[int] = None
+    ) -> bool:
+        """ Any active reservation of the table with window_start <= time <= window_end """
+        window_start = to_naive_utc(window_start)
+        window_end = to_naive_utc(window_end)
+        table_entries = self._by_table.get(table_id, [])
+        position = bisect_left(table_entries, (window_start,))
+        while position < len(table_entries) and table_entries[position][0] <= window_end:
+            if table_entries[position][1] != exclude_reservation_id:
+                return True
+            position += 1
+        return False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+#### Process wide index ####
+reservation_index = ReservationIntervalIndex()
+
+
+async def load_reservation_index(window: timedelta) -> int:
+    """ Load active reservations that can still conflict with a new booking , called on startup """
+    horizon = datetime.now(timezone.utc).replace(tzinfo=None) - window
+    async with AsyncSessionLocal() as session:
+        return await reservation_index.load(session, horizon)
+
+
+async def refresh_reservation_index_forever(window: timedelta) -> None:
+    """ Background loop started from the app lifespan , rebuilds the index periodically """
+    while True:
+        await asyncio.sleep(RESERVATION_INDEX_REFRESH_SECONDS)
+        try:
+            await load_reservation_index(window)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Reservation index refresh failed: {str(e)}")
@@ -0,0 +1 @@
+### Reservation Index __init__.py file ###
\ No newline at end of file
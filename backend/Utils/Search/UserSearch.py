@@ -0,0 +1,147 @@
+import os
+import logging
+
+from dotenv import load_dotenv
+from sqlalchemy import Select, or_, case, func, literal_column, table, column, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+
+from Models.USER.UserModel import User
+from Utils.Cache.TTLCache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+#### Typeahead answers are cached per (term, page) for a few seconds , repeated keystrokes hit the cache ####
+USER_SEARCH_CACHE_SECONDS = float(os.getenv("USER_SEARCH_CACHE_SECONDS", 10))
+TYPEAHEAD_MIN_LENGTH = 2
+TYPEAHEAD_MAX_RESULTS = 20
+#### trigram indexes only help from 3 characters on , shorter terms are prefix matches ####
+TRIGRAM_MIN_LENGTH = 3
+
+typeahead_cache = TTLCache(USER_SEARCH_CACHE_SECONDS, max_entries=1024)
+
+#### PostgreSQL : trigram GIN indexes serve ILIKE '%term%' ####
+POSTGRESQL_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_users_username_trgm ON users USING gin (username gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_users_email_trgm ON users USING gin (email gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_users_phone_trgm ON users USING gin (phone gin_trgm_ops)",
+]
+
+#### SQLite : FTS5 trigram table over users , kept in sync by triggers ####
+#### plus NOCASE indexes for the 1-2 character prefix searches trigrams cannot serve ####
+SQLITE_SEARCH_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_users_username_nocase ON users (username COLLATE NOCASE)",
+    "CREATE INDEX IF NOT EXISTS ix_users_email_nocase ON users (email COLLATE NOCASE)",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS users_search USING fts5(
+        username, email, phone, content='users', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS users_search_ai AFTER INSERT ON users BEGIN
+        INSERT INTO users_search(rowid, username, email, phone) VALUES (new.id, new.username, new.email, new.phone);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS users_search_ad AFTER DELETE ON users BEGIN
+        INSERT INTO users_search(users_search, rowid, username, email, phone) VALUES ('delete', old.id, old.username, old.email, old.phone);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS users_search_au AFTER UPDATE OF username, email, phone ON users BEGIN
+        INSERT INTO users_search(users_search, rowid, username, email, phone) VALUES ('delete', old.id, old.username, old.email, old.phone);
+        INSERT INTO users_search(rowid, username, email, phone) VALUES (new.id, new.username, new.email, new.phone);
+    END""",
+]
+
+#### False until the index exists , searches fall back to a LIKE scan (e.g. SQLite without trigram tokenizer) ####
+_search_index_ready = False
+
+_users_search = table("users_search", column("rowid"))
+
+
+def ensure_user_search_index(connection: Connection) -> bool:
+    """
+    Create the users search index when missing , called from init_db.
+    Runs in a savepoint so a missing extension / tokenizer does not abort startup.
+    """
+    global _search_index_ready
+    dialect = connection.dialect.name
+    try:
+        with connection.begin_nested():
+            if dialect == "postgresql":
+                for statement in POSTGRESQL_SEARCH_DDL:
+                    connection.execute(text(statement))
+            elif dialect == "sqlite":
+                existed = connection.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users_search'")
+                ).first()
+                for statement in SQLITE_SEARCH_DDL:
+                    connection.execute(text(statement))
+                if not existed:
+                    connection.execute(text("INSERT INTO users_search(users_search) VALUES ('rebuild')"))
+            else:
+                return False
+    except DBAPIError as e:
+        logger.warning(f"User search index unavailable , searching without it: {str(e)}")
+        _search_index_ready = False
+        return False
+
+    _search_index_ready = True
+    return True
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def apply_user_search(stmt: Select, term: str, dialect: str) -> Select:
+    """
+    Filter a users SELECT by term (username , email or phone) and order it by relevance :
+    exact username , username prefix , email prefix , then the index score.
+    """
+    lowered = term.lower()
+    prefix = f"{_escape_like(term)}%"
+    boost = case(
+        (func.lower(User.username) == lowered, 3),
+        (User.username.ilike(prefix, escape="\\"), 2),
+        (User.email.ilike(prefix, escape="\\"), 1),
+        else_=0
+    )
+
+    if len(term) < TRIGRAM_MIN_LENGTH and dialect == "sqlite" and _search_index_ready:
+        #### ranges on the NOCASE indexes , a LIKE on lower() would scan ####
+        upper = lowered + "\U0010ffff"
+        return stmt.where(
+            or_(
+                User.username.collate("NOCASE").between(lowered, upper),
+                User.email.collate("NOCASE").between(lowered, upper)
+            )
+        ).order_by(boost.desc(), User.username, User.id)
+
+    if len(term) < TRIGRAM_MIN_LENGTH:
+        return stmt.where(
+            or_(
+                User.username.ilike(prefix, escape="\\"),
+                User.email.ilike(prefix, escape="\\"),
+                User.phone.like(prefix, escape="\\")
+            )
+        ).order_by(boost.desc(), User.username, User.id)
+
+    if dialect == "sqlite" and _search_index_ready:
+        match_query = '"' + term.replace('"', '""') + '"'
+        score = func.bm25(literal_column("users_search"), 10.0, 5.0, 1.0)
+        return stmt.join(
+            _users_search, _users_search.c.rowid == User.id
+        ).where(
+            literal_column("users_search").op("MATCH")(match_query)
+        ).order_by(boost.desc(), score, User.id)
+
+    pattern = f"%{_escape_like(term)}%"
+    stmt = stmt.where(
+        or_(
+            User.username.ilike(pattern, escape="\\"),
+            User.email.ilike(pattern, escape="\\"),
+            User.phone.ilike(pattern, escape="\\")
+        )
+    )
+    if dialect == "postgresql" and _search_index_ready:
+        similarity = func.greatest(func.similarity(User.username, term), func.similarity(User.email, term))
+        return stmt.order_by(boost.desc(), similarity.desc(), User.id)
+    return stmt.order_by(boost.desc(), User.id)
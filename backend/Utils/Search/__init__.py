@@ -0,0 +1 @@
+### User Search __init__.py file ###
\ No newline at end of file
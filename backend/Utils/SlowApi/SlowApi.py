@@ -1,5 +1,109 @@
+import os
+import logging
+from typing import Dict
+
+from dotenv import load_dotenv
+from limits import parse_many
 from slowapi import Limiter
 from slowapi.util import get_remote_address
+from starlette.requests import Request
+
+from Utils.Auth.JWT import peek_verified_access_token
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+#### memory:// counts per process , a shared storage counts across workers / hosts ####
+#### (redis://host:6379 needs the redis package , memcached:// pymemcache , mongodb:// pymongo) ####
+RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
+#### sliding-window-counter , moving-window (exact , more storage) or fixed-window ####
+RATE_LIMIT_STRATEGY = os.getenv("RATE_LIMIT_STRATEGY", "sliding-window-counter")
+#### number of reverse proxies in front of the app , their X-Forwarded-For entries are trusted ####
+#### 0 keys clients by the socket address (a client can send any X-Forwarded-For it likes) ####
+RATE_LIMIT_TRUSTED_PROXIES = int(os.getenv("RATE_LIMIT_TRUSTED_PROXIES", 0))
+#### limit of routes without their own limit , e.g. 300/minute (empty = none) ####
+RATE_LIMIT_DEFAULT = os.getenv("RATE_LIMIT_DEFAULT", "")
+#### per route overrides , e.g. users.login=20/minute;orders.create=5/minute ####
+RATE_LIMIT_ROUTES = os.getenv("RATE_LIMIT_ROUTES", "")
+
+
+#### Limits of the rate limited routes , name -> limit (overridable with RATE_LIMIT_ROUTES) ####
+ROUTE_LIMITS: Dict[str, str] = {
+    "users.register": "5/minute",
+    "users.login": "10/minute",
+    "users.refresh": "20/minute",
+    "cart.add_item": "30/minute",
+    "orders.create": "10/minute",
+    "payments.create": "5/minute",
+    "favourites.add": "20/minute",
+    "products.create": "10/minute",
+    "tables.create": "10/minute",
+    "reservations.create": "5/minute",
+    "comments.create": "10/minute",
+    "contact.send": "5/minute",
+}
+
+
+def _apply_route_overrides(overrides: str) -> None:
+    """ name=limit pairs separated by ; , unknown names and invalid limits stop startup """
+    for pair in filter(None, (part.strip() for part in overrides.split(";"))):
+        name, _, value = pair.partition("=")
+        name, value = name.strip(), value.strip()
+        if name not in ROUTE_LIMITS:
+            raise ValueError(f"RATE_LIMIT_ROUTES: unknown route '{name}' , expected one of {', '.join(ROUTE_LIMITS)}")
+        parse_many(value)
+        ROUTE_LIMITS[name] = value
+
+
+_apply_route_overrides(RATE_LIMIT_ROUTES)
+
+
+def route_limit(name: str) -> str:
+    """ Configured limit of a route , used as @limiter.limit(route_limit("users.login")) """
+    return ROUTE_LIMITS[name]
+
+
+def get_client_ip(request: Request) -> str:
+    """
+    Address of the client. Behind RATE_LIMIT_TRUSTED_PROXIES proxies the client is the entry
+    that many hops from the right of X-Forwarded-For (entries further left can be forged).
+    """
+    if RATE_LIMIT_TRUSTED_PROXIES > 0:
+        forwarded_for = request.headers.get("x-forwarded-for")
+        if forwarded_for:
+            hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+            if hops:
+                return hops[-min(RATE_LIMIT_TRUSTED_PROXIES, len(hops))]
+    return get_remote_address(request)
+
+
+def rate_limit_key(request: Request) -> str:
+    """
+    Authenticated requests are counted per user (users behind one office NAT do not share a limit),
+    anonymous ones per client address. Route limits are checked after the route dependencies ,
+    so the token was already verified ; a token that was not (forged , expired) counts per address.
+    """
+    payload = peek_verified_access_token(request.headers.get("authorization", ""))
+    if payload and payload.get("sub"):
+        return f"user:{payload['sub']}"
+    return f"ip:{get_client_ip(request)}"
+
+
+def build_limiter(storage_uri: str = RATE_LIMIT_STORAGE_URI, strategy: str = RATE_LIMIT_STRATEGY) -> Limiter:
+    """
+    Limiter over the given storage. When a shared storage is unreachable the limits are
+    counted in process memory until it is back , requests are not failed because of it.
+    """
+    return Limiter(
+        key_func=rate_limit_key,
+        default_limits=[RATE_LIMIT_DEFAULT] if RATE_LIMIT_DEFAULT else [],
+        storage_uri=storage_uri,
+        strategy=strategy,
+        in_memory_fallback_enabled=not storage_uri.startswith("memory://"),
+        swallow_errors=True,
+        key_prefix="restaurant",
+    )
 
 
-limiter = Limiter(key_func=get_remote_address)
\ No newline at end of file
+limiter = build_limiter()
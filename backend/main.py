@@ -2,13 +2,15 @@ import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.responses import RedirectResponse
-from Database.Database import init_db, engine, sync_engine
+from Database.Database import init_db, engine, sync_engine, AsyncSessionLocal
 from contextlib import asynccontextmanager
 
 import os
+import asyncio
 from dotenv import load_dotenv
 
 from Utils.SlowApi.SlowApi import limiter
+from Utils.PaymentProvider.PaymentProviderClient import close_payment_provider_client
 from slowapi.middleware import SlowAPIMiddleware
 from slowapi.errors import RateLimitExceeded
 from slowapi import _rate_limit_exceeded_handler
@@ -57,6 +59,9 @@ from Routes.PRODUCT.Drink.DrinkRoutes import DrinkRouter
 from Routes.PRODUCT.Kebab.KebabRoutes import KebabRouter
 from Routes.PRODUCT.Salad.SaladRoutes import SaladRouter
 from Routes.PRODUCT.FavouriteProduct.FavouriteProductRoutes import FavouriteProductRouter
+from Routes.PRODUCT.ProductSales.ProductSalesRoutes import ProductSalesRouter
+from Routes.PRODUCT.ProductRating.ProductRatingRoutes import ProductRatingRouter
+from Routes.PRODUCT.ProductLeaderboard.ProductLeaderboardRoutes import ProductLeaderboardRouter
 from Routes.COMMENT.CommentRoutes import CommentRouter
 from Routes.CART.CartRoutes import CartRouter
 from Routes.ORDER.OrderRoutes import OrderRouter
@@ -124,8 +129,95 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             print(f" Warning: Table seeding failed: {str(e)}")
 
+    # Move old finished orders into archive tables periodically (set ARCHIVE_ORDERS=true in .env to enable)
+    archive_task = None
+    if os.getenv("ARCHIVE_ORDERS", "false").lower() == "true":
+        print(" Starting order archive job...")
+        from Controllers.ORDER.OrderArchiveControllers import OrderArchiveControllers
+        archive_task = asyncio.create_task(OrderArchiveControllers.run_archive_job_forever())
+
+    # Give reservations made before the slot inventory existed their slot rows
+    from Controllers.RESERVATION.ReservationControllers import ReservationControllers
+    try:
+        async with AsyncSessionLocal() as session:
+            backfilled = await ReservationControllers.backfill_reservation_slots(session)
+        if backfilled:
+            print(f" Reservation slots backfilled for {backfilled} reservations.")
+    except Exception as e:
+        print(f" Warning: Reservation slot backfill failed: {str(e)}")
+
+    # Fill reservation_date of older rows and build the per day counters when missing
+    try:
+        async with AsyncSessionLocal() as session:
+            backfilled = await ReservationControllers.backfill_reservation_days(session)
+        if backfilled:
+            print(f" Reservation dates backfilled for {backfilled} reservations.")
+    except Exception as e:
+        print(f" Warning: Reservation day backfill failed: {str(e)}")
+
+    # Build product rating summaries for comments written before they existed
+    from Controllers.PRODUCT.ProductRating.ProductRatingControllers import ProductRatingControllers
+    try:
+        async with AsyncSessionLocal() as session:
+            rebuilt = await ProductRatingControllers.backfill_rating_summaries(session)
+        if rebuilt:
+            print(f" Rating summaries built for {rebuilt} products.")
+    except Exception as e:
+        print(f" Warning: Rating summary backfill failed: {str(e)}")
+
+    # Build product sales counters for orders completed before they existed
+    from Controllers.PRODUCT.ProductSales.ProductSalesControllers import ProductSalesControllers
+    try:
+        async with AsyncSessionLocal() as session:
+            rebuilt = await ProductSalesControllers.backfill_sales_counters(session)
+        if rebuilt:
+            print(f" Sales counters built for {rebuilt} products.")
+    except Exception as e:
+        print(f" Warning: Sales counter backfill failed: {str(e)}")
+
+    # Load active reservations into the in-memory conflict index and keep it fresh
+    from Controllers.RESERVATION.TableControllers import RESERVATION_CONFLICT_WINDOW
+    from Utils.ReservationIndex.ReservationIndex import load_reservation_index, refresh_reservation_index_forever
+    try:
+        indexed = await load_reservation_index(RESERVATION_CONFLICT_WINDOW)
+        print(f" Reservation index loaded ({indexed} active reservations).")
+    except Exception as e:
+        print(f" Warning: Reservation index loading failed, using database checks: {str(e)}")
+    reservation_index_task = asyncio.create_task(refresh_reservation_index_forever(RESERVATION_CONFLICT_WINDOW))
+
+    # Load revoked token ids into memory and keep them in sync with other processes
+    from Utils.Auth.TokenRevocation import load_revoked_tokens, refresh_revoked_tokens_forever
+    try:
+        revoked = await load_revoked_tokens()
+        print(f" Revoked tokens loaded ({revoked} unexpired).")
+    except Exception as e:
+        print(f" Warning: Revoked token loading failed: {str(e)}")
+    revoked_token_task = asyncio.create_task(refresh_revoked_tokens_forever())
+
+    # Apply queued payment provider webhooks in the background (PAYMENT_WEBHOOK_WORKERS=0 to disable)
+    from Controllers.PAYMENT.PaymentWebhookControllers import PaymentWebhookControllers
+    webhook_tasks = PaymentWebhookControllers.start_workers()
+
+    # Score new comments for spam / profanity in the background (COMMENT_MODERATION_ENABLED=false to disable)
+    from Controllers.COMMENT.CommentModerationControllers import CommentModerationControllers
+    moderation_task = CommentModerationControllers.start_worker()
+
     yield
 
+    if archive_task:
+        archive_task.cancel()
+
+    for task in webhook_tasks:
+        task.cancel()
+
+    reservation_index_task.cancel()
+
+    revoked_token_task.cancel()
+
+    CommentModerationControllers.stop_worker(moderation_task)
+
+    await close_payment_provider_client()
+
     print(" Shutting down Server... ")
     await engine.dispose()
     print(" Database connections closed ! ")
@@ -343,6 +435,9 @@ app.include_router(DrinkRouter, prefix="/api")
 app.include_router(KebabRouter, prefix="/api")
 app.include_router(SaladRouter, prefix="/api")
 app.include_router(FavouriteProductRouter, prefix="/api")
+app.include_router(ProductSalesRouter, prefix="/api")
+app.include_router(ProductRatingRouter, prefix="/api")
+app.include_router(ProductLeaderboardRouter, prefix="/api")
 app.include_router(CommentRouter, prefix="/api")
 app.include_router(CartRouter, prefix="/api")
 app.include_router(OrderRouter, prefix="/api")
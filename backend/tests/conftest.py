@@ -0,0 +1,29 @@
+import os
+import sys
+import asyncio
+import tempfile
+
+import pytest
+
+#### tests run against a throwaway SQLite database , never E-Commerce.db ####
+_TEST_DB_DIR = tempfile.mkdtemp(prefix="restaurant-tests-")
+os.environ["ENVIRONMENT"] = "TEST"
+os.environ["SUPABASE_CONNECTION_URL"] = f"sqlite+aiosqlite:///{os.path.join(_TEST_DB_DIR, 'test.db')}"
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Database.Database import Base, engine, init_db
+import Models  # noqa: F401  registers every model on Base.metadata
+
+
+@pytest.fixture
+def fresh_db():
+    """ Empty tables for one test """
+    async def reset():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.drop_all)
+        await init_db()
+
+    asyncio.run(reset())
+    yield
+    asyncio.run(engine.dispose())
@@ -0,0 +1,66 @@
+import base64
+import asyncio
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+
+from Database.Database import AsyncSessionLocal
+from Models import User, Comment, Kebab
+from Controllers.COMMENT.CommentControllers import CommentControllers
+from Utils.Enums.Enums import MeatType
+
+
+async def _seed_comments(count: int) -> int:
+    """ count comments on one product , inserted within the same second (database created_at) """
+    async with AsyncSessionLocal() as db:
+        user = User(username="reviewer", email="reviewer@example.com", hashed_password="x")
+        product = Kebab(name="Adana", description="d", image_url="i", price=Decimal("10"), meat_type=MeatType.BEEF)
+        db.add_all([user, product])
+        await db.flush()
+        db.add_all([
+            Comment(user_id=user.id, product_id=product.id, content=f"comment {index}", rating=5)
+            for index in range(count)
+        ])
+        await db.commit()
+        return product.id
+
+
+async def _walk_feed(product_id: int, limit: int, max_pages: int = 20):
+    """ Page ids until has_more is False , a cursor that does not advance stops at max_pages """
+    pages = []
+    cursor = None
+    async with AsyncSessionLocal() as db:
+        while len(pages) < max_pages:
+            page = await CommentControllers.get_product_comment_feed(product_id, cursor, limit, False, db)
+            pages.append([comment["id"] for comment in page["comments"]])
+            if not page["has_more"]:
+                return pages
+            cursor = page["next_cursor"]
+    return pages
+
+
+def test_feed_walks_every_comment_once_newest_first(fresh_db):
+    async def run():
+        product_id = await _seed_comments(5)
+        return await _walk_feed(product_id, limit=2)
+
+    pages = asyncio.run(run())
+    ids = [comment_id for page in pages for comment_id in page]
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert ids == sorted(ids, reverse=True)
+    assert len(set(ids)) == 5
+
+
+def test_feed_rejects_cursor_that_is_not_an_id(fresh_db):
+    async def run():
+        product_id = await _seed_comments(3)
+        cursor = base64.urlsafe_b64encode(b"2024-01-01T00:00:00|1").decode()
+        async with AsyncSessionLocal() as db:
+            await CommentControllers.get_product_comment_feed(product_id, cursor, 10, False, db)
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(run())
+
+    assert error.value.status_code == 400
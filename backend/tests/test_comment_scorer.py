@@ -0,0 +1,39 @@
+import pytest
+
+from Utils.Moderation.CommentScorer import score_comment
+
+#### COMMENT_MODERATION_FLAG_THRESHOLD default ####
+FLAG_THRESHOLD = 0.5
+
+
+@pytest.mark.parametrize("text", [
+    "Great pic of the kebab!",
+    "Dick and I loved the doner, best pic ever",
+    "I bet you will love it, free dessert if you click order",
+    "Best kebab in town, free delivery and the bonus baklava was great!",
+    "Waited 40 minutes for a cold lahmacun, not coming back.",
+    "Harika bir döner, ayran da çok taze. Teşekkürler!",
+    "Ordered the mixed grill for the office, everyone was happy :)",
+])
+def test_benign_reviews_are_not_flagged(text):
+    score, reasons = score_comment(text)
+
+    assert score < FLAG_THRESHOLD, reasons
+
+
+@pytest.mark.parametrize("text", [
+    "fuck this shit",
+    "sh1t food",
+    "Seni piç kurusu",
+    "Free bitcoin! click www.win.xyz",
+    "Write me on whatsapp +90 555 123 45 67 free bonus",
+])
+def test_profanity_and_spam_are_flagged(text):
+    score, reasons = score_comment(text)
+
+    assert score >= FLAG_THRESHOLD, reasons
+
+
+def test_ordinary_words_alone_are_not_spam():
+    assert score_comment("free dessert , click to order")[0] == 0.0
+    assert score_comment("free dessert at www.example-restaurant.com")[0] > score_comment("free dessert")[0]
@@ -0,0 +1,42 @@
+import asyncio
+import time
+import uuid
+
+import pytest
+from jose import jwt
+
+from Utils.Auth.JWT import (
+    ALGORITHM, AUDIENCE, ISSUER, SECRET_KEY, TokenInvalidError,
+    decode_access_token, decode_refresh_token, verified_token_cache
+)
+
+
+def _signed(token_type: str, **claims) -> str:
+    now = int(time.time())
+    payload = {
+        "sub": "claims", "jti": str(uuid.uuid4()), "iat": now, "nbf": now, "exp": now + 600,
+        "iss": ISSUER, "aud": AUDIENCE, "token_type": token_type, **claims
+    }
+    return jwt.encode({key: value for key, value in payload.items() if value is not None}, SECRET_KEY, algorithm=ALGORITHM)
+
+
+@pytest.mark.parametrize("missing", ["sub", "jti", "iat"])
+@pytest.mark.parametrize("token_type, decode", [("access", decode_access_token), ("refresh", decode_refresh_token)])
+def test_signed_token_without_a_required_claim_is_rejected(missing, token_type, decode):
+    verified_token_cache.clear()
+    with pytest.raises(TokenInvalidError):
+        asyncio.run(decode(_signed(token_type, **{missing: None})))
+
+
+def test_access_token_with_a_non_string_jti_is_not_cached():
+    verified_token_cache.clear()
+    with pytest.raises(TokenInvalidError):
+        asyncio.run(decode_access_token(_signed("access", jti=42)))
+    assert len(verified_token_cache) == 0
+
+
+def test_valid_access_token_is_cached():
+    verified_token_cache.clear()
+    payload = asyncio.run(decode_access_token(_signed("access")))
+    assert payload["sub"] == "claims"
+    assert len(verified_token_cache) == 1
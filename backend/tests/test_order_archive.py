@@ -0,0 +1,115 @@
+import asyncio
+from decimal import Decimal
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, text
+
+from Database.Database import AsyncSessionLocal, engine
+from Models import User, Kebab, Order, OrderItem, ArchivedOrder, ArchivedOrderItem, Payment
+from Models.PAYMENT.PaymentModel import payment_orders
+from Controllers.ORDER.OrderArchiveControllers import OrderArchiveControllers
+from Controllers.PAYMENT.PaymentControllers import PaymentControllers
+from Controllers.USER.UserControllers import UserControllers
+from Utils.Enums.Enums import MeatType, OrderStatus
+
+
+async def _use_legacy_order_tables():
+    """ Recreate orders / order_items without AUTOINCREMENT , like databases created before it was set """
+    async with engine.begin() as connection:
+        await connection.execute(text("PRAGMA foreign_keys = OFF"))
+        for name in ("order_items", "orders"):
+            ddl = (await connection.execute(
+                text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": name}
+            )).scalar_one()
+            await connection.execute(text(f"DROP TABLE {name}"))
+            await connection.execute(text(ddl.replace(" AUTOINCREMENT", "")))
+        await connection.execute(text("PRAGMA foreign_keys = ON"))
+
+
+async def _seed_orders(statuses):
+    """ One order with one item per status , all old enough to archive """
+    async with AsyncSessionLocal() as db:
+        user = User(username="buyer", email="buyer@example.com", hashed_password="x")
+        product = Kebab(name="Adana", description="d", image_url="i", price=Decimal("10"), meat_type=MeatType.BEEF)
+        db.add_all([user, product])
+        await db.flush()
+        created_at = datetime.utcnow() - timedelta(days=400)
+        for order_status in statuses:
+            order = Order(user_id=user.id, status=order_status, total_amount=Decimal("10"), created_at=created_at)
+            db.add(order)
+            await db.flush()
+            db.add(OrderItem(
+                order_id=order.id, product_id=product.id, quantity=1, unit_price=Decimal("10"), subtotal=Decimal("10")
+            ))
+        await db.commit()
+        return user.id, product.id
+
+
+async def _archive_then_order(statuses):
+    user_id, product_id = await _seed_orders(statuses)
+    async with AsyncSessionLocal() as db:
+        await OrderArchiveControllers.archive_orders(db, older_than_days=30, batch_size=10)
+
+        order = Order(user_id=user_id, status=OrderStatus.PENDING, total_amount=Decimal("10"))
+        db.add(order)
+        await db.flush()
+        item = OrderItem(order_id=order.id, product_id=product_id, quantity=1, unit_price=Decimal("10"), subtotal=Decimal("10"))
+        db.add(item)
+        await db.commit()
+
+        archived_order_ids = set((await db.execute(select(ArchivedOrder.id))).scalars())
+        archived_item_ids = set((await db.execute(select(ArchivedOrderItem.id))).scalars())
+        return order.id, item.id, archived_order_ids, archived_item_ids
+
+
+def test_new_order_ids_do_not_reuse_archived_ids_on_legacy_tables(fresh_db):
+    asyncio.run(_use_legacy_order_tables())
+    order_id, item_id, archived_order_ids, archived_item_ids = asyncio.run(
+        _archive_then_order([OrderStatus.COMPLETED, OrderStatus.CANCELLED, OrderStatus.COMPLETED])
+    )
+
+    #### the newest order stays hot so the next id is still above every archived one ####
+    assert archived_order_ids == {1, 2}
+    assert order_id not in archived_order_ids
+    assert item_id not in archived_item_ids
+
+
+def test_every_finished_order_is_archived_with_autoincrement(fresh_db):
+    _, _, archived_order_ids, _ = asyncio.run(
+        _archive_then_order([OrderStatus.COMPLETED, OrderStatus.CANCELLED, OrderStatus.COMPLETED])
+    )
+
+    assert archived_order_ids == {1, 2, 3}
+
+
+async def _archive_paid_orders():
+    """ Two paid orders , the older one archived , returns (user_id, payment_id) """
+    user_id, _ = await _seed_orders([OrderStatus.COMPLETED, OrderStatus.COMPLETED])
+    async with AsyncSessionLocal() as db:
+        payment = Payment(user_id=user_id, amount=Decimal("20"))
+        db.add(payment)
+        await db.flush()
+        await db.execute(payment_orders.insert().values([
+            {"payment_id": payment.id, "order_id": order_id} for order_id in (1, 2)
+        ]))
+        await db.execute(text("UPDATE orders SET created_at = :recent WHERE id = 2"), {"recent": datetime.utcnow()})
+        await db.commit()
+        await OrderArchiveControllers.archive_orders(db, older_than_days=30, batch_size=10)
+        return user_id, payment.id
+
+
+async def _read_archived_orders():
+    user_id, payment_id = await _archive_paid_orders()
+    async with AsyncSessionLocal() as db:
+        payment = await PaymentControllers.admin_get_payment_by_id(payment_id, db)
+        user_payments = await PaymentControllers.admin_get_user_payments(user_id, 0, 10, db)
+        orders = await UserControllers.get_user_orders(user_id, db)
+        return payment, user_payments, orders
+
+
+def test_read_paths_include_archived_orders(fresh_db):
+    payment, user_payments, orders = asyncio.run(_read_archived_orders())
+
+    assert payment["order_ids"] == [1, 2]
+    assert user_payments["payments"][0]["order_ids"] == [1, 2]
+    assert [order["id"] for order in orders] == [2, 1]
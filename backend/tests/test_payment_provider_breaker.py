@@ -0,0 +1,49 @@
+import asyncio
+
+import httpx
+import pytest
+
+from Utils.PaymentProvider.PaymentProviderClient import (
+    CircuitBreaker,
+    PaymentProviderClient,
+    PaymentProviderUnavailableError,
+)
+
+
+def _client(handler) -> PaymentProviderClient:
+    client = PaymentProviderClient(base_url="http://provider.test", max_retries=0, breaker=CircuitBreaker(1, 0))
+    client._http = httpx.AsyncClient(base_url="http://provider.test", transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_cancelled_half_open_trial_lets_the_next_call_through():
+    answer_slowly = True
+
+    async def handler(request):
+        if answer_slowly:
+            await asyncio.sleep(10)
+        return httpx.Response(200, json={"status": "success"})
+
+    async def run():
+        nonlocal answer_slowly
+        client = _client(handler)
+        client.breaker.record_failure()
+        assert client.breaker.state == CircuitBreaker.OPEN
+
+        trial = asyncio.create_task(client.retrieve_checkout("t", timeout=30))
+        await asyncio.sleep(0.05)
+        with pytest.raises(PaymentProviderUnavailableError):
+            await client.retrieve_checkout("t")
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+        answer_slowly = False
+        result = await client.retrieve_checkout("t")
+        await client.aclose()
+        return result, client.breaker.state
+
+    result, state = asyncio.run(run())
+
+    assert result["status"] == "success"
+    assert state == CircuitBreaker.CLOSED
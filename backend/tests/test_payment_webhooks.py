@@ -0,0 +1,63 @@
+import asyncio
+from decimal import Decimal
+
+from sqlalchemy import select
+
+from Database.Database import AsyncSessionLocal
+from Models import User, Payment, PaymentWebhookEvent
+from Controllers.PAYMENT import PaymentWebhookControllers as webhook_module
+from Controllers.PAYMENT.PaymentWebhookControllers import PaymentWebhookControllers
+from Controllers.PAYMENT.PaymentControllers import PaymentControllers
+from Utils.Enums.Enums import PaymentStatus
+
+
+async def _seed(tokens):
+    async with AsyncSessionLocal() as db:
+        user = User(username="payer", email="payer@example.com", hashed_password="x")
+        db.add(user)
+        await db.flush()
+        for token in tokens:
+            db.add(Payment(user_id=user.id, amount=Decimal("10.00"), provider_payment_token=token))
+            db.add(PaymentWebhookEvent(provider_payment_id=f"pay-{token}", event_status="SUCCESS", token=token))
+        await db.commit()
+
+
+async def _state():
+    async with AsyncSessionLocal() as db:
+        payments = {payment.provider_payment_token: payment.status for payment in (await db.execute(select(Payment))).scalars()}
+        events = {event.token: (event.result, event.attempts) for event in (await db.execute(select(PaymentWebhookEvent))).scalars()}
+        return payments, events
+
+
+def test_failing_event_does_not_roll_back_its_batch_and_gives_up_after_max_attempts(fresh_db, monkeypatch):
+    apply_completion = PaymentControllers._apply_payment_completion
+
+    async def failing_completion(payment, db):
+        if payment.provider_payment_token == "broken":
+            raise RuntimeError("order update failed")
+        await apply_completion(payment, db)
+
+    monkeypatch.setattr(PaymentControllers, "_apply_payment_completion", staticmethod(failing_completion))
+    monkeypatch.setattr(webhook_module, "PAYMENT_WEBHOOK_MAX_ATTEMPTS", 2)
+    monkeypatch.setattr(webhook_module, "PAYMENT_WEBHOOK_CLAIM_TIMEOUT_SECONDS", 0)
+
+    async def run():
+        await _seed(["ok-1", "broken", "ok-2"])
+        async with AsyncSessionLocal() as db:
+            await PaymentWebhookControllers.process_batch("worker", db)
+        after_first = await _state()
+        await asyncio.sleep(0.01)
+        async with AsyncSessionLocal() as db:
+            await PaymentWebhookControllers.process_batch("worker", db)
+        return after_first, await _state()
+
+    (payments, events), (final_payments, final_events) = asyncio.run(run())
+
+    assert payments["ok-1"] == PaymentStatus.COMPLETED
+    assert payments["ok-2"] == PaymentStatus.COMPLETED
+    assert payments["broken"] == PaymentStatus.PENDING
+    assert events["ok-1"] == ("applied", 1)
+    assert events["broken"] == (None, 1)
+
+    assert final_payments["broken"] == PaymentStatus.PENDING
+    assert final_events["broken"] == ("error: order update failed", 2)
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from Database.Database import AsyncSessionLocal
+from Models import User
+from Controllers.USER.UserControllers import UserControllers
+from Utils.Auth import TokenRevocation
+from Utils.Auth.JWT import create_refresh_token
+
+
+async def _login() -> str:
+    async with AsyncSessionLocal() as db:
+        db.add(User(username="sessions", email="sessions@example.com", hashed_password="x"))
+        await db.commit()
+    return create_refresh_token(data={"sub": "sessions", "role": "user"})
+
+
+async def _refresh(refresh_token: str):
+    async with AsyncSessionLocal() as db:
+        return await UserControllers.refresh_token(refresh_token, db)
+
+
+async def _current_user(access_token: str):
+    async with AsyncSessionLocal() as db:
+        return await UserControllers.get_current_user(access_token, db)
+
+
+def test_parallel_refreshes_get_the_same_successor(fresh_db):
+    refresh_token = asyncio.run(_login())
+
+    first = asyncio.run(_refresh(refresh_token))
+    second = asyncio.run(_refresh(refresh_token))
+
+    assert second["refresh_token"] == first["refresh_token"]
+    assert asyncio.run(_current_user(second["access_token"])).username == "sessions"
+    assert asyncio.run(_refresh(first["refresh_token"]))["refresh_token"] != first["refresh_token"]
+
+
+def test_reuse_seen_only_by_the_database_gets_the_same_successor(fresh_db):
+    refresh_token = asyncio.run(_login())
+
+    first = asyncio.run(_refresh(refresh_token))
+    #### another process rotated it : the jti is not in this process' revoked set yet ####
+    TokenRevocation.revoked_tokens._expires.clear()
+    second = asyncio.run(_refresh(refresh_token))
+
+    assert second["refresh_token"] == first["refresh_token"]
+
+
+def test_reuse_after_the_grace_period_ends_the_rotated_session(fresh_db, monkeypatch):
+    refresh_token = asyncio.run(_login())
+    rotated = asyncio.run(_refresh(refresh_token))
+
+    monkeypatch.setattr(TokenRevocation, "REFRESH_TOKEN_REUSE_GRACE_SECONDS", -1)
+    with pytest.raises(HTTPException) as reused:
+        asyncio.run(_refresh(refresh_token))
+    assert reused.value.status_code == 401
+
+    #### the pair handed out by the first rotation was issued in the same second , it ends too ####
+    with pytest.raises(HTTPException) as access:
+        asyncio.run(_current_user(rotated["access_token"]))
+    assert access.value.status_code == 401
+    with pytest.raises(HTTPException):
+        asyncio.run(_refresh(rotated["refresh_token"]))
@@ -0,0 +1,76 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from Database.Database import AsyncSessionLocal
+from Models import Reservation
+from Utils.Enums.Enums import ReservationStatus
+from Utils.ReservationIndex.ReservationIndex import ReservationIntervalIndex
+from Controllers.RESERVATION import ReservationControllers as reservation_controllers
+from Controllers.RESERVATION.ReservationControllers import ReservationControllers
+
+
+class _SessionSyncingDuringRead:
+    """ Session whose snapshot read is followed by a sync , like a booking committed mid-load """
+
+    def __init__(self, session, index, reservation):
+        self._session = session
+        self._index = index
+        self._reservation = reservation
+
+    async def execute(self, stmt):
+        result = await self._session.execute(stmt)
+        self._index.sync(self._reservation)
+        return result
+
+
+def _reservation(reservation_id, reservation_status, reservation_time):
+    return Reservation(
+        id=reservation_id, user_id=1, table_id=7, reservation_time=reservation_time,
+        number_of_guests=2, status=reservation_status
+    )
+
+
+async def _load_while_syncing(index, reservation, horizon):
+    async with AsyncSessionLocal() as session:
+        await index.load(_SessionSyncingDuringRead(session, index, reservation), horizon)
+
+
+def test_sync_during_load_is_kept_after_the_swap(fresh_db):
+    index = ReservationIntervalIndex()
+    now = datetime.utcnow()
+    booked = _reservation(41, ReservationStatus.PENDING, now + timedelta(hours=2))
+
+    asyncio.run(_load_while_syncing(index, booked, now - timedelta(hours=3)))
+
+    assert index.has_conflict(7, now + timedelta(hours=1), now + timedelta(hours=3))
+    assert len(index) == 1
+
+
+def test_cancellation_during_load_is_kept_after_the_swap(fresh_db):
+    index = ReservationIntervalIndex()
+    now = datetime.utcnow()
+    horizon = now - timedelta(hours=3)
+    booked = _reservation(41, ReservationStatus.PENDING, now + timedelta(hours=2))
+    asyncio.run(_load_while_syncing(index, booked, horizon))
+
+    cancelled = _reservation(41, ReservationStatus.CANCELLED, booked.reservation_time)
+    asyncio.run(_load_while_syncing(index, cancelled, horizon))
+
+    assert not index.has_conflict(7, now + timedelta(hours=1), now + timedelta(hours=3))
+    assert len(index) == 0
+
+
+async def _available_with_stale_index(index, now):
+    """ The index still holds a reservation another process cancelled , the database has none """
+    async with AsyncSessionLocal() as session:
+        await index.load(session, now - timedelta(hours=3))
+    index.sync(_reservation(41, ReservationStatus.PENDING, now + timedelta(hours=2)))
+    async with AsyncSessionLocal() as db:
+        return await ReservationControllers._check_time_slot_availability(7, now + timedelta(hours=2), db)
+
+
+def test_index_hit_is_confirmed_against_the_database(fresh_db, monkeypatch):
+    index = ReservationIntervalIndex()
+    monkeypatch.setattr(reservation_controllers, "reservation_index", index)
+
+    assert asyncio.run(_available_with_stale_index(index, datetime.utcnow()))
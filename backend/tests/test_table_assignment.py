@@ -0,0 +1,46 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException, status
+
+from Database.Database import AsyncSessionLocal
+from Models import User, Table
+from Schemas.RESERVATION.ReservationSchemas import PartyRequest
+from Controllers.RESERVATION.ReservationControllers import ReservationControllers, SLOT_TAKEN_DETAIL
+from Controllers.RESERVATION.TableAssignmentControllers import TableAssignmentControllers, AUTO_ASSIGN_ATTEMPTS
+
+
+async def _book_with(monkeypatch, detail: str):
+    """ book_best_table over four free tables while every booking attempt fails with a 400 detail """
+    attempts = []
+
+    async def failing_booking(current_user, reservation_data, db):
+        attempts.append(reservation_data.table_id)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+    monkeypatch.setattr(ReservationControllers, "create_new_reservation", failing_booking)
+    async with AsyncSessionLocal() as db:
+        user = User(username="host", email="host@example.com", hashed_password="x")
+        db.add(user)
+        db.add_all([Table(table_number=f"T{number}", capacity=4) for number in range(4)])
+        await db.commit()
+        party = PartyRequest(reservation_time=datetime.utcnow() + timedelta(days=1), number_of_guests=2)
+        try:
+            await TableAssignmentControllers.book_best_table(user, party, db)
+        except HTTPException as e:
+            return e, attempts
+
+
+def test_taken_slot_tries_the_next_tables_then_conflicts(fresh_db, monkeypatch):
+    error, attempts = asyncio.run(_book_with(monkeypatch, SLOT_TAKEN_DETAIL))
+
+    assert len(attempts) == AUTO_ASSIGN_ATTEMPTS
+    assert error.status_code == status.HTTP_409_CONFLICT
+
+
+def test_validation_error_is_raised_unchanged(fresh_db, monkeypatch):
+    error, attempts = asyncio.run(_book_with(monkeypatch, "Table is not available"))
+
+    assert len(attempts) == 1
+    assert error.status_code == status.HTTP_400_BAD_REQUEST
+    assert error.detail == "Table is not available"
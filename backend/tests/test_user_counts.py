@@ -0,0 +1,73 @@
+import asyncio
+from decimal import Decimal
+from datetime import datetime, timedelta
+
+from Database.Database import AsyncSessionLocal
+from sqlalchemy import select
+
+from Models import User, Order
+from Controllers.ORDER.OrderArchiveControllers import OrderArchiveControllers
+from Controllers.USER.UserControllers import UserControllers
+from Utils.Enums.Enums import OrderStatus
+
+
+async def _user_with_archived_orders() -> int:
+    """ Three old completed orders and one pending order , the old ones except the newest archived """
+    async with AsyncSessionLocal() as db:
+        user = User(username="regular", email="regular@example.com", hashed_password="x")
+        db.add(user)
+        await db.flush()
+        old = datetime.utcnow() - timedelta(days=400)
+        db.add_all([
+            Order(user_id=user.id, status=OrderStatus.COMPLETED, total_amount=Decimal("10"), created_at=old)
+            for _ in range(3)
+        ])
+        db.add(Order(user_id=user.id, status=OrderStatus.PENDING, total_amount=Decimal("10")))
+        await db.commit()
+        await OrderArchiveControllers.archive_orders(db, older_than_days=30, batch_size=10)
+        return user.id
+
+
+async def _listing_and_activity():
+    user_id = await _user_with_archived_orders()
+    async with AsyncSessionLocal() as db:
+        listing = await UserControllers.get_user_listing(user_id, db)
+        activity = await UserControllers.get_user_activity_log(user_id, db)
+        return listing, activity
+
+
+def test_listing_and_activity_count_archived_orders(fresh_db):
+    listing, activity = asyncio.run(_listing_and_activity())
+
+    assert listing["orders_count"] == 4
+    assert activity["total_orders"] == 4
+
+
+async def _profile(include: str, skip: int, limit: int):
+    user_id = await _user_with_archived_orders()
+    async with AsyncSessionLocal() as db:
+        user = (await db.execute(select(User).where(User.id == user_id))).scalar_one()
+        return await UserControllers.get_user_profile(user, db, include, skip, limit)
+
+
+def test_profile_counts_and_pages_archived_orders(fresh_db):
+    profile = asyncio.run(_profile("orders", 0, 3))
+
+    assert profile["orders_count"] == 4
+    assert profile["orders"] == [4, 3, 2]
+
+
+def test_profile_orders_without_archive(fresh_db):
+    async def hot_only():
+        async with AsyncSessionLocal() as db:
+            user = User(username="fresh", email="fresh@example.com", hashed_password="x")
+            db.add(user)
+            await db.flush()
+            db.add(Order(user_id=user.id, status=OrderStatus.PENDING, total_amount=Decimal("10")))
+            await db.commit()
+            return await UserControllers.get_user_profile(user, db, "orders", 0, 10)
+
+    profile = asyncio.run(hot_only())
+
+    assert profile["orders_count"] == 1
+    assert profile["orders"] == [1]
@@ -1,5 +1,6 @@
 import { type AxiosInstance } from "axios";
 import axios from "axios";
+import { useAuthStore } from "../Zustand/Auth/AuthState";
 
 // axios instance \\
 export const axiosInstance: AxiosInstance = axios.create({
@@ -37,38 +38,23 @@ axiosInstance.interceptors.response.use(
     if (error.response?.status === 401 && !originalRequest._retry) {
       originalRequest._retry = true;
 
-      const authData = localStorage.getItem("auth-storage");
-      if (authData) {
-        try {
-          const { state } = JSON.parse(authData);
-          if (state?.refreshToken) {
-            // refresh token \\
-            const refreshResponse = await axios.post(
-              `${import.meta.env.VITE_API_URL}/users/refresh`,
-              { refresh_token: state.refreshToken },
-            );
-
-            const { access_token, refresh_token } = refreshResponse.data;
-
-            const updatedState = {
-              ...state,
-              accessToken: access_token,
-              refreshToken: refresh_token || state.refreshToken,
-            };
-
-            localStorage.setItem(
-              "auth-storage",
-              JSON.stringify({ state: updatedState }),
-            );
-
-            originalRequest.headers.Authorization = `Bearer ${access_token}`;
-            return axiosInstance(originalRequest);
-          }
-        } catch (refreshError) {
-          console.error("Token refresh failed:", refreshError);
-          localStorage.removeItem("auth-storage");
-          window.location.href = "/login";
+      const { accessToken, refreshToken, refreshAccessToken } =
+        useAuthStore.getState();
+      if (refreshToken) {
+        // another request refreshed the token after this one was sent , retry with it \\
+        const refreshedMeanwhile =
+          accessToken &&
+          originalRequest.headers.Authorization !== `Bearer ${accessToken}`;
+
+        // refresh token , parallel 401s share one refresh \\
+        if (refreshedMeanwhile || (await refreshAccessToken())) {
+          originalRequest.headers.Authorization = `Bearer ${useAuthStore.getState().accessToken}`;
+          return axiosInstance(originalRequest);
         }
+
+        console.error("Token refresh failed");
+        localStorage.removeItem("auth-storage");
+        window.location.href = "/login";
       }
     }
 
@@ -297,7 +297,7 @@ const Profile = () => {
                 <div className="space-y-4">
                   <div className="text-center">
                     <div className="text-3xl font-bold text-blue-600">
-                      {userProfile.orders.length}
+                      {userProfile.orders_count}
                     </div>
                     <p className="text-sm text-gray-600">Total Orders</p>
                   </div>
@@ -306,7 +306,7 @@ const Profile = () => {
 
                   <div className="text-center">
                     <div className="text-3xl font-bold text-green-600">
-                      {userProfile.reservations.length}
+                      {userProfile.reservations_count}
                     </div>
                     <p className="text-sm text-gray-600">Reservations</p>
                   </div>
@@ -315,7 +315,7 @@ const Profile = () => {
 
                   <div className="text-center">
                     <div className="text-3xl font-bold text-purple-600">
-                      {userProfile.favourite_products.length}
+                      {userProfile.favourite_products_count}
                     </div>
                     <p className="text-sm text-gray-600">Favourites</p>
                   </div>
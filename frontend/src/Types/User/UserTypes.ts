@@ -97,6 +97,12 @@ interface UserProfileRead {
   role: string;
   is_active: boolean;
   created_at: string;
+  favourite_products_count: number;
+  orders_count: number;
+  comments_count: number;
+  reservations_count: number;
+  payments_count: number;
+  cart_items_count: number;
   favourite_products: number[];
   orders: number[];
   comments: number[];
@@ -217,6 +223,12 @@ export interface UserProfile {
   role: string;
   is_active: boolean;
   created_at: string;
+  favourite_products_count: number;
+  orders_count: number;
+  comments_count: number;
+  reservations_count: number;
+  payments_count: number;
+  cart_items_count: number;
   favourite_products: number[];
   orders: number[];
   comments: number[];
@@ -38,6 +38,9 @@ export interface AuthState {
   clearError: () => void;
 }
 
+// one refresh at a time , a refresh token is single use so parallel callers share the request \\
+let refreshInFlight: Promise<boolean> | null = null;
+
 export const useAuthStore = create<AuthState>()(
   persist(
     (set, get) => ({
@@ -127,38 +130,46 @@ export const useAuthStore = create<AuthState>()(
         });
       },
 
-      refreshAccessToken: async (): Promise<boolean> => {
-        const { refreshToken } = get();
-        if (!refreshToken) return false;
+      refreshAccessToken: (): Promise<boolean> => {
+        if (refreshInFlight) return refreshInFlight;
 
-        try {
-          const response = await fetch(
-            `${import.meta.env.VITE_API_URL}/users/refresh`,
-            {
-              method: "POST",
-              headers: { "Content-Type": "application/json" },
-              body: JSON.stringify({ refresh_token: refreshToken }),
+        const { refreshToken } = get();
+        if (!refreshToken) return Promise.resolve(false);
+
+        refreshInFlight = (async () => {
+          try {
+            const response = await fetch(
+              `${import.meta.env.VITE_API_URL}/users/refresh`,
+              {
+                method: "POST",
+                headers: { "Content-Type": "application/json" },
+                body: JSON.stringify({ refresh_token: refreshToken }),
+              }
+            );
+
+            if (!response.ok) {
+              throw new Error("Failed to refresh token");
             }
-          );
 
-          if (!response.ok) {
-            throw new Error("Failed to refresh token");
+            const { access_token, refresh_token } = await response.json();
+
+            set({
+              accessToken: access_token,
+              refreshToken: refresh_token || refreshToken,
+            });
+
+            return true;
+          } catch (error) {
+            // If refresh fails, log the user out \\
+            console.error("Failed to refresh access token:", error);
+            get().logout();
+            return false;
+          } finally {
+            refreshInFlight = null;
           }
+        })();
 
-          const { access_token, refresh_token } = await response.json();
-
-          set({
-            accessToken: access_token,
-            refreshToken: refresh_token || refreshToken,
-          });
-
-          return true;
-        } catch (error) {
-          // If refresh fails, log the user out \\
-          console.error("Failed to refresh access token:", error);
-          get().logout();
-          return false;
-        }
+        return refreshInFlight;
       },
 
       updateUser: (userData: Partial<User>) => {